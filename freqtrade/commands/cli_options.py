@@ -139,6 +139,46 @@ AVAILABLE_CLI_OPTIONS = {
         '--timeframe-detail',
         help='Specify detail timeframe for backtesting (`1m`, `5m`, `30m`, `1h`, `1d`).',
     ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Backtesting engine to use. `vectorized` evaluates sells on numpy arrays and '
+        'falls back to `loop` for strategies using `custom_sell()` or `custom_stoploss()` '
+        '(default: `loop`).',
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "indicator_jobs": Arg(
+        '--indicator-jobs',
+        help='The number of worker processes used to calculate indicators (one pair per job). '
+        'If -1, all CPUs are used, for -2, all CPUs but one are used, etc. (default: 1).',
+        type=int,
+        metavar='JOBS',
+    ),
+    "load_jobs": Arg(
+        '--load-jobs',
+        help='The number of pairs to load from disk in parallel. If -1, all CPUs are used, '
+        'for -2, all CPUs but one are used, etc. (default: 1).',
+        type=int,
+        metavar='JOBS',
+    ),
+    "indicator_cache": Arg(
+        '--indicator-cache',
+        help='Cache populated indicators in `user_data/indicator_cache` and reuse them in '
+        'later runs with the same strategy, parameters and data.',
+        action='store_true',
+    ),
+    "indicator_cache_clear": Arg(
+        '--clear',
+        help='Remove all cached indicators.',
+        action='store_true',
+    ),
+    "backtest_jobs": Arg(
+        '--backtest-jobs',
+        help='The number of strategies from `--strategy-list` to backtest in parallel '
+        '(worker processes). If -1, all CPUs are used, for -2, all CPUs but one are used, etc. '
+        '(default: 1).',
+        type=int,
+        metavar='JOBS',
+    ),
     "position_stacking": Arg(
         '--eps', '--enable-position-stacking',
         help='Allow buying the same pair multiple times (position stacking).',
@@ -274,6 +314,13 @@ AVAILABLE_CLI_OPTIONS = {
         metavar='JOBS',
         default=-1,
     ),
+    "hyperopt_scheduler": Arg(
+        '--hyperopt-scheduler',
+        help='Scheduling of hyperopt epochs. `batch` evaluates batches of epochs (one per job) '
+        'at once, `async` starts a new epoch as soon as a worker finishes '
+        '(default: `batch`).',
+        choices=constants.HYPEROPT_SCHEDULERS,
+    ),
     "hyperopt_random_state": Arg(
         '--random-state',
         help='Set random state to some positive integer for reproducible hyperopt results.',
@@ -384,6 +431,13 @@ AVAILABLE_CLI_OPTIONS = {
              'desired timeframe as specified as --timeframes/-t.',
         action='store_true',
     ),
+    "download_jobs": Arg(
+        '--dl-jobs',
+        help='Number of pair / timeframe combinations to download concurrently. '
+             'Requests are still limited by the exchange rate limit. (default: 1).',
+        type=check_int_positive,
+        metavar='INT',
+    ),
     "format_from": Arg(
         '--format-from',
         help='Source format for data conversion.',
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Dict
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
 
 from freqtrade import constants
 from freqtrade.configuration import setup_utils_configuration
@@ -128,3 +129,39 @@ def start_edge(args: Dict[str, Any]) -> None:
     # Initialize Edge object
     edge_cli = EdgeCli(config)
     edge_cli.start()
+
+
+def start_indicator_cache(args: Dict[str, Any]) -> None:
+    """
+    Show or clear the indicator cache
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    from tabulate import tabulate
+
+    from freqtrade.optimize.indicator_cache import IndicatorCache
+
+    config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
+    cache_dir = IndicatorCache.get_cache_dir(config)
+
+    if args['indicator_cache_clear']:
+        removed = IndicatorCache.clear(cache_dir)
+        print(f"Removed {removed} cached indicator dataframes from {cache_dir}.")
+        return
+
+    entries = IndicatorCache.get_entries(cache_dir)
+    total_size = sum(entry['size'] for entry in entries)
+    print(f"Found {len(entries)} cached indicator dataframes "
+          f"({total_size / 1024 / 1024:.1f} MB) in {cache_dir}.")
+
+    grouped: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+    for entry in entries:
+        grouped[(entry['strategy'], entry['timeframe'])].append(entry)
+    if grouped:
+        print(tabulate([(strategy, timeframe, len({entry['pair'] for entry in group}), len(group),
+                         f"{sum(entry['size'] for entry in group) / 1024 / 1024:.1f} MB",
+                         max(entry['last_used'] for entry in group).strftime(
+                             constants.DATETIME_PRINT_FORMAT))
+                        for (strategy, timeframe), group in sorted(grouped.items())],
+                       headers=("Strategy", "Timeframe", "Pairs", "Entries", "Size", "Last used"),
+                       tablefmt='psql', stralign='right'))
@@ -246,6 +246,26 @@ class Configuration:
                              logstring='Parameter --timeframe-detail detected, '
                              'using {} for intra-candle backtesting ...')
 
+        self._args_to_config(config, argname='backtest_engine',
+                             logstring='Parameter --backtest-engine detected, '
+                             'using {} backtest engine ...')
+
+        self._args_to_config(config, argname='indicator_jobs',
+                             logstring='Parameter --indicator-jobs detected, '
+                             'using {} jobs to calculate indicators ...')
+
+        self._args_to_config(config, argname='load_jobs',
+                             logstring='Parameter --load-jobs detected, '
+                             'using {} jobs to load pairs ...')
+
+        self._args_to_config(config, argname='indicator_cache',
+                             logstring='Parameter --indicator-cache detected, '
+                             'caching populated indicators ...')
+
+        self._args_to_config(config, argname='backtest_jobs',
+                             logstring='Parameter --backtest-jobs detected, '
+                             'using {} parallel backtest jobs ...')
+
         self._args_to_config(config, argname='backtest_show_pair_list',
                              logstring='Parameter --show-pair-list detected.')
 
@@ -323,6 +343,9 @@ class Configuration:
         self._args_to_config(config, argname='hyperopt_jobs',
                              logstring='Parameter -j/--job-workers detected: {}')
 
+        self._args_to_config(config, argname='hyperopt_scheduler',
+                             logstring='Parameter --hyperopt-scheduler detected: {}')
+
         self._args_to_config(config, argname='hyperopt_random_state',
                              logstring='Parameter --random-state detected: {}')
 
@@ -421,6 +444,9 @@ class Configuration:
         self._args_to_config(config, argname='download_trades',
                              logstring='Detected --dl-trades: {}')
 
+        self._args_to_config(config, argname='download_jobs',
+                             logstring='Detected --dl-jobs: {}')
+
         self._args_to_config(config, argname='dataformat_ohlcv',
                              logstring='Using "{}" to store OHLCV data.')
 
@@ -32,8 +32,10 @@ AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList',
                        'PrecisionFilter', 'PriceFilter', 'RangeStabilityFilter',
                        'ShuffleFilter', 'SpreadFilter', 'VolatilityFilter']
 AVAILABLE_PROTECTIONS = ['CooldownPeriod', 'LowProfitPairs', 'MaxDrawdown', 'StoplossGuard']
-AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'hdf5']
+AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'hdf5', 'parquet']
 BACKTEST_BREAKDOWNS = ['day', 'week', 'month']
+BACKTEST_ENGINES = ['loop', 'vectorized']
+HYPEROPT_SCHEDULERS = ['batch', 'async']
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = '%Y-%m-%d %H:%M:%S'
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -48,6 +50,7 @@ FTHYPT_FILEVERSION = 'fthypt_fileversion'
 USERPATH_HYPEROPTS = 'hyperopts'
 USERPATH_STRATEGIES = 'strategies'
 USERPATH_NOTEBOOKS = 'notebooks'
+USERPATH_INDICATOR_CACHE = 'indicator_cache'
 
 TELEGRAM_SETTING_OPTIONS = ['on', 'off', 'silent']
 ENV_VAR_PREFIX = 'FREQTRADE__'
@@ -102,6 +105,7 @@ CONF_SCHEMA = {
     'properties': {
         'max_open_trades': {'type': ['integer', 'number'], 'minimum': -1},
         'new_pairs_days': {'type': 'integer', 'default': 30},
+        'download_jobs': {'type': 'integer', 'minimum': 1, 'default': 1},
         'timeframe': {'type': 'string'},
         'stake_currency': {'type': 'string'},
         'stake_amount': {
@@ -128,6 +132,8 @@ CONF_SCHEMA = {
         'dry_run_wallet': {'type': 'number', 'default': DRY_RUN_WALLET},
         'cancel_open_orders_on_exit': {'type': 'boolean', 'default': False},
         'process_only_new_candles': {'type': 'boolean'},
+        'incremental_indicators': {'type': 'boolean'},
+        'incremental_indicators_verify': {'type': 'boolean'},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -150,6 +156,13 @@ CONF_SCHEMA = {
             'type': 'array',
             'items': {'type': 'string', 'enum': BACKTEST_BREAKDOWNS}
         },
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES, 'default': 'loop'},
+        'backtest_jobs': {'type': 'integer', 'default': 1},
+        'indicator_jobs': {'type': 'integer', 'default': 1},
+        'load_jobs': {'type': 'integer', 'default': 1},
+        'indicator_cache': {'type': 'boolean', 'default': False},
+        'indicator_cache_size': {'type': 'number', 'minimum': 0, 'default': 1024},
+        'hyperopt_scheduler': {'type': 'string', 'enum': HYPEROPT_SCHEDULERS, 'default': 'batch'},
         'bot_name': {'type': 'string'},
         'unfilledtimeout': {
             'type': 'object',
@@ -334,6 +347,7 @@ CONF_SCHEMA = {
                 'jwt_secret_key': {'type': 'string'},
                 'CORS_origins': {'type': 'array', 'items': {'type': 'string'}},
                 'verbosity': {'type': 'string', 'enum': ['error', 'info']},
+                'enable_metrics': {'type': 'boolean'},
             },
             'required': ['enabled', 'listen_ip_address', 'listen_port', 'username', 'password']
         },
@@ -350,6 +364,9 @@ CONF_SCHEMA = {
                 'process_throttle_secs': {'type': 'integer'},
                 'interval': {'type': 'integer'},
                 'sd_notify': {'type': 'boolean'},
+                'candle_sync': {'type': 'boolean'},
+                'candle_sync_offset_secs': {'type': 'number', 'minimum': 0},
+                'candle_sync_retries': {'type': 'integer', 'minimum': 0},
             }
         },
         'dataformat_ohlcv': {
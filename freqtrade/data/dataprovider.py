@@ -5,10 +5,13 @@ including ticker and orderbook data, live and historical candle (OHLCV) data
 Common Interface for bot and strategy to access data.
 """
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import ListPairsWithTimeframes, PairWithTimeframe
@@ -33,6 +36,8 @@ class DataProvider:
         self.__cached_pairs: Dict[PairWithTimeframe, Tuple[DataFrame, datetime]] = {}
         self.__slice_index: Optional[int] = None
         self.__cached_pairs_backtesting: Dict[PairWithTimeframe, DataFrame] = {}
+        # Runmode reported to individual threads - see _runmode_override()
+        self.__runmode_overrides: Dict[int, RunMode] = {}
 
     def _set_dataframe_max_index(self, limit_index: int):
         """
@@ -52,6 +57,74 @@ class DataProvider:
         """
         self.__cached_pairs[(pair, timeframe)] = (dataframe, datetime.now(timezone.utc))
 
+    def _extend_cached_df(self, pair: str, timeframe: str, dataframe: DataFrame,
+                          exclude_columns: Iterable[str] = ()
+                          ) -> Tuple[Optional[DataFrame], int]:
+        """
+        Extend the cached, analyzed dataframe by the candles of dataframe which were not
+        analyzed yet - used to populate indicators incrementally.
+        Candles which are no longer part of dataframe are removed.
+        :param pair: pair to get the data for
+        :param timeframe: Timeframe to get data for
+        :param dataframe: Candle (OHLCV) data to be analyzed
+        :param exclude_columns: Columns of the cached dataframe not to include
+        :return: Tuple of (extended dataframe, number of new candles) - the extended dataframe
+            has the same candles as dataframe, with indicator columns of new candles unset
+            (see _unset_values()). (None, 0) if the cached dataframe does not match the candle data.
+        """
+        cached = self.__cached_pairs.get((pair, timeframe))
+        if cached is None or cached[0].empty or dataframe.empty:
+            return None, 0
+        analyzed = cached[0]
+        # Number of candles already analyzed
+        analyzed_count = int(dataframe['date'].searchsorted(analyzed['date'].iloc[-1],
+                                                            side='right'))
+        start = len(analyzed) - analyzed_count
+        if analyzed_count == 0 or start < 0:
+            return None, 0
+        previous = analyzed.iloc[start:]
+        # Already analyzed candles must not have changed (e.g. due to gaps in the data)
+        for column in ('date', 'open', 'high', 'low', 'close', 'volume'):
+            if not (previous[column].values == dataframe[column].values[:analyzed_count]).all():
+                return None, 0
+        exclude = set(exclude_columns)
+        indicators = [column for column in previous.columns
+                      if column not in exclude and column not in dataframe.columns]
+        new_candles = len(dataframe) - analyzed_count
+        if new_candles == 0:
+            return previous[list(dataframe.columns) + indicators].reset_index(drop=True), 0
+        new_rows = dataframe.iloc[analyzed_count:]
+        if not all(isinstance(previous[column].dtype, np.dtype) for column in indicators):
+            # Extension dtypes (e.g. timezone aware dates) - slower, but keeps dtypes
+            new_rows = new_rows.copy()
+            for column in indicators:
+                if isinstance(previous[column].dtype, np.dtype):
+                    new_rows[column] = self._unset_values(previous[column].dtype, new_candles)
+            extended = concat([previous[list(dataframe.columns) + indicators], new_rows],
+                              ignore_index=True)
+            return extended, new_candles
+        # Assembling the columns is considerably faster than concat() on mixed dtypes.
+        columns = {column: dataframe[column].array for column in dataframe.columns}
+        for column in indicators:
+            values = previous[column].values
+            columns[column] = np.concatenate(
+                [values, self._unset_values(values.dtype, new_candles)])
+        return DataFrame(columns), new_candles
+
+    @staticmethod
+    def _unset_values(dtype: np.dtype, length: int) -> np.ndarray:
+        """
+        Values of indicators which are not populated yet - keeping the dtype of the column.
+        Boolean and integer columns can't hold NaN, so they are set to False / 0.
+        """
+        if dtype.kind in 'biu':
+            return np.zeros(length, dtype=dtype)
+        if dtype.kind == 'f':
+            return np.full(length, np.nan, dtype=dtype)
+        if dtype.kind in 'mM':
+            return np.full(length, dtype.type('NaT'), dtype=dtype)
+        return np.full(length, None, dtype=object)
+
     def add_pairlisthandler(self, pairlists) -> None:
         """
         Allow adding pairlisthandler after initialization
@@ -128,8 +201,30 @@ class DataProvider:
         Get runmode of the bot
         can be "live", "dry-run", "backtest", "edgecli", "hyperopt" or "other".
         """
+        runmode = self.__runmode_overrides.get(threading.get_ident())
+        if runmode is not None:
+            return runmode
         return RunMode(self._config.get('runmode', RunMode.OTHER))
 
+    @contextmanager
+    def _runmode_override(self, runmode: RunMode) -> Iterator[None]:
+        """
+        Report a different runmode to the current thread only - used by Edge, which
+        analyzes historic data while the bot keeps trading in other threads.
+        Using private method as this should never be used by a user.
+        :param runmode: Runmode to report within this context
+        """
+        thread_id = threading.get_ident()
+        prior_runmode = self.__runmode_overrides.get(thread_id)
+        self.__runmode_overrides[thread_id] = runmode
+        try:
+            yield
+        finally:
+            if prior_runmode is None:
+                del self.__runmode_overrides[thread_id]
+            else:
+                self.__runmode_overrides[thread_id] = prior_runmode
+
     def current_whitelist(self) -> List[str]:
         """
         fetch latest available whitelist.
@@ -1,7 +1,8 @@
 import logging
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -114,12 +115,44 @@ class HDF5DataHandler(IDataHandler):
 
     def ohlcv_append(self, pair: str, timeframe: str, data: pd.DataFrame) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Stored candles starting at (or after) the first candle of data are replaced.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
+        :param data: Data to append. Must be sorted by date and free of duplicates.
         """
-        raise NotImplementedError()
+        if data.empty:
+            return
+        key = self._pair_ohlcv_key(pair, timeframe)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+
+        ds = pd.HDFStore(filename, mode='a', complevel=9, complib='blosc')
+        if key in ds:
+            ds.remove(key, where=[f"date >= Timestamp({data.iloc[0]['date'].value})"])
+        ds.append(key, data.loc[:, self._columns], format='table', data_columns=['date'])
+        ds.close()
+
+    def ohlcv_data_min_max(self, pair: str,
+                           timeframe: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Returns the date of the first and the last stored candle.
+        Only these two rows are read from the file.
+        :param pair: Pair to get the dates for
+        :param timeframe: Timeframe (e.g. "5m")
+        :return: (first date, last date) - or (None, None) if no data is available.
+        """
+        key = self._pair_ohlcv_key(pair, timeframe)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if not filename.exists():
+            return None, None
+
+        with pd.HDFStore(filename, mode='r') as ds:
+            nrows = ds.get_storer(key).nrows if key in ds else 0
+            if not nrows:
+                return None, None
+            first = ds.select(key, start=0, stop=1, columns=['date'])
+            last = ds.select(key, start=nrows - 1, stop=nrows, columns=['date'])
+        return first.iloc[0]['date'].to_pydatetime(), last.iloc[0]['date'].to_pydatetime()
 
     @classmethod
     def trades_get_pairs(cls, datadir: Path) -> List[str]:
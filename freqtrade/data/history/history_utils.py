@@ -1,16 +1,19 @@
+import asyncio
 import logging
 import operator
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import arrow
 from pandas import DataFrame
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
-from freqtrade.data.converter import (clean_ohlcv_dataframe, ohlcv_to_dataframe,
-                                      trades_remove_duplicates, trades_to_ohlcv)
+from freqtrade.data.converter import ohlcv_to_dataframe, trades_remove_duplicates, trades_to_ohlcv
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange
@@ -64,6 +67,7 @@ def load_data(datadir: Path,
               startup_candles: int = 0,
               fail_without_data: bool = False,
               data_format: str = 'json',
+              load_jobs: int = 1,
               ) -> Dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -76,29 +80,83 @@ def load_data(datadir: Path,
     :param startup_candles: Additional candles to load at the start of the period
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
+    :param load_jobs: Number of pairs to load in parallel - see load_data_lazy().
     :return: dict(<pair>:<Dataframe>)
     """
-    result: Dict[str, DataFrame] = {}
-    if startup_candles > 0 and timerange:
-        logger.info(f'Using indicator startup period: {startup_candles} ...')
-
-    data_handler = get_datahandler(datadir, data_format)
-
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, timeframe=timeframe,
-                                 datadir=datadir, timerange=timerange,
+    loaded = dict(load_data_lazy(datadir, timeframe, pairs, timerange=timerange,
                                  fill_up_missing=fill_up_missing,
                                  startup_candles=startup_candles,
-                                 data_handler=data_handler
-                                 )
-        if not hist.empty:
-            result[pair] = hist
+                                 data_format=data_format, load_jobs=load_jobs))
+    # Keep the order of pairs - independent of the order in which pairs finished loading.
+    result = {pair: loaded[pair] for pair in pairs if pair in loaded}
 
     if fail_without_data and not result:
         raise OperationalException("No data found. Terminating.")
     return result
 
 
+def load_data_lazy(datadir: Path,
+                   timeframe: str,
+                   pairs: List[str], *,
+                   timerange: Optional[TimeRange] = None,
+                   fill_up_missing: bool = True,
+                   startup_candles: int = 0,
+                   data_format: str = 'json',
+                   load_jobs: int = 1,
+                   ) -> Iterator[Tuple[str, DataFrame]]:
+    """
+    Load ohlcv history data for a list of pairs, yielding every pair once it's loaded.
+    Pairs without data are skipped.
+    If load_jobs is not 1, pairs are loaded in parallel and yielded in the order they
+    finish loading. Data handlers which release the GIL while loading use threads,
+    all others use worker processes.
+
+    :param datadir: Path to the data storage location.
+    :param timeframe: Timeframe (e.g. "5m")
+    :param pairs: List of pairs to load
+    :param timerange: Limit data to be loaded to this timerange
+    :param fill_up_missing: Fill missing values with "No action"-candles
+    :param startup_candles: Additional candles to load at the start of the period
+    :param data_format: Data format which should be used. Defaults to json
+    :param load_jobs: Number of pairs to load in parallel.
+                      If -1, all CPUs are used, for -2, all CPUs but one are used, etc.
+    :return: Iterator of (<pair>, <Dataframe>) tuples
+    """
+    if startup_candles > 0 and timerange:
+        logger.info(f'Using indicator startup period: {startup_candles} ...')
+
+    data_handler = get_datahandler(datadir, data_format)
+    load = partial(load_pair_history, timeframe=timeframe,
+                   datadir=datadir, timerange=timerange,
+                   fill_up_missing=fill_up_missing,
+                   startup_candles=startup_candles,
+                   data_handler=data_handler)
+
+    workers = min(load_jobs if load_jobs > 0 else (os.cpu_count() or 1) + 1 + load_jobs,
+                  len(pairs))
+    if workers <= 1:
+        for pair in pairs:
+            hist = load(pair)
+            if not hist.empty:
+                yield pair, hist
+        return
+
+    executor_class = ThreadPoolExecutor if data_handler.releases_gil else ProcessPoolExecutor
+    logger.info(f"Loading {len(pairs)} pairs using {workers} parallel "
+                f"{'threads' if data_handler.releases_gil else 'processes'}.")
+    with executor_class(max_workers=workers) as executor:
+        futures = {executor.submit(load, pair): pair for pair in pairs}
+        try:
+            for future in as_completed(futures):
+                hist = future.result()
+                if not hist.empty:
+                    yield futures[future], hist
+        finally:
+            # Don't load remaining pairs if the caller stops early
+            for future in futures:
+                future.cancel()
+
+
 def refresh_data(datadir: Path,
                  timeframe: str,
                  pairs: List[str],
@@ -125,33 +183,35 @@ def refresh_data(datadir: Path,
 
 
 def _load_cached_data_for_updating(pair: str, timeframe: str, timerange: Optional[TimeRange],
-                                   data_handler: IDataHandler) -> Tuple[DataFrame, Optional[int]]:
+                                   data_handler: IDataHandler) -> Tuple[bool, Optional[int]]:
     """
-    Load cached data to download more data.
+    Determine where to start downloading more data.
     If timerange is passed in, checks whether data from an before the stored data will be
     downloaded.
     If that's the case then what's available should be completely overwritten.
-    Otherwise downloads always start at the end of the available data to avoid data gaps.
+    Otherwise downloads always start at the last stored candle (which is replaced)
+    to avoid data gaps - and the new data is appended to the stored data.
+    Only the dates of the first and last stored candles are loaded.
     Note: Only used by download_pair_history().
+    :return: Tuple of (append, since_ms) - append is False if the stored data must be replaced.
     """
     start = None
     if timerange:
         if timerange.starttype == 'date':
             start = datetime.fromtimestamp(timerange.startts, tz=timezone.utc)
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
-    data = data_handler.ohlcv_load(pair, timeframe=timeframe,
-                                   timerange=None, fill_missing=False,
-                                   drop_incomplete=True, warn_no_data=False)
-    if not data.empty:
-        if start and start < data.iloc[0]['date']:
-            # Earlier data than existing data requested, redownload all
-            data = DataFrame(columns=DEFAULT_DATAFRAME_COLUMNS)
-        else:
-            start = data.iloc[-1]['date']
+    append = False
+    data_start, data_end = data_handler.ohlcv_data_min_max(pair, timeframe)
+    if data_start and data_end:
+        logger.debug("Current Start: %s", f"{data_start:%Y-%m-%d %H:%M:%S}")
+        logger.debug("Current End: %s", f"{data_end:%Y-%m-%d %H:%M:%S}")
+        # Earlier data than existing data requested - redownload all
+        if not start or start >= data_start:
+            start = data_end
+            append = True
 
     start_ms = int(start.timestamp() * 1000) if start else None
-    return data, start_ms
+    return append, start_ms
 
 
 def _download_pair_history(pair: str, *,
@@ -165,7 +225,8 @@ def _download_pair_history(pair: str, *,
     """
     Download latest candles from the exchange for the pair and timeframe passed in parameters
     The data is downloaded starting from the last correct data that
-    exists in a cache. If timerange starts earlier than the data in the cache,
+    exists in a cache, and appended to the stored data.
+    If timerange starts earlier than the data in the cache,
     the full data will be redownloaded
 
     Based on @Rybolov work: https://github.com/rybolov/freqtrade-data
@@ -183,14 +244,8 @@ def _download_pair_history(pair: str, *,
             f'and store in {datadir}.'
         )
 
-        # data, since_ms = _load_cached_data_for_updating_old(datadir, pair, timeframe, timerange)
-        data, since_ms = _load_cached_data_for_updating(pair, timeframe, timerange,
-                                                        data_handler=data_handler)
-
-        logger.debug("Current Start: %s",
-                     f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
-        logger.debug("Current End: %s",
-                     f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
+        append, since_ms = _load_cached_data_for_updating(pair, timeframe, timerange,
+                                                          data_handler=data_handler)
 
         # Default since_ms to 30 days if nothing is given
         new_data = exchange.get_historic_ohlcv(pair=pair,
@@ -198,25 +253,9 @@ def _download_pair_history(pair: str, *,
                                                since_ms=since_ms if since_ms else
                                                arrow.utcnow().shift(
                                                    days=-new_pairs_days).int_timestamp * 1000,
-                                               is_new_pair=data.empty
+                                               is_new_pair=not append
                                                )
-        # TODO: Maybe move parsing to exchange class (?)
-        new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
-                                           fill_missing=False, drop_incomplete=True)
-        if data.empty:
-            data = new_dataframe
-        else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(data.append(new_dataframe), timeframe, pair,
-                                         fill_missing=False, drop_incomplete=False)
-
-        logger.debug("New  Start: %s",
-                     f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
-        logger.debug("New End: %s",
-                     f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
-
-        data_handler.ohlcv_store(pair, timeframe, data=data)
+        _store_pair_history(pair, timeframe, new_data, append=append, data_handler=data_handler)
         return True
 
     except Exception:
@@ -226,16 +265,110 @@ def _download_pair_history(pair: str, *,
         return False
 
 
+def _store_pair_history(pair: str, timeframe: str, new_data: List, *,
+                        append: bool, data_handler: IDataHandler) -> None:
+    """
+    Store downloaded candles - appending to or replacing the stored data.
+    """
+    # TODO: Maybe move parsing to exchange class (?)
+    new_dataframe = ohlcv_to_dataframe(new_data, timeframe, pair,
+                                       fill_missing=False, drop_incomplete=True)
+
+    logger.debug("New Start: %s", f"{new_dataframe.iloc[0]['date']:%Y-%m-%d %H:%M:%S}"
+                 if not new_dataframe.empty else 'None')
+    logger.debug("New End: %s", f"{new_dataframe.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}"
+                 if not new_dataframe.empty else 'None')
+
+    if append:
+        # Candles overlapping the stored data are replaced by the data handler.
+        data_handler.ohlcv_append(pair, timeframe, data=new_dataframe)
+    else:
+        data_handler.ohlcv_store(pair, timeframe, data=new_dataframe)
+
+
+async def _async_download_pair_history(pair: str, timeframe: str, *,
+                                       exchange: Exchange,
+                                       data_handler: IDataHandler,
+                                       timerange: Optional[TimeRange],
+                                       new_pairs_days: int,
+                                       slots: asyncio.Semaphore,
+                                       executor: ThreadPoolExecutor) -> int:
+    """
+    Async version of _download_pair_history().
+    Reading and storing data is offloaded to executor, so the event loop can continue
+    downloading other pairs in the meantime.
+    :param slots: Semaphore limiting the number of concurrent downloads.
+    :return: Number of downloaded candles
+    """
+    loop = exchange.loop
+    async with slots:
+        try:
+            logger.info(f'Downloading pair {pair}, interval {timeframe}.')
+            append, since_ms = await loop.run_in_executor(executor, partial(
+                _load_cached_data_for_updating, pair, timeframe, timerange,
+                data_handler=data_handler))
+            _, _, new_data = await exchange._async_get_historic_ohlcv(
+                pair=pair, timeframe=timeframe,
+                since_ms=since_ms if since_ms else
+                arrow.utcnow().shift(days=-new_pairs_days).int_timestamp * 1000,
+                is_new_pair=not append)
+            logger.info(f"Downloaded data for {pair} with length {len(new_data)}.")
+
+            await loop.run_in_executor(executor, partial(
+                _store_pair_history, pair, timeframe, new_data,
+                append=append, data_handler=data_handler))
+            return len(new_data)
+        except Exception:
+            logger.exception(
+                f'Failed to download history data for pair: "{pair}", timeframe: {timeframe}.'
+            )
+            return 0
+
+
+def _download_pairs_history_concurrently(pairs_timeframes: List[Tuple[str, str]], *,
+                                         exchange: Exchange,
+                                         data_handler: IDataHandler,
+                                         timerange: Optional[TimeRange],
+                                         new_pairs_days: int,
+                                         download_jobs: int) -> None:
+    """
+    Download multiple pair / timeframe combinations on the exchange event loop,
+    with up to download_jobs downloads in flight.
+    Requests are rate-limited by ccxt, so this mainly helps to hide latency.
+    """
+    async def download_all(executor: ThreadPoolExecutor) -> List[int]:
+        slots = asyncio.Semaphore(download_jobs)
+        return await asyncio.gather(*[
+            _async_download_pair_history(
+                pair, timeframe, exchange=exchange, data_handler=data_handler,
+                timerange=timerange, new_pairs_days=new_pairs_days,
+                slots=slots, executor=executor)
+            for pair, timeframe in pairs_timeframes])
+
+    logger.info(f"Downloading {len(pairs_timeframes)} pair / timeframe combinations "
+                f"with up to {download_jobs} concurrent downloads.")
+    start = time.time()
+    # A single thread does all file operations - data handlers are not thread-safe.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with exchange._loop_lock:
+            candles = sum(exchange.loop.run_until_complete(download_all(executor)))
+    duration = time.time() - start
+    logger.info(f"Downloaded {candles} candles in {duration:.2f}s "
+                f"({candles / max(duration, 1e-6):.0f} candles/s).")
+
+
 def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes: List[str],
                                 datadir: Path, timerange: Optional[TimeRange] = None,
                                 new_pairs_days: int = 30, erase: bool = False,
-                                data_format: str = None) -> List[str]:
+                                data_format: str = None, download_jobs: int = 1) -> List[str]:
     """
     Refresh stored ohlcv data for backtesting and hyperopt operations.
     Used by freqtrade download-data subcommand.
+    :param download_jobs: Number of pair / timeframe combinations to download concurrently.
     :return: List of pairs that are not available.
     """
     pairs_not_available = []
+    pairs_timeframes = []
     data_handler = get_datahandler(datadir, data_format)
     for idx, pair in enumerate(pairs, start=1):
         if pair not in exchange.markets:
@@ -249,12 +382,19 @@ def refresh_backtest_ohlcv_data(exchange: Exchange, pairs: List[str], timeframes
                     logger.info(
                         f'Deleting existing data for pair {pair}, interval {timeframe}.')
 
+            if download_jobs > 1:
+                pairs_timeframes.append((pair, str(timeframe)))
+                continue
             logger.info(f'Downloading pair {pair}, interval {timeframe}.')
             process = f'{idx}/{len(pairs)}'
             _download_pair_history(pair=pair, process=process,
                                    datadir=datadir, exchange=exchange,
                                    timerange=timerange, data_handler=data_handler,
                                    timeframe=str(timeframe), new_pairs_days=new_pairs_days)
+    if pairs_timeframes:
+        _download_pairs_history_concurrently(
+            pairs_timeframes, exchange=exchange, data_handler=data_handler,
+            timerange=timerange, new_pairs_days=new_pairs_days, download_jobs=download_jobs)
     return pairs_not_available
 
 
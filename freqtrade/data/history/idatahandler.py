@@ -8,7 +8,7 @@ from abc import ABC, abstractclassmethod, abstractmethod
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import List, Optional, Tuple, Type
 
 from pandas import DataFrame
 
@@ -23,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 class IDataHandler(ABC):
 
+    # Loading data releases the GIL (so multiple pairs can be loaded in parallel threads).
+    releases_gil = False
+
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
 
@@ -82,11 +85,28 @@ class IDataHandler(ABC):
     @abstractmethod
     def ohlcv_append(self, pair: str, timeframe: str, data: DataFrame) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Stored candles starting at (or after) the first candle of data are replaced,
+        so data may overlap the end of the stored data.
+        Creates the data structure if it does not exist yet.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
+        :param data: Data to append. Must be sorted by date and free of duplicates.
+        """
+
+    def ohlcv_data_min_max(self, pair: str,
+                           timeframe: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Returns the date of the first and the last stored candle.
+        Subclasses should override this to avoid loading all data.
+        :param pair: Pair to get the dates for
+        :param timeframe: Timeframe (e.g. "5m")
+        :return: (first date, last date) - or (None, None) if no data is available.
         """
+        data = self._ohlcv_load(pair, timeframe, timerange=None)
+        if data.empty:
+            return None, None
+        return data.iloc[0]['date'].to_pydatetime(), data.iloc[-1]['date'].to_pydatetime()
 
     @abstractclassmethod
     def trades_get_pairs(cls, datadir: Path) -> List[str]:
@@ -237,6 +257,9 @@ def get_datahandlerclass(datatype: str) -> Type[IDataHandler]:
     elif datatype == 'hdf5':
         from .hdf5datahandler import HDF5DataHandler
         return HDF5DataHandler
+    elif datatype == 'parquet':
+        from .parquetdatahandler import ParquetDataHandler
+        return ParquetDataHandler
     else:
         raise ValueError(f"No datahandler for datatype {datatype} available.")
 
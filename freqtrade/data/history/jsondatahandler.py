@@ -1,10 +1,12 @@
+import gzip
 import logging
 import re
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import numpy as np
-from pandas import DataFrame, read_json, to_datetime
+from pandas import DataFrame, concat, read_json, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
@@ -16,6 +18,12 @@ from .idatahandler import IDataHandler
 
 logger = logging.getLogger(__name__)
 
+# Number of bytes read from the start / end of uncompressed json files
+# to find the first / last candles without loading the whole file.
+TAIL_CHUNK_SIZE = 64 * 1024
+# Matches the start of a candle ("[<timestamp>,") within "values"-formatted json files.
+CANDLE_START_RE = re.compile(rb'\[\s*(-?\d+)\s*,')
+
 
 class JsonDataHandler(IDataHandler):
 
@@ -60,14 +68,20 @@ class JsonDataHandler(IDataHandler):
         :return: None
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        self._ohlcv_to_json(data).to_json(
+            filename, orient="values",
+            compression='gzip' if self._use_zip else None)
+
+    def _ohlcv_to_json(self, data: DataFrame) -> DataFrame:
+        """
+        Prepare ohlcv data to be written to json.
+        """
         _data = data.copy()
         # Convert date to int
         _data['date'] = _data['date'].view(np.int64) // 1000 // 1000
 
-        # Reset index, select only appropriate columns and save as json
-        _data.reset_index(drop=True).loc[:, self._columns].to_json(
-            filename, orient="values",
-            compression='gzip' if self._use_zip else None)
+        # Reset index, select only appropriate columns
+        return _data.reset_index(drop=True).loc[:, self._columns]
 
     def _ohlcv_load(self, pair: str, timeframe: str,
                     timerange: Optional[TimeRange] = None,
@@ -115,12 +129,89 @@ class JsonDataHandler(IDataHandler):
 
     def ohlcv_append(self, pair: str, timeframe: str, data: DataFrame) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Stored candles starting at (or after) the first candle of data are replaced.
+        Uncompressed files are modified in place (only the end of the file is read),
+        compressed files are rewritten.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
-        :param data: Data to append.
+        :param data: Data to append. Must be sorted by date and free of duplicates.
         """
-        raise NotImplementedError()
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if self._use_zip or not filename.exists() or not self._ohlcv_append_inplace(
+                filename, data):
+            existing = self._ohlcv_load(pair, timeframe)
+            existing = existing.loc[existing['date'] < data.iloc[0]['date']]
+            self.ohlcv_store(pair, timeframe, concat([existing, data], ignore_index=True))
+
+    def _ohlcv_append_inplace(self, filename: Path, data: DataFrame) -> bool:
+        """
+        Append data to an uncompressed json file by replacing its end.
+        :return: False if the overlap with the stored data can't be determined from the end
+                 of the file - in which case the file remains unchanged.
+        """
+        seam = int(data.iloc[0]['date'].timestamp() * 1000)
+        rows = self._ohlcv_to_json(data).to_json(orient='values')[1:-1]
+        with filename.open('r+b') as file:
+            offset, chunk = self._read_tail(file)
+            candles = [(m.start(), int(m[1])) for m in CANDLE_START_RE.finditer(chunk)]
+            overlap = [pos for pos, date in candles if date >= seam]
+            if not candles or (overlap and overlap[0] == candles[0][0]):
+                # Not a single candle before the seam available.
+                return False
+            if overlap:
+                # Replace candles starting at the seam
+                file.seek(offset + overlap[0])
+                file.write(f'{rows}]'.encode())
+            else:
+                # Overwrite the closing bracket
+                file.seek(offset + chunk.rindex(b']'))
+                file.write(f',{rows}]'.encode())
+            file.truncate()
+        return True
+
+    def ohlcv_data_min_max(self, pair: str,
+                           timeframe: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Returns the date of the first and the last stored candle.
+        Only the start and the end of the file are parsed.
+        :param pair: Pair to get the dates for
+        :param timeframe: Timeframe (e.g. "5m")
+        :return: (first date, last date) - or (None, None) if no data is available.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if not filename.exists():
+            return None, None
+        if self._use_zip:
+            with gzip.open(filename, 'rb') as file:
+                head = tail = file.read(TAIL_CHUNK_SIZE)
+                # Compressed files can't be read backwards - decompress without parsing.
+                for chunk in iter(lambda: file.read(TAIL_CHUNK_SIZE), b''):
+                    tail = tail[-TAIL_CHUNK_SIZE:] + chunk
+        else:
+            with filename.open('rb') as file:
+                head = file.read(TAIL_CHUNK_SIZE)
+                _, tail = self._read_tail(file)
+        first = CANDLE_START_RE.search(head)
+        last = list(CANDLE_START_RE.finditer(tail))
+        if not first or not last:
+            # Empty or unexpectedly formatted file
+            return super().ohlcv_data_min_max(pair, timeframe)
+        return (datetime.fromtimestamp(int(first[1]) / 1000, tz=timezone.utc),
+                datetime.fromtimestamp(int(last[-1][1]) / 1000, tz=timezone.utc))
+
+    @staticmethod
+    def _read_tail(file) -> Tuple[int, bytes]:
+        """
+        Read the last TAIL_CHUNK_SIZE bytes of a file.
+        :return: Tuple of (offset of the chunk within the file, chunk)
+        """
+        size = file.seek(0, 2)
+        offset = max(0, size - TAIL_CHUNK_SIZE)
+        file.seek(offset)
+        return offset, file.read()
 
     @classmethod
     def trades_get_pairs(cls, datadir: Path) -> List[str]:
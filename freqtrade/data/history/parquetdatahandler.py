@@ -0,0 +1,292 @@
+import logging
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from freqtrade import misc
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import (DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS,
+                                 ListPairsWithTimeframes, TradeList)
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Rows per row group. Row groups are the smallest unit read from disk - min / max statistics
+# of each row group allow to skip row groups outside of the requested timerange.
+# 10.000 candles are ~1 week of 1m candles, or ~5 weeks of 5m candles.
+ROW_GROUP_SIZE = 10000
+
+
+class ParquetDataHandler(IDataHandler):
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+    releases_gil = True
+
+    @classmethod
+    def ohlcv_get_available_data(cls, datadir: Path) -> ListPairsWithTimeframes:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        :param datadir: Directory to search for ohlcv files
+        :return: List of Tuples of (pair, timeframe)
+        """
+        _tmp = [re.search(r'^([a-zA-Z_]+)\-(\d+\S+)(?=.parquet)', p.name)
+                for p in datadir.glob("*.parquet")]
+        return [(match[1].replace('_', '/'), match[2]) for match in _tmp
+                if match and len(match.groups()) > 1]
+
+    @classmethod
+    def ohlcv_get_pairs(cls, datadir: Path, timeframe: str) -> List[str]:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        for the specified timeframe
+        :param datadir: Directory to search for ohlcv files
+        :param timeframe: Timeframe to search pairs for
+        :return: List of Pairs
+        """
+
+        _tmp = [re.search(r'^(\S+)(?=\-' + timeframe + '.parquet)', p.name)
+                for p in datadir.glob(f"*{timeframe}.parquet")]
+        # Check if regex found something and only return these results
+        return [match[0].replace('_', '/') for match in _tmp if match]
+
+    def ohlcv_store(self, pair: str, timeframe: str, data: pd.DataFrame) -> None:
+        """
+        Store data in parquet file.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        table = pa.Table.from_pandas(data.loc[:, self._columns], preserve_index=False)
+        pq.write_table(table, filename, row_group_size=ROW_GROUP_SIZE)
+
+    def _ohlcv_load(self, pair: str, timeframe: str,
+                    timerange: Optional[TimeRange] = None) -> pd.DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Only row groups overlapping the timerange are read from disk.
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if not filename.exists():
+            return pd.DataFrame(columns=self._columns)
+
+        start, stop = None, None
+        if timerange:
+            if timerange.starttype == 'date':
+                start = datetime.fromtimestamp(timerange.startts, tz=timezone.utc)
+            if timerange.stoptype == 'date':
+                stop = datetime.fromtimestamp(timerange.stopts, tz=timezone.utc)
+        pairdata = self._read_row_groups(filename, 'date', start, stop).to_pandas()
+
+        if list(pairdata.columns) != self._columns:
+            raise ValueError("Wrong dataframe format")
+        pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
+                                          'low': 'float', 'close': 'float', 'volume': 'float'})
+        return pairdata
+
+    def ohlcv_purge(self, pair: str, timeframe: str) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if filename.exists():
+            filename.unlink()
+            return True
+        return False
+
+    def ohlcv_append(self, pair: str, timeframe: str, data: pd.DataFrame) -> None:
+        """
+        Append data to existing data structures.
+        Stored candles starting at (or after) the first candle of data are replaced.
+        Parquet files can't be modified - so the file is rewritten, copying complete row
+        groups before the first candle of data one by one, without loading the whole file.
+        Only the last (incomplete) row groups are combined with data.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append. Must be sorted by date and free of duplicates.
+        """
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data)
+            return
+
+        seam = data.iloc[0]['date']
+        parquet_file = pq.ParquetFile(filename, memory_map=True)
+        column_idx = parquet_file.schema_arrow.get_field_index('date')
+        tmp_filename = filename.with_suffix('.parquet.tmp')
+        writer = pq.ParquetWriter(tmp_filename, parquet_file.schema_arrow)
+        for idx in range(parquet_file.num_row_groups):
+            row_group = parquet_file.metadata.row_group(idx)
+            statistics = row_group.column(column_idx).statistics
+            if (row_group.num_rows < ROW_GROUP_SIZE or statistics is None
+                    or not statistics.has_min_max or statistics.max >= seam):
+                break
+            writer.write_table(parquet_file.read_row_group(idx))
+        else:
+            idx = parquet_file.num_row_groups
+        tail = parquet_file.read_row_groups(range(idx, parquet_file.num_row_groups)).to_pandas()
+        tail = pd.concat([tail.loc[tail['date'] < seam], data.loc[:, self._columns]],
+                         ignore_index=True)
+        writer.write_table(pa.Table.from_pandas(tail, schema=parquet_file.schema_arrow,
+                                                preserve_index=False),
+                           row_group_size=ROW_GROUP_SIZE)
+        writer.close()
+        tmp_filename.replace(filename)
+
+    def ohlcv_data_min_max(self, pair: str,
+                           timeframe: str) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Returns the date of the first and the last stored candle.
+        Uses the row group statistics only - no data is read.
+        :param pair: Pair to get the dates for
+        :param timeframe: Timeframe (e.g. "5m")
+        :return: (first date, last date) - or (None, None) if no data is available.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe)
+        if not filename.exists():
+            return None, None
+        metadata = pq.ParquetFile(filename, memory_map=True).metadata
+        if metadata.num_rows == 0:
+            return None, None
+        column_idx = metadata.schema.to_arrow_schema().get_field_index('date')
+        statistics = [metadata.row_group(idx).column(column_idx).statistics
+                      for idx in range(metadata.num_row_groups)]
+        if not all(stat is not None and stat.has_min_max for stat in statistics):
+            return super().ohlcv_data_min_max(pair, timeframe)
+        return min(stat.min for stat in statistics), max(stat.max for stat in statistics)
+
+    @classmethod
+    def trades_get_pairs(cls, datadir: Path) -> List[str]:
+        """
+        Returns a list of all pairs for which trade data is available in this
+        :param datadir: Directory to search for ohlcv files
+        :return: List of Pairs
+        """
+        _tmp = [re.search(r'^(\S+)(?=\-trades.parquet)', p.name)
+                for p in datadir.glob("*trades.parquet")]
+        # Check if regex found something and only return these results to avoid exceptions.
+        return [match[0].replace('_', '/') for match in _tmp if match]
+
+    def trades_store(self, pair: str, data: TradeList) -> None:
+        """
+        Store trades data (list of Dicts) to file
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        table = pa.Table.from_pandas(pd.DataFrame(data, columns=DEFAULT_TRADES_COLUMNS),
+                                     preserve_index=False)
+        pq.write_table(table, self._pair_trades_filename(self._datadir, pair),
+                       row_group_size=ROW_GROUP_SIZE)
+
+    def trades_append(self, pair: str, data: TradeList):
+        """
+        Append data to existing files
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        raise NotImplementedError()
+
+    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
+        """
+        Load a pair from parquet file.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for - only row groups overlapping
+                          the timerange are read.
+        :return: List of trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return []
+
+        start, stop = None, None
+        if timerange:
+            if timerange.starttype == 'date':
+                start = timerange.startts * 1000
+            if timerange.stoptype == 'date':
+                stop = timerange.stopts * 1000
+        trades = self._read_row_groups(filename, 'timestamp', start, stop).to_pandas()
+        if start is not None:
+            trades = trades.loc[trades['timestamp'] >= start]
+        if stop is not None:
+            trades = trades.loc[trades['timestamp'] < stop]
+        trades[['id', 'type']] = trades[['id', 'type']].replace({np.nan: None})
+        return trades.values.tolist()
+
+    def trades_purge(self, pair: str) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if filename.exists():
+            filename.unlink()
+            return True
+        return False
+
+    @classmethod
+    def _read_row_groups(cls, filename: Path, column: str,
+                         start: Optional[Any], stop: Optional[Any]) -> pa.Table:
+        """
+        Read all row groups which may contain rows with start <= column <= stop.
+        The file is memory-mapped, and row groups are selected using their min / max statistics.
+        Rows outside of the range (but within a selected row group) are not removed.
+        :param filename: Parquet file to read
+        :param column: Column to filter on
+        :param start: Lower boundary - or None
+        :param stop: Upper boundary - or None
+        :return: pyarrow Table
+        """
+        parquet_file = pq.ParquetFile(filename, memory_map=True)
+        if start is None and stop is None:
+            return parquet_file.read()
+
+        column_idx = parquet_file.schema_arrow.get_field_index(column)
+        row_groups = [idx for idx in range(parquet_file.num_row_groups)
+                      if cls._row_group_in_range(
+                          parquet_file.metadata.row_group(idx).column(column_idx).statistics,
+                          start, stop)]
+        return parquet_file.read_row_groups(row_groups)
+
+    @staticmethod
+    def _row_group_in_range(statistics: Optional[pq.Statistics],
+                            start: Optional[Any], stop: Optional[Any]) -> bool:
+        if statistics is None or not statistics.has_min_max:
+            # Can't decide without statistics - read the row group.
+            return True
+        return ((start is None or statistics.max >= start)
+                and (stop is None or statistics.min <= stop))
+
+    @classmethod
+    def _pair_data_filename(cls, datadir: Path, pair: str, timeframe: str) -> Path:
+        pair_s = misc.pair_to_filename(pair)
+        filename = datadir.joinpath(f'{pair_s}-{timeframe}.parquet')
+        return filename
+
+    @classmethod
+    def _pair_trades_filename(cls, datadir: Path, pair: str) -> Path:
+        pair_s = misc.pair_to_filename(pair)
+        filename = datadir.joinpath(f'{pair_s}-trades.parquet')
+        return filename
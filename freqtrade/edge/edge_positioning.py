@@ -1,17 +1,19 @@
 # pragma pylint: disable=W0603
 """ Edge positioning package """
 import logging
+import time
 from collections import defaultdict
+from contextlib import nullcontext
 from copy import deepcopy
-from typing import Any, Dict, List, NamedTuple
+from threading import Event, Thread
+from typing import Any, Dict, List, NamedTuple, Optional
 
 import arrow
 import numpy as np
-import utils_find_1st as utf1st
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import DATETIME_PRINT_FORMAT, UNLIMITED_STAKE_AMOUNT
+from freqtrade.constants import DATETIME_PRINT_FORMAT, PROCESS_THROTTLE_SECS, UNLIMITED_STAKE_AMOUNT
 from freqtrade.data.history import get_timerange, load_data, refresh_data
 from freqtrade.enums import RunMode, SellType
 from freqtrade.exceptions import OperationalException
@@ -22,6 +24,9 @@ from freqtrade.strategy.interface import IStrategy
 
 logger = logging.getLogger(__name__)
 
+# Initial amount of candles scanned per step when searching for the candle hitting the stoploss
+STOPLOSS_SEARCH_WINDOW = 64
+
 
 class PairInfo(NamedTuple):
     stoploss: float
@@ -67,8 +72,16 @@ class Edge:
         self._allowed_risk: float = self.edge_config.get('allowed_risk')
         self._since_number_of_days: int = self.edge_config.get('calculate_since_number_of_days', 14)
         self._last_updated: int = 0  # Timestamp of pairs last updated time
+        self._last_calculation_duration: float = 0  # Seconds the last calculation took
         self._refresh_pairs = True
 
+        # Background calculation - see start_background_calculation()
+        self._calculation_thread: Optional[Thread] = None
+        self._calculation_pairs: Optional[List[str]] = None
+        self._calculation_requested = Event()
+        self._calculation_stopped = Event()
+        self._calculating = False
+
         self._stoploss_range_min = float(self.edge_config.get('stoploss_range_min', -0.01))
         self._stoploss_range_max = float(self.edge_config.get('stoploss_range_max', -0.05))
         self._stoploss_range_step = float(self.edge_config.get('stoploss_range_step', -0.001))
@@ -101,6 +114,7 @@ class Edge:
                 self._last_updated + heartbeat > arrow.utcnow().int_timestamp):
             return False
 
+        start = time.time()
         data: Dict[str, Any] = {}
         logger.info('Using stake_currency: %s ...', self.config['stake_currency'])
         logger.info('Using local backtesting data (using whitelist in given config) ...')
@@ -141,6 +155,7 @@ class Edge:
             timerange=self._timerange,
             startup_candles=self.strategy.startup_candle_count,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
+            load_jobs=self.config.get('load_jobs', 1),
         )
 
         if not data:
@@ -148,11 +163,10 @@ class Edge:
             self._cached_pairs = {}
             logger.critical("No data found. Edge is stopped ...")
             return False
-        # Fake run-mode to Edge
-        prior_rm = self.config['runmode']
-        self.config['runmode'] = RunMode.EDGE
-        preprocessed = self.strategy.advise_all_indicators(data)
-        self.config['runmode'] = prior_rm
+        # Fake run-mode to Edge - for this thread only, the bot may keep trading meanwhile.
+        with (self.strategy.dp._runmode_override(RunMode.EDGE) if self.strategy.dp
+              else nullcontext()):
+            preprocessed = self.strategy.advise_all_indicators(data)
 
         # Print timeframe
         min_date, max_date = get_timerange(preprocessed)
@@ -161,7 +175,7 @@ class Edge:
                     f'({(max_date - min_date).days} days)..')
         headers = ['date', 'buy', 'open', 'close', 'sell', 'high', 'low']
 
-        trades: list = []
+        trades: List[DataFrame] = []
         for pair, pair_data in preprocessed.items():
             # Sorting dataframe by date and reset index
             pair_data = pair_data.sort_values(by=['date'])
@@ -170,7 +184,10 @@ class Edge:
             df_analyzed = self.strategy.advise_sell(
                 self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair})[headers].copy()
 
-            trades += self._find_trades_for_stoploss_range(df_analyzed, pair, self._stoploss_range)
+            pair_trades = self._find_trades_for_stoploss_range(df_analyzed, pair,
+                                                               self._stoploss_range)
+            if not pair_trades.empty:
+                trades.append(pair_trades)
 
         # If no trade found then exit
         if len(trades) == 0:
@@ -178,27 +195,105 @@ class Edge:
             return False
 
         # Fill missing, calculable columns, profit, duration , abs etc.
-        trades_df = self._fill_calculable_fields(DataFrame(trades))
+        trades_df = self._fill_calculable_fields(concat(trades, ignore_index=True))
+        # Publish the new results at once - readers never see partial results.
         self._cached_pairs = self._process_expectancy(trades_df)
         self._last_updated = arrow.utcnow().int_timestamp
+        self._last_calculation_duration = time.time() - start
+        logger.info(f'Edge calculation took {self._last_calculation_duration:.2f}s.')
 
         return True
 
+    def refresh(self, pairs: List[str]) -> None:
+        """
+        Recalculate Edge for pairs once the configured process_throttle_secs passed.
+        Happens on the background thread if it was started - otherwise right away.
+        """
+        if self._calculation_thread is None:
+            self.calculate(pairs)
+            return
+        self._calculation_pairs = list(pairs)
+        self._calculation_requested.set()
+
+    def start_background_calculation(self) -> None:
+        """
+        Recalculate on a background thread from now on, so the bot can keep handling trades
+        while historic data is refreshed and analyzed.
+        The thread waits for the pairs passed to the first call to refresh().
+        """
+        if self._calculation_thread is not None:
+            return
+        self._calculation_stopped.clear()
+        self._calculation_thread = Thread(target=self._calculation_loop, name='edge',
+                                          daemon=True)
+        self._calculation_thread.start()
+
+    def stop_background_calculation(self) -> None:
+        """
+        Stop the background thread - waiting for a running calculation to finish.
+        """
+        if self._calculation_thread is None:
+            return
+        self._calculation_stopped.set()
+        self._calculation_requested.set()
+        self._calculation_thread.join()
+        self._calculation_thread = None
+
+    def _calculation_loop(self) -> None:
+        self._calculation_requested.wait()
+        while not self._calculation_stopped.is_set():
+            self._calculating = True
+            try:
+                self.calculate(self._calculation_pairs or [])
+            except Exception:
+                logger.exception('Edge calculation failed.')
+            finally:
+                self._calculating = False
+            self._calculation_stopped.wait(self._next_calculation_in())
+
+    def _next_calculation_in(self) -> float:
+        """
+        Seconds until the next calculation is due.
+        Failed calculations are retried on the bot's schedule.
+        """
+        retry = self.config.get('internals', {}).get('process_throttle_secs',
+                                                     PROCESS_THROTTLE_SECS)
+        due = (self._last_updated + self.edge_config.get('process_throttle_secs')
+               - arrow.utcnow().int_timestamp)
+        return max(due, retry)
+
+    def calculation_status(self) -> Dict[str, Any]:
+        """
+        Details about the currently used results.
+        """
+        last_updated = self._last_updated
+        return {
+            'calculating': self._calculating,
+            'last_calculated': (arrow.get(last_updated).strftime(DATETIME_PRINT_FORMAT)
+                                if last_updated else None),
+            'last_calculated_timestamp': last_updated * 1000 if last_updated else None,
+            'snapshot_age': (arrow.utcnow().int_timestamp - last_updated
+                             if last_updated else None),
+            'calculation_duration': round(self._last_calculation_duration, 3),
+        }
+
     def stake_amount(self, pair: str, free_capital: float,
                      total_capital: float, capital_in_trade: float) -> float:
+        # Results may be replaced by the background calculation at any time
+        cached_pairs = self._cached_pairs
         stoploss = self.stoploss(pair)
         available_capital = (total_capital + capital_in_trade) * self._capital_ratio
         allowed_capital_at_risk = available_capital * self._allowed_risk
         max_position_size = abs(allowed_capital_at_risk / stoploss)
         # Position size must be below available capital.
         position_size = min(min(max_position_size, free_capital), available_capital)
-        if pair in self._cached_pairs:
+        if pair in cached_pairs:
             logger.info(
                 'winrate: %s, expectancy: %s, position size: %s, pair: %s,'
                 ' capital in trade: %s, free capital: %s, total capital: %s,'
                 ' stoploss: %s, available capital: %s.',
-                self._cached_pairs[pair].winrate,
-                self._cached_pairs[pair].expectancy,
+                cached_pairs[pair].winrate,
+                cached_pairs[pair].expectancy,
                 position_size, pair,
                 capital_in_trade, free_capital, total_capital,
                 stoploss, available_capital
@@ -206,8 +301,9 @@ class Edge:
         return round(position_size, 15)
 
     def stoploss(self, pair: str) -> float:
-        if pair in self._cached_pairs:
-            return self._cached_pairs[pair].stoploss
+        info = self._cached_pairs.get(pair)
+        if info is not None:
+            return info.stoploss
         else:
             logger.warning(f'Tried to access stoploss of non-existing pair {pair}, '
                            'strategy stoploss is returned instead.')
@@ -382,104 +478,119 @@ class Edge:
         return final
 
     def _find_trades_for_stoploss_range(self, df, pair, stoploss_range):
-        buy_column = df['buy'].values
-        sell_column = df['sell'].values
+        """
+        Find the trades for every stoploss of stoploss_range.
+        Trades open on the candle after the first buy signal, and close at the stoploss or
+        on the candle after the next sell signal (whichever comes first). The next trade is
+        searched starting at the exit candle.
+        All stoplosses are simulated at once - every iteration finds the next trade for
+        each stoploss which still has trades left, using numpy arrays.
+        :return: Dataframe of trades, sorted by stoploss (in the order of stoploss_range)
+                 and open date.
+        """
+        buy_column = df['buy'].values == 1
+        sell_column = df['sell'].values == 1
         date_column = df['date'].values
         ohlc_columns = df[['open', 'high', 'low', 'close']].values
-
-        result: list = []
-        for stoploss in stoploss_range:
-            result += self._detect_next_stop_or_sell_point(
-                buy_column, sell_column, date_column, ohlc_columns, round(stoploss, 6), pair
-            )
-
-        return result
-
-    def _detect_next_stop_or_sell_point(self, buy_column, sell_column, date_column,
-                                        ohlc_columns, stoploss, pair):
+        open_column = ohlc_columns[:, 0]
+        low_column = ohlc_columns[:, 2]
+        length = len(df)
+
+        stoplosses = np.array([round(stoploss, 6) for stoploss in stoploss_range], dtype=float)
+        next_buy = self._next_signal_index(buy_column)
+        next_sell = self._next_signal_index(sell_column)
+
+        # Per stoploss: candle to search the next entry from
+        position = np.zeros(len(stoplosses), dtype=int)
+        pending = np.arange(len(stoplosses))
+        trade_parts = []
+        while pending.size:
+            # No entry found - or the entry signal is on the last candle
+            buy_index = next_buy[position[pending]]
+            has_entry = buy_index < length - 1
+            pending, buy_index = pending[has_entry], buy_index[has_entry]
+
+            # When a buy signal is seen, trade opens in reality on the next candle
+            open_index = buy_index + 1
+            open_price = open_column[open_index]
+            stop_price = open_price * (stoplosses[pending] + 1)
+            sell_index = next_sell[open_index]
+            # Stoploss is used if it's hit on (or before) the sell signal candle
+            stop_index = self._first_index_below(low_column, open_index,
+                                                 np.minimum(sell_index, length - 1), stop_price)
+
+            is_stop = stop_index < length
+            # If exit is SELL then we exit at the next candle (if there is one).
+            # Trades without exit are not interesting for Edge - and end the search.
+            is_sell = ~is_stop & (sell_index + 1 < length)
+            exit_index = np.where(is_stop, stop_index, sell_index + 1)
+            exit_price = np.where(is_stop, stop_price,
+                                  open_column[np.minimum(exit_index, length - 1)])
+
+            closed = is_stop | is_sell
+            trade_parts.append((pending[closed], open_index[closed], exit_index[closed],
+                                exit_price[closed], is_stop[closed]))
+            pending = pending[closed]
+            position[pending] = exit_index[closed]
+
+        if not trade_parts:
+            return DataFrame()
+        stoploss_idx, open_index, exit_index, exit_price, is_stop = (
+            np.concatenate(part) for part in zip(*trade_parts))
+        if not len(stoploss_idx):
+            return DataFrame()
+        # Trades of each stoploss are found in chronological order - keep it while sorting
+        order = np.argsort(stoploss_idx, kind='stable')
+        stoploss_idx, open_index, exit_index, exit_price, is_stop = (
+            stoploss_idx[order], open_index[order], exit_index[order], exit_price[order],
+            is_stop[order])
+
+        return DataFrame({
+            'pair': pair,
+            'stoploss': stoplosses[stoploss_idx],
+            'profit_ratio': '',
+            'profit_abs': '',
+            'open_date': date_column[open_index],
+            'close_date': date_column[exit_index],
+            'trade_duration': '',
+            'open_rate': np.round(open_column[open_index], 15),
+            'close_rate': np.round(exit_price, 15),
+            'exit_type': np.where(is_stop, SellType.STOP_LOSS, SellType.SELL_SIGNAL),
+        })
+
+    @staticmethod
+    def _next_signal_index(signal: np.ndarray) -> np.ndarray:
         """
-        Iterate through ohlc_columns in order to find the next trade
-        Next trade opens from the first buy signal noticed to
-        The sell or stoploss signal after it.
-        It then cuts OHLC, buy_column, sell_column and date_column.
-        Cut from (the exit trade index) + 1.
-
-        Author: https://github.com/mishaker
+        For every candle, get the index of the first candle (at or after it) with a signal.
+        :param signal: Boolean array of signals
+        :return: Array of indexes (len(signal) if there's no signal), with one more element
+                 (for the position after the last candle).
         """
+        length = len(signal)
+        index = np.where(signal, np.arange(length), length)
+        return np.append(np.minimum.accumulate(index[::-1])[::-1], length)
 
-        result: list = []
-        start_point = 0
-
-        while True:
-            open_trade_index = utf1st.find_1st(buy_column, 1, utf1st.cmp_equal)
-
-            # Return empty if we don't find trade entry (i.e. buy==1) or
-            # we find a buy but at the end of array
-            if open_trade_index == -1 or open_trade_index == len(buy_column) - 1:
-                break
-            else:
-                # When a buy signal is seen,
-                # trade opens in reality on the next candle
-                open_trade_index += 1
-
-            open_price = ohlc_columns[open_trade_index, 0]
-            stop_price = (open_price * (stoploss + 1))
-
-            # Searching for the index where stoploss is hit
-            stop_index = utf1st.find_1st(
-                ohlc_columns[open_trade_index:, 2], stop_price, utf1st.cmp_smaller)
-
-            # If we don't find it then we assume stop_index will be far in future (infinite number)
-            if stop_index == -1:
-                stop_index = float('inf')
-
-            # Searching for the index where sell is hit
-            sell_index = utf1st.find_1st(sell_column[open_trade_index:], 1, utf1st.cmp_equal)
-
-            # If we don't find it then we assume sell_index will be far in future (infinite number)
-            if sell_index == -1:
-                sell_index = float('inf')
-
-            # Check if we don't find any stop or sell point (in that case trade remains open)
-            # It is not interesting for Edge to consider it so we simply ignore the trade
-            # And stop iterating there is no more entry
-            if stop_index == sell_index == float('inf'):
-                break
-
-            if stop_index <= sell_index:
-                exit_index = open_trade_index + stop_index
-                exit_type = SellType.STOP_LOSS
-                exit_price = stop_price
-            elif stop_index > sell_index:
-                # If exit is SELL then we exit at the next candle
-                exit_index = open_trade_index + sell_index + 1
-
-                # Check if we have the next candle
-                if len(ohlc_columns) - 1 < exit_index:
-                    break
-
-                exit_type = SellType.SELL_SIGNAL
-                exit_price = ohlc_columns[exit_index, 0]
-
-            trade = {'pair': pair,
-                     'stoploss': stoploss,
-                     'profit_ratio': '',
-                     'profit_abs': '',
-                     'open_date': date_column[open_trade_index],
-                     'close_date': date_column[exit_index],
-                     'trade_duration': '',
-                     'open_rate': round(open_price, 15),
-                     'close_rate': round(exit_price, 15),
-                     'exit_type': exit_type
-                     }
-
-            result.append(trade)
-
-            # Giving a view of exit_index till the end of array
-            buy_column = buy_column[exit_index:]
-            sell_column = sell_column[exit_index:]
-            date_column = date_column[exit_index:]
-            ohlc_columns = ohlc_columns[exit_index:]
-            start_point += exit_index
-
+    @staticmethod
+    def _first_index_below(values: np.ndarray, start: np.ndarray, stop: np.ndarray,
+                           threshold: np.ndarray) -> np.ndarray:
+        """
+        For every query, find the first index between start and stop (both inclusive) where
+        values is below threshold. Candles are checked in windows of growing size.
+        :return: Array of indexes (len(values) if values don't drop below threshold).
+        """
+        length = len(values)
+        result = np.full(len(start), length)
+        pending = np.arange(len(start))
+        offset = 0
+        window = STOPLOSS_SEARCH_WINDOW
+        while pending.size:
+            index = start[pending, None] + offset + np.arange(window)
+            in_range = index <= stop[pending, None]
+            hit = (values[np.minimum(index, length - 1)] < threshold[pending, None]) & in_range
+            found = hit.any(axis=1)
+            result[pending[found]] = index[found, hit[found].argmax(axis=1)]
+            # Stop searching once found, or once the search range is exhausted
+            pending = pending[~found & in_range[:, -1]]
+            offset += window
+            window *= 2
         return result
@@ -6,10 +6,13 @@ import asyncio
 import http
 import inspect
 import logging
+import time
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import ceil
-from typing import Any, Dict, List, Optional, Tuple
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import arrow
 import ccxt
@@ -71,6 +74,7 @@ class Exchange:
         "trades_pagination_arg": "since",
         "l2_limit_range": None,
         "l2_limit_range_required": True,  # Allow Empty L2 limit (kucoin)
+        "order_fetch_concurrency": 10,  # Max. concurrent requests fetching open orders
     }
     _ft_has: Dict = {}
 
@@ -83,6 +87,10 @@ class Exchange:
         self._api: ccxt.Exchange = None
         self._api_async: ccxt_async.Exchange = None
         self._markets: Dict = {}
+        # Async calls may also be issued from other threads (Edge recalculating in the
+        # background) - all of them run on this loop, one call at a time.
+        self.loop = asyncio.get_event_loop()
+        self._loop_lock = Lock()
 
         self._config.update(config)
 
@@ -98,6 +106,8 @@ class Exchange:
         # refreshed once every iteration.
         self._sell_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=1800)
         self._buy_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=1800)
+        # Pricing stages (per side) - see prefetched_rates()
+        self._rate_prefetch: Dict[str, Dict[str, Any]] = {}
 
         # Holds candles
         self._klines: Dict[Tuple[str, str], DataFrame] = {}
@@ -168,10 +178,21 @@ class Exchange:
         """
         self.close()
 
+    def __getstate__(self):
+        # ccxt instances can't be pickled. Worker processes (hyperopt, parallel backtesting)
+        # only rely on already loaded markets.
+        state = self.__dict__.copy()
+        state['_api'] = None
+        state['_api_async'] = None
+        state['loop'] = None
+        state['_loop_lock'] = None
+        return state
+
     def close(self):
         logger.debug("Exchange object destroyed, closing async loop")
         if self._api_async and inspect.iscoroutinefunction(self._api_async.close):
-            asyncio.get_event_loop().run_until_complete(self._api_async.close())
+            with self._loop_lock:
+                self.loop.run_until_complete(self._api_async.close())
 
     def _init_ccxt(self, exchange_config: Dict[str, Any], ccxt_module: CcxtModuleType = ccxt,
                    ccxt_kwargs: Dict = {}) -> ccxt.Exchange:
@@ -326,8 +347,8 @@ class Exchange:
     def _load_async_markets(self, reload: bool = False) -> None:
         try:
             if self._api_async:
-                asyncio.get_event_loop().run_until_complete(
-                    self._api_async.load_markets(reload=reload))
+                with self._loop_lock:
+                    self.loop.run_until_complete(self._api_async.load_markets(reload=reload))
 
         except (asyncio.TimeoutError, ccxt.BaseError) as e:
             logger.warning('Could not load async markets. Reason: %s', e)
@@ -829,6 +850,75 @@ class Exchange:
             return self.fetch_stoploss_order(order_id, pair)
         return self.fetch_order(order_id, pair)
 
+    def fetch_orders_or_stoploss_orders(self, orders: List[Tuple[str, str, bool]]
+                                        ) -> List[Union[Dict, ExchangeError]]:
+        """
+        Fetch multiple orders - concurrently, using the async api.
+        At most _ft_has['order_fetch_concurrency'] requests are sent at the same time.
+        Single orders, dry-run orders and stoploss orders of exchanges using a custom
+        fetch_stoploss_order() are fetched one by one.
+        :param orders: List of (order_id, pair, stoploss_order)
+        :return: List of orders in the same sequence as the input - containing the
+            ExchangeError instead for orders which could not be fetched.
+        """
+        results: List[Union[Dict, ExchangeError]] = [{}] * len(orders)
+        concurrent: List[int] = []
+        custom_stoploss = type(self).fetch_stoploss_order is not Exchange.fetch_stoploss_order
+        for idx, (order_id, pair, stoploss_order) in enumerate(orders):
+            if len(orders) > 1 and not self._config['dry_run'] and not (
+                    stoploss_order and custom_stoploss):
+                concurrent.append(idx)
+                continue
+            try:
+                results[idx] = self.fetch_order_or_stoploss_order(order_id, pair, stoploss_order)
+            except ExchangeError as e:
+                results[idx] = e
+
+        if concurrent:
+            with self._loop_lock:
+                fetched = self.loop.run_until_complete(self._async_fetch_orders(
+                    [(orders[idx][0], orders[idx][1]) for idx in concurrent]))
+            for idx, res in zip(concurrent, fetched):
+                if isinstance(res, BaseException) and not isinstance(res, ExchangeError):
+                    raise res
+                results[idx] = res
+        return results
+
+    async def _async_fetch_orders(self, orders: List[Tuple[str, str]]) -> List:
+        """
+        Fetch orders with bounded concurrency.
+        :return: List of orders or raised exceptions, as returned by asyncio.gather()
+        """
+        # Create the semaphore within the loop it's used in
+        semaphore = asyncio.Semaphore(self._ft_has['order_fetch_concurrency'])
+
+        async def fetch(order_id: str, pair: str) -> Dict:
+            async with semaphore:
+                return await self._async_fetch_order(order_id, pair)
+
+        return await asyncio.gather(*[fetch(order_id, pair) for order_id, pair in orders],
+                                    return_exceptions=True)
+
+    @retrier_async(retries=API_FETCH_ORDER_RETRY_COUNT)
+    async def _async_fetch_order(self, order_id: str, pair: str) -> Dict:
+        try:
+            order = await self._api_async.fetch_order(order_id, pair)
+            self._log_exchange_response('fetch_order', order)
+            return order
+        except ccxt.OrderNotFound as e:
+            raise RetryableOrderError(
+                f'Order not found (pair: {pair} id: {order_id}). Message: {e}') from e
+        except ccxt.InvalidOrder as e:
+            raise InvalidOrderException(
+                f'Tried to get an invalid order (pair: {pair} id: {order_id}). Message: {e}') from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f'Could not get order due to {e.__class__.__name__}. Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
     def check_order_canceled_empty(self, order: Dict) -> bool:
         """
         Verify if an order has been cancelled without being partially filled
@@ -1051,7 +1141,8 @@ class Exchange:
         if conf_strategy.get('use_order_book', False) and ('use_order_book' in conf_strategy):
 
             order_book_top = conf_strategy.get('order_book_top', 1)
-            order_book = self.fetch_l2_order_book(pair, order_book_top)
+            order_book = (self._get_prefetched_rate_data(pair, side)
+                          or self.fetch_l2_order_book(pair, order_book_top))
             logger.debug('order_book %s', order_book)
             # top 1 = index 0
             try:
@@ -1067,7 +1158,7 @@ class Exchange:
                          f"side - top {order_book_top} order book {side} rate {rate:.8f}")
         else:
             logger.debug(f"Using Last {conf_strategy['price_side'].capitalize()} / Last Price")
-            ticker = self.fetch_ticker(pair)
+            ticker = self._get_prefetched_rate_data(pair, side) or self.fetch_ticker(pair)
             ticker_rate = ticker[conf_strategy['price_side']]
             if ticker['last'] and ticker_rate:
                 if side == 'buy' and ticker_rate > ticker['last']:
@@ -1084,6 +1175,128 @@ class Exchange:
 
         return rate
 
+    @contextmanager
+    def prefetched_rates(self, pairs: List[str], side: str,
+                         concurrent: bool = True) -> Iterator[None]:
+        """
+        Pricing stage: within this context, get_rate() serves tickers / order books for pairs
+        which were fetched in one go - using fetch_tickers where supported,
+        otherwise using concurrent requests.
+        Fetching happens on the first get_rate() call for one of the pairs - so stages
+        which don't need any rate don't cause any request.
+        :param pairs: Pairs rates may be needed for
+        :param side: "buy" or "sell"
+        :param concurrent: Allow concurrent requests (one per pair) if fetch_tickers can't
+            be used. Otherwise, rates are only prefetched if one request covers all pairs.
+        """
+        # Fetching one pair in one go wouldn't gain anything
+        if len(set(pairs)) > 1:
+            self._rate_prefetch[side] = {'pairs': set(pairs), 'concurrent': concurrent,
+                                         'data': None}
+        try:
+            yield
+        finally:
+            self._rate_prefetch.pop(side, None)
+
+    def _get_prefetched_rate_data(self, pair: str, side: str) -> Optional[Dict]:
+        """
+        Ticker / order book for this pair from the current pricing stage.
+        :return: None if the pair is not part of a pricing stage, or could not be prefetched
+        """
+        prefetch = self._rate_prefetch.get(side)
+        if not prefetch or pair not in prefetch['pairs']:
+            return None
+        if prefetch['data'] is None:
+            prefetch['data'] = self._prefetch_rate_data(
+                sorted(prefetch['pairs']), side, prefetch['concurrent'])
+        return prefetch['data'].get(pair)
+
+    def _prefetch_rate_data(self, pairs: List[str], side: str,
+                            concurrent: bool) -> Dict[str, Dict]:
+        """
+        Fetch the data get_rate() needs for all pairs.
+        Pairs which fail are omitted - get_rate() falls back to fetching them on their own.
+        :return: Dict of pair: ticker (or order book, if configured for this side)
+        """
+        conf_strategy = self._config.get('bid_strategy' if side == 'buy' else 'ask_strategy', {})
+        start = time.time()
+        data: Dict[str, Dict] = {}
+        if conf_strategy.get('use_order_book', False):
+            if not concurrent:
+                return data
+            method = 'order books'
+            limit = conf_strategy.get('order_book_top', 1)
+            data = self._fetch_concurrent(
+                [self._async_fetch_l2_order_book(pair, limit) for pair in pairs])
+        elif self.exchange_has('fetchTickers'):
+            method = 'fetch_tickers'
+            try:
+                tickers = self.get_tickers()
+            except (ExchangeError, OperationalException) as e:
+                logger.warning(f"Could not prefetch {side} rates: {e}")
+                tickers = {}
+            price_side = conf_strategy.get('price_side')
+            data = {pair: tickers[pair] for pair in pairs
+                    # Not all exchanges provide bid / ask with fetch_tickers
+                    if pair in tickers and tickers[pair].get(price_side)
+                    and self.markets.get(pair, {}).get('active', False)}
+        elif concurrent:
+            method = 'tickers'
+            data = self._fetch_concurrent([self._async_fetch_ticker(pair) for pair in pairs
+                                           if self.markets.get(pair, {}).get('active', False)])
+        else:
+            return data
+        logger.debug(f"Fetched {side} rates for {len(data)} of {len(pairs)} pairs "
+                     f"in {time.time() - start:.3f}s ({method}).")
+        return data
+
+    def _fetch_concurrent(self, input_coroutines: List) -> Dict[str, Dict]:
+        """
+        Run coroutines returning (pair, data) concurrently.
+        :return: Dict of pair: data - failed requests are omitted
+        """
+        with self._loop_lock:
+            results = self.loop.run_until_complete(
+                asyncio.gather(*input_coroutines, return_exceptions=True))
+        data = {}
+        for res in results:
+            if isinstance(res, Exception):
+                logger.warning("Async code raised an exception: %s", res.__class__.__name__)
+                continue
+            pair, pair_data = res
+            data[pair] = pair_data
+        return data
+
+    @retrier_async
+    async def _async_fetch_ticker(self, pair: str) -> Tuple[str, Dict]:
+        try:
+            return pair, await self._api_async.fetch_ticker(pair)
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f'Could not load ticker due to {e.__class__.__name__}. Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    @retrier_async
+    async def _async_fetch_l2_order_book(self, pair: str, limit: int) -> Tuple[str, Dict]:
+        limit1 = self.get_next_limit_in_list(limit, self._ft_has['l2_limit_range'],
+                                             self._ft_has['l2_limit_range_required'])
+        try:
+            return pair, await self._api_async.fetch_l2_order_book(pair, limit1)
+        except ccxt.NotSupported as e:
+            raise OperationalException(
+                f'Exchange {self._api.name} does not support fetching order book.'
+                f'Message: {e}') from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f'Could not get order book due to {e.__class__.__name__}. Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
     # Fee handling
 
     @retrier
@@ -1218,9 +1431,10 @@ class Exchange:
         :param since_ms: Timestamp in milliseconds to get history from
         :return: List with candle (OHLCV) data
         """
-        pair, timeframe, data = asyncio.get_event_loop().run_until_complete(
-            self._async_get_historic_ohlcv(pair=pair, timeframe=timeframe,
-                                           since_ms=since_ms, is_new_pair=is_new_pair))
+        with self._loop_lock:
+            pair, timeframe, data = self.loop.run_until_complete(
+                self._async_get_historic_ohlcv(pair=pair, timeframe=timeframe,
+                                               since_ms=since_ms, is_new_pair=is_new_pair))
         logger.info(f"Downloaded data for {pair} with length {len(data)}.")
         return data
 
@@ -1317,8 +1531,9 @@ class Exchange:
                 )
                 cached_pairs.append((pair, timeframe))
 
-        results = asyncio.get_event_loop().run_until_complete(
-            asyncio.gather(*input_coroutines, return_exceptions=True))
+        with self._loop_lock:
+            results = self.loop.run_until_complete(
+                asyncio.gather(*input_coroutines, return_exceptions=True))
 
         results_df = {}
         # handle caching
@@ -1554,9 +1769,10 @@ class Exchange:
         if not self.exchange_has("fetchTrades"):
             raise OperationalException("This exchange does not support downloading Trades.")
 
-        return asyncio.get_event_loop().run_until_complete(
-            self._async_get_trade_history(pair=pair, since=since,
-                                          until=until, from_id=from_id))
+        with self._loop_lock:
+            return self.loop.run_until_complete(
+                self._async_get_trade_history(pair=pair, since=since,
+                                              until=until, from_id=from_id))
 
 
 def is_exchange_known_ccxt(exchange_name: str, ccxt_module: CcxtModuleType = None) -> bool:
@@ -7,7 +7,7 @@ import traceback
 from datetime import datetime, timezone
 from math import isclose
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import arrow
 
@@ -29,6 +29,7 @@ from freqtrade.resolvers import ExchangeResolver, StrategyResolver
 from freqtrade.rpc import RPCManager
 from freqtrade.strategy.interface import IStrategy, SellCheckTuple
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
+from freqtrade.timings import Timings
 from freqtrade.wallets import Wallets
 
 
@@ -100,6 +101,8 @@ class FreqtradeBot(LoggingMixin):
 
         # Protect sell-logic from forcesell and vice versa
         self._exit_lock = Lock()
+        # Duration of the stages of process() - and of whole iterations (see Worker)
+        self.loop_timings = Timings()
         LoggingMixin.__init__(self, logger, timeframe_to_seconds(self.strategy.timeframe))
 
     def notify_status(self, msg: str) -> None:
@@ -124,6 +127,9 @@ class FreqtradeBot(LoggingMixin):
 
         self.check_for_open_trades()
 
+        if self.edge:
+            self.edge.stop_background_calculation()
+
         self.rpc.cleanup()
         cleanup_db()
 
@@ -136,6 +142,8 @@ class FreqtradeBot(LoggingMixin):
         if not self.edge:
             # Adjust stoploss if it was changed
             Trade.stoploss_reinitialization(self.strategy.stoploss)
+        else:
+            self.edge.start_background_calculation()
 
         # Only update open orders on startup
         # This will update the database after the initial migration
@@ -149,40 +157,63 @@ class FreqtradeBot(LoggingMixin):
         """
 
         # Check whether markets have to be reloaded and reload them when it's needed
-        self.exchange.reload_markets()
+        with self.loop_timings.measure('reload_markets'):
+            self.exchange.reload_markets()
 
         self.update_closed_trades_without_assigned_fees()
 
         # Query trades from persistence layer
         trades = Trade.get_open_trades()
 
-        self.active_pair_whitelist = self._refresh_active_whitelist(trades)
+        with self.loop_timings.measure('refresh_whitelist'):
+            self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
         # Refreshing candles
-        self.dataprovider.refresh(self.pairlists.create_pair_list(self.active_pair_whitelist),
-                                  self.strategy.gather_informative_pairs())
+        with self.loop_timings.measure('refresh_candles'):
+            self.dataprovider.refresh(self.pairlists.create_pair_list(self.active_pair_whitelist),
+                                      self.strategy.gather_informative_pairs())
 
         strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
 
-        self.strategy.analyze(self.active_pair_whitelist)
+        with self.loop_timings.measure('analyze'):
+            self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
-            # Check and handle any timed out open orders
+        # Check and handle any timed out open orders
+        with self.loop_timings.measure('check_handle_timedout'):
             self.check_handle_timedout()
 
         # Protect from collisions with forcesell.
         # Without this, freqtrade my try to recreate stoploss_on_exchange orders
         # while selling is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
+        with self._exit_lock, self.loop_timings.measure('exit_positions'):
             trades = Trade.get_open_trades()
             # First process current opened trades (positions)
             self.exit_positions(trades)
 
         # Then looking for buy opportunities
         if self.get_free_open_trades():
-            self.enter_positions()
+            with self.loop_timings.measure('enter_positions'):
+                self.enter_positions()
 
-        Trade.commit()
+        with self.loop_timings.measure('commit'):
+            Trade.commit()
+
+    def process_housekeeping(self) -> None:
+        """
+        Lightweight iteration, used between candles with internals.candle_sync.
+        Handles open orders and exits of open trades (stoploss, ROI, stoploss on exchange),
+        without refreshing candles, analyzing pairs or entering new trades.
+        """
+        # Check and handle any timed out open orders
+        with self.loop_timings.measure('check_handle_timedout'):
+            self.check_handle_timedout()
+
+        with self._exit_lock, self.loop_timings.measure('exit_positions'):
+            trades = Trade.get_open_trades()
+            self.exit_positions(trades)
+
+        with self.loop_timings.measure('commit'):
+            Trade.commit()
 
     def process_stopped(self) -> None:
         """
@@ -221,7 +252,7 @@ class FreqtradeBot(LoggingMixin):
 
         # Calculating Edge positioning
         if self.edge:
-            self.edge.calculate(_whitelist)
+            self.edge.refresh(_whitelist)
             _whitelist = self.edge.adjust(_whitelist)
 
         if trades:
@@ -249,16 +280,20 @@ class FreqtradeBot(LoggingMixin):
 
         orders = Order.get_open_orders()
         logger.info(f"Updating {len(orders)} open orders.")
-        for order in orders:
-            try:
-                fo = self.exchange.fetch_order_or_stoploss_order(order.order_id, order.ft_pair,
-                                                                 order.ft_order_side == 'stoploss')
+        fetched = self.exchange.fetch_orders_or_stoploss_orders(
+            [(order.order_id, order.ft_pair, order.ft_order_side == 'stoploss')
+             for order in orders])
+        with self._exit_lock:
+            for order, fo in zip(orders, fetched):
+                try:
+                    if isinstance(fo, ExchangeError):
+                        raise fo
 
-                self.update_trade_state(order.trade, order.order_id, fo)
+                    self.update_trade_state(order.trade, order.order_id, fo)
 
-            except ExchangeError as e:
+                except ExchangeError as e:
 
-                logger.warning(f"Error updating Order {order.order_id} due to {e}")
+                    logger.warning(f"Error updating Order {order.order_id} due to {e}")
 
     def update_closed_trades_without_assigned_fees(self):
         """
@@ -378,12 +413,15 @@ class FreqtradeBot(LoggingMixin):
             else:
                 self.log_once("Global pairlock active. Not creating new trades.", logger.info)
             return trades_created
-        # Create entity and execute trade for each pair from whitelist
-        for pair in whitelist:
-            try:
-                trades_created += self.create_trade(pair)
-            except DependencyException as exception:
-                logger.warning('Unable to create trade for %s: %s', pair, exception)
+        # Create entity and execute trade for each pair from whitelist.
+        # Only pairs with a buy signal need a rate - so rates are only prefetched
+        # if one request covers all pairs.
+        with self.exchange.prefetched_rates(whitelist, side='buy', concurrent=False):
+            for pair in whitelist:
+                try:
+                    trades_created += self.create_trade(pair)
+                except DependencyException as exception:
+                    logger.warning('Unable to create trade for %s: %s', pair, exception)
 
         if not trades_created:
             logger.debug("Found no buy signals for whitelisted currencies. Trying again...")
@@ -669,20 +707,24 @@ class FreqtradeBot(LoggingMixin):
         Tries to execute sell orders for open trades (positions)
         """
         trades_closed = 0
-        for trade in trades:
-            try:
+        # Fetch sell rates for all trades handled below in one go
+        pairs = [trade.pair for trade in trades if trade.open_order_id is None]
+        with self.exchange.prefetched_rates(pairs, side='sell'):
+            for trade in trades:
+                try:
 
-                if (self.strategy.order_types.get('stoploss_on_exchange') and
-                        self.handle_stoploss_on_exchange(trade)):
-                    trades_closed += 1
-                    Trade.commit()
-                    continue
-                # Check if we can sell our current pair
-                if trade.open_order_id is None and trade.is_open and self.handle_trade(trade):
-                    trades_closed += 1
+                    if (self.strategy.order_types.get('stoploss_on_exchange') and
+                            self.handle_stoploss_on_exchange(trade)):
+                        trades_closed += 1
+                        Trade.commit()
+                        continue
+                    # Check if we can sell our current pair
+                    if (trade.open_order_id is None and trade.is_open
+                            and self.handle_trade(trade)):
+                        trades_closed += 1
 
-            except DependencyException as exception:
-                logger.warning('Unable to sell trade %s: %s', trade.pair, exception)
+                except DependencyException as exception:
+                    logger.warning('Unable to sell trade %s: %s', trade.pair, exception)
 
         # Updating wallets if any trade occurred
         if trades_closed:
@@ -889,45 +931,59 @@ class FreqtradeBot(LoggingMixin):
     def check_handle_timedout(self) -> None:
         """
         Check if any orders are timed out and cancel if necessary
+        Order states are fetched concurrently - and handled one trade at a time,
+        holding the exit lock.
         :param timeoutvalue: Number of minutes until order is considered timed out
         :return: None
         """
+        order_ids = [(trade.open_order_id, trade.pair) for trade
+                     in Trade.get_open_order_trades() if trade.open_order_id]
+        orders = self.exchange.fetch_orders_or_stoploss_orders(
+            [(order_id, pair, False) for order_id, pair in order_ids])
+        fetched = {order_id: order for (order_id, _), order in zip(order_ids, orders)}
 
-        for trade in Trade.get_open_order_trades():
-            try:
-                if not trade.open_order_id:
+        with self._exit_lock:
+            for trade in Trade.get_open_order_trades():
+                # Orders placed or cancelled (e.g. by forcesell) while fetching
+                # are handled in the next iteration.
+                if trade.open_order_id not in fetched:
                     continue
-                order = self.exchange.fetch_order(trade.open_order_id, trade.pair)
-            except (ExchangeError):
-                logger.info('Cannot query order for %s due to %s', trade, traceback.format_exc())
-                continue
+                self._handle_timedout_order(trade, fetched[trade.open_order_id])
 
-            fully_cancelled = self.update_trade_state(trade, trade.open_order_id, order)
-
-            if (order['side'] == 'buy' and (order['status'] == 'open' or fully_cancelled) and (
-                    fully_cancelled
-                    or self._check_timed_out('buy', order)
-                    or strategy_safe_wrapper(self.strategy.check_buy_timeout,
-                                             default_retval=False)(pair=trade.pair,
-                                                                   trade=trade,
-                                                                   order=order))):
-                self.handle_cancel_enter(trade, order, constants.CANCEL_REASON['TIMEOUT'])
-
-            elif (order['side'] == 'sell' and (order['status'] == 'open' or fully_cancelled) and (
-                  fully_cancelled
-                  or self._check_timed_out('sell', order)
-                  or strategy_safe_wrapper(self.strategy.check_sell_timeout,
-                                           default_retval=False)(pair=trade.pair,
-                                                                 trade=trade,
-                                                                 order=order))):
-                self.handle_cancel_exit(trade, order, constants.CANCEL_REASON['TIMEOUT'])
-                canceled_count = trade.get_exit_order_count()
-                max_timeouts = self.config.get('unfilledtimeout', {}).get('exit_timeout_count', 0)
-                if max_timeouts > 0 and canceled_count >= max_timeouts:
-                    logger.warning(f'Emergencyselling trade {trade}, as the sell order '
-                                   f'timed out {max_timeouts} times.')
-                    self.execute_trade_exit(trade, order.get('price'), sell_reason=SellCheckTuple(
-                        sell_type=SellType.EMERGENCY_SELL))
+    def _handle_timedout_order(self, trade: Trade, order: Union[Dict, ExchangeError]) -> None:
+        """
+        Update the trade from the fetched order - and cancel the order if it timed out.
+        """
+        if isinstance(order, ExchangeError):
+            logger.info('Cannot query order for %s due to %s', trade, ''.join(
+                traceback.format_exception(type(order), order, order.__traceback__)))
+            return
+        fully_cancelled = self.update_trade_state(trade, trade.open_order_id, order)
+
+        if (order['side'] == 'buy' and (order['status'] == 'open' or fully_cancelled) and (
+                fully_cancelled
+                or self._check_timed_out('buy', order)
+                or strategy_safe_wrapper(self.strategy.check_buy_timeout,
+                                         default_retval=False)(pair=trade.pair,
+                                                               trade=trade,
+                                                               order=order))):
+            self.handle_cancel_enter(trade, order, constants.CANCEL_REASON['TIMEOUT'])
+
+        elif (order['side'] == 'sell' and (order['status'] == 'open' or fully_cancelled) and (
+              fully_cancelled
+              or self._check_timed_out('sell', order)
+              or strategy_safe_wrapper(self.strategy.check_sell_timeout,
+                                       default_retval=False)(pair=trade.pair,
+                                                             trade=trade,
+                                                             order=order))):
+            self.handle_cancel_exit(trade, order, constants.CANCEL_REASON['TIMEOUT'])
+            canceled_count = trade.get_exit_order_count()
+            max_timeouts = self.config.get('unfilledtimeout', {}).get('exit_timeout_count', 0)
+            if max_timeouts > 0 and canceled_count >= max_timeouts:
+                logger.warning(f'Emergencyselling trade {trade}, as the sell order '
+                               f'timed out {max_timeouts} times.')
+                self.execute_trade_exit(trade, order.get('price'), sell_reason=SellCheckTuple(
+                    sell_type=SellType.EMERGENCY_SELL))
 
     def cancel_all_open_orders(self) -> None:
         """
@@ -3,12 +3,17 @@
 """
 This module contains the backtesting logic
 """
+import heapq
 import logging
+import time
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+import pandas as pd
+from cachetools import LRUCache
 from pandas import DataFrame
 
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -22,8 +27,10 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.indicator_cache import IndicatorCache
 from freqtrade.optimize.optimize_reports import (generate_backtest_stats, show_backtest_results,
                                                  store_backtest_stats)
+from freqtrade.optimize.trade_slots import TradeSlots
 from freqtrade.persistence import LocalTrade, PairLocks, Trade
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
@@ -46,6 +53,20 @@ HIGH_IDX = 6
 BUY_TAG_IDX = 7
 EXIT_TAG_IDX = 8
 
+# Every change to this headers list must evaluate further usages of the resulting tuple
+# and eventually change the constants for indexes above
+HEADERS = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high', 'buy_tag', 'exit_tag']
+# Columns depending on buy / sell parameters - the only columns kept in the signal cache
+SIGNAL_COLUMNS = ['buy', 'sell', 'buy_tag', 'exit_tag']
+
+# Rate columns of detail candles - buy / sell signals are taken from the regular candle
+DETAIL_HEADERS = ['open', 'close', 'low', 'high']
+
+# Tolerance used by the vectorized engine to hand borderline candles to the regular sell logic
+VECTORIZED_TOLERANCE = 1e-6
+# Initial amount of candles scanned per step when searching for the next sell candidate
+VECTORIZED_WINDOW = 64
+
 
 class Backtesting:
     """
@@ -61,6 +82,12 @@ class Backtesting:
         LoggingMixin.show_output = False
         self.config = config
         self.results: Optional[Dict[str, Any]] = None
+        # Optional cache for analyzed signal dataframes (assigned by hyperopt)
+        self.signal_cache: Optional[LRUCache] = None
+        self.signal_cache_hits = 0
+        self.signal_cache_misses = 0
+        # Indicators populated while loading data, as (strategy, data) tuple
+        self._preprocessed: Optional[Tuple[IStrategy, Dict[str, DataFrame]]] = None
 
         config['dry_run'] = True
         self.strategylist: List[IStrategy] = []
@@ -139,6 +166,8 @@ class Backtesting:
         else:
             self.timeframe_detail_min = 0
         self.detail_data: Dict[str, DataFrame] = {}
+        # Detail data converted for fast lookups, per pair: (source dataframe, dates, rates)
+        self._detail_index: Dict[str, Tuple[DataFrame, np.ndarray, np.ndarray]] = {}
 
     def init_backtest(self):
 
@@ -161,6 +190,27 @@ class Backtesting:
         # since a "perfect" stoploss-sell is assumed anyway
         # And the regular "stoploss" function would not apply to that case
         self.strategy.order_types['stoploss_on_exchange'] = False
+        self.use_vectorized = self._vectorized_engine_available()
+
+    def _vectorized_engine_available(self) -> bool:
+        """
+        Check if the vectorized engine has been selected and can be used with the current
+        strategy. Sell-callbacks can't be evaluated on arrays, so these need the regular loop.
+        """
+        if self.config.get('backtest_engine', 'loop') != 'vectorized':
+            return False
+        reason = ''
+        if self.timeframe_detail:
+            reason = 'timeframe_detail is used'
+        elif self.strategy.use_custom_stoploss:
+            reason = 'strategy uses custom_stoploss'
+        elif type(self.strategy).custom_sell is not IStrategy.custom_sell:
+            reason = 'strategy implements custom_sell'
+        if reason:
+            logger.info(f"Vectorized backtest engine not available ({reason}), "
+                        "falling back to the loop engine.")
+            return False
+        return True
 
     def _load_protections(self, strategy: IStrategy):
         if self.config.get('enable_protections', False):
@@ -177,15 +227,21 @@ class Backtesting:
         """
         self.progress.init_step(BacktestState.DATALOAD, 1)
 
-        data = history.load_data(
-            datadir=self.config['datadir'],
-            pairs=self.pairlists.whitelist,
-            timeframe=self.timeframe,
-            timerange=self.timerange,
-            startup_candles=self.required_startup,
-            fail_without_data=True,
-            data_format=self.config.get('dataformat_ohlcv', 'json'),
-        )
+        load_jobs = self.config.get('load_jobs', 1)
+        if (load_jobs != 1 and len(self.strategylist) == 1
+                and self.config.get('indicator_jobs', 1) == 1):
+            data = self._load_bt_data_and_advise_indicators(load_jobs)
+        else:
+            data = history.load_data(
+                datadir=self.config['datadir'],
+                pairs=self.pairlists.whitelist,
+                timeframe=self.timeframe,
+                timerange=self.timerange,
+                startup_candles=self.required_startup,
+                fail_without_data=True,
+                data_format=self.config.get('dataformat_ohlcv', 'json'),
+                load_jobs=load_jobs,
+            )
 
         min_date, max_date = history.get_timerange(data)
 
@@ -200,6 +256,80 @@ class Backtesting:
         self.progress.set_new_value(1)
         return data, self.timerange
 
+    def _load_bt_data_and_advise_indicators(self, load_jobs: int) -> Dict[str, DataFrame]:
+        """
+        Load backtest data using parallel load jobs, populating indicators for pairs which
+        finished loading while the remaining pairs are still loading.
+        Populated indicators are kept for advise_all_indicators().
+        :return: Loaded data (not containing indicators)
+        """
+        strategy = self.strategylist[0]
+        strategy.dp = self.dataprovider
+        cache = self._get_indicator_cache(strategy)
+        start = time.perf_counter()
+        loaded: Dict[str, DataFrame] = {}
+        analyzed: Dict[str, DataFrame] = {}
+        durations: Dict[str, float] = {}
+        for pair, pair_data in history.load_data_lazy(
+                datadir=self.config['datadir'],
+                pairs=self.pairlists.whitelist,
+                timeframe=self.timeframe,
+                timerange=self.timerange,
+                startup_candles=self.required_startup,
+                data_format=self.config.get('dataformat_ohlcv', 'json'),
+                load_jobs=load_jobs):
+            loaded[pair] = pair_data
+            dataframe = cache.get(pair, pair_data) if cache else None
+            if dataframe is None:
+                dataframe, durations[pair] = strategy._advise_pair_indicators(pair, pair_data)
+                if cache:
+                    cache.store(pair, pair_data, dataframe)
+            analyzed[pair] = dataframe
+
+        if not loaded:
+            raise OperationalException("No data found. Terminating.")
+        pairs = [pair for pair in self.pairlists.whitelist if pair in loaded]
+        if durations:
+            strategy._log_indicator_durations(
+                {pair: durations[pair] for pair in pairs if pair in durations},
+                time.perf_counter() - start)
+        if cache:
+            self._finish_indicator_cache(cache)
+        self._preprocessed = (strategy, {pair: analyzed[pair] for pair in pairs})
+        return {pair: loaded[pair] for pair in pairs}
+
+    def advise_all_indicators(self, data: Dict[str, DataFrame]) -> Dict[str, DataFrame]:
+        """
+        Populate indicators for the current strategy - reusing indicators populated while
+        loading the data (see load_bt_data()) if available.
+        """
+        preprocessed, self._preprocessed = self._preprocessed, None
+        if (preprocessed is not None and preprocessed[0] is self.strategy
+                and list(preprocessed[1]) == list(data)):
+            return preprocessed[1]
+
+        cache = self._get_indicator_cache(self.strategy)
+        if not cache:
+            return self.strategy.advise_all_indicators(data)
+
+        cached = {pair: cache.get(pair, pair_data) for pair, pair_data in data.items()}
+        missing = {pair: pair_data for pair, pair_data in data.items() if cached[pair] is None}
+        analyzed = self.strategy.advise_all_indicators(missing) if missing else {}
+        for pair, pair_data in missing.items():
+            cache.store(pair, pair_data, analyzed[pair])
+        self._finish_indicator_cache(cache)
+        return {pair: analyzed[pair] if pair in missing else cached[pair] for pair in data}
+
+    def _get_indicator_cache(self, strategy: IStrategy) -> Optional[IndicatorCache]:
+        if not self.config.get('indicator_cache', False):
+            return None
+        return IndicatorCache(self.config, strategy)
+
+    def _finish_indicator_cache(self, cache: IndicatorCache) -> None:
+        logger.info(f"Loaded indicators for {cache.hits} of {cache.hits + cache.misses} pairs "
+                    "from the indicator cache.")
+        cache.evict()
+
     def load_bt_data_detail(self) -> None:
         """
         Loads backtest detail data (smaller timeframe) if necessary.
@@ -213,6 +343,7 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
+                load_jobs=self.config.get('load_jobs', 1),
             )
         else:
             self.detail_data = {}
@@ -246,9 +377,6 @@ class Backtesting:
 
         Used by backtest() - so keep this optimized for performance.
         """
-        # Every change to this headers list must evaluate further usages of the resulting tuple
-        # and eventually change the constants for indexes at the top
-        headers = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high', 'buy_tag', 'exit_tag']
         data: Dict = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
@@ -256,34 +384,103 @@ class Backtesting:
         for pair, pair_data in processed.items():
             self.check_abort()
             self.progress.increment()
-            if not pair_data.empty:
-                pair_data.loc[:, 'buy'] = 0  # cleanup if buy_signal is exist
-                pair_data.loc[:, 'sell'] = 0  # cleanup if sell_signal is exist
-                pair_data.loc[:, 'buy_tag'] = None  # cleanup if buy_tag is exist
-                pair_data.loc[:, 'exit_tag'] = None  # cleanup if exit_tag is exist
-
-            df_analyzed = self.strategy.advise_sell(
-                self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair}).copy()
-            # Trim startup period from analyzed dataframe
-            df_analyzed = trim_dataframe(df_analyzed, self.timerange,
-                                         startup_candles=self.required_startup)
-            # To avoid using data from future, we use buy/sell signals shifted
-            # from the previous candle
-            df_analyzed.loc[:, 'buy'] = df_analyzed.loc[:, 'buy'].shift(1)
-            df_analyzed.loc[:, 'sell'] = df_analyzed.loc[:, 'sell'].shift(1)
-            df_analyzed.loc[:, 'buy_tag'] = df_analyzed.loc[:, 'buy_tag'].shift(1)
-            df_analyzed.loc[:, 'exit_tag'] = df_analyzed.loc[:, 'exit_tag'].shift(1)
-
-            # Update dataprovider cache
-            self.dataprovider._set_cached_df(pair, self.timeframe, df_analyzed)
-
-            df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
+            df_analyzed = self._get_signal_dataframe(pair, pair_data)
 
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[headers].values.tolist()
+            data[pair] = df_analyzed[HEADERS].values.tolist()
         return data
 
+    def _get_ohlcv_as_arrays(self, processed: Dict[str, DataFrame]) -> Dict[str, Dict[str, Any]]:
+        """
+        Helper function to convert processed dataframes into column-wise numpy arrays.
+        Rows are kept as object array to feed the regular (per candle) sell logic.
+
+        Used by the vectorized backtest engine.
+        """
+        data: Dict = {}
+        self.progress.init_step(BacktestState.CONVERT, len(processed))
+
+        for pair, pair_data in processed.items():
+            self.check_abort()
+            self.progress.increment()
+            df_analyzed = self._get_signal_dataframe(pair, pair_data)
+
+            data[pair] = {
+                'rows': df_analyzed[HEADERS].values,
+                'date': df_analyzed['date'].values.astype(np.int64),
+                'buy': pd.to_numeric(df_analyzed['buy'], errors='coerce').to_numpy(dtype=float),
+                'sell': pd.to_numeric(df_analyzed['sell'], errors='coerce').to_numpy(dtype=float),
+                'low': df_analyzed['low'].to_numpy(dtype=float),
+                'high': df_analyzed['high'].to_numpy(dtype=float),
+            }
+        return data
+
+    def _get_signal_dataframe(self, pair: str, pair_data: DataFrame) -> DataFrame:
+        """
+        Populate buy / sell signals for one pair, trim the startup period
+        and shift signals to the next candle.
+        Uses the signal cache (if assigned) to avoid recalculating signals for
+        buy / sell parameter combinations which were already analyzed.
+        """
+        if self.signal_cache is None:
+            df_analyzed = self._analyze_signals(pair, pair_data)
+        else:
+            key = (self._get_signal_params(), pair)
+            signals = self.signal_cache.get(key)
+            indicators = trim_dataframe(pair_data, self.timerange,
+                                        startup_candles=self.required_startup)
+            if signals is None:
+                self.signal_cache_misses += 1
+                # Analyze a copy, so columns set by the signal functions don't end up
+                # in the processed data used to rebuild cached frames.
+                df_analyzed = self._analyze_signals(pair, pair_data.copy())
+                # Indicators don't depend on buy / sell parameters - keep the signals and
+                # all columns added or changed by populate_buy_trend / populate_sell_trend.
+                columns = [column for column in df_analyzed.columns
+                           if column in SIGNAL_COLUMNS or column not in indicators.columns
+                           or not df_analyzed[column].equals(indicators[column])]
+                self.signal_cache[key] = df_analyzed[columns].copy()
+            else:
+                self.signal_cache_hits += 1
+                df_analyzed = indicators.copy()
+                for column in signals.columns:
+                    df_analyzed[column] = signals[column]
+
+        # Update dataprovider cache
+        self.dataprovider._set_cached_df(pair, self.timeframe, df_analyzed)
+
+        return df_analyzed.drop(df_analyzed.head(1).index)
+
+    def _get_signal_params(self) -> Tuple:
+        """
+        Identify the current signal configuration - signals only depend on the strategy
+        and the values of its buy / sell parameters.
+        """
+        return (self.strategy.get_strategy_name(), ) + tuple(
+            (name, param.value) for category in ('buy', 'sell')
+            for name, param in self.strategy.enumerate_parameters(category))
+
+    def _analyze_signals(self, pair: str, pair_data: DataFrame) -> DataFrame:
+        if not pair_data.empty:
+            pair_data.loc[:, 'buy'] = 0  # cleanup if buy_signal is exist
+            pair_data.loc[:, 'sell'] = 0  # cleanup if sell_signal is exist
+            pair_data.loc[:, 'buy_tag'] = None  # cleanup if buy_tag is exist
+            pair_data.loc[:, 'exit_tag'] = None  # cleanup if exit_tag is exist
+
+        df_analyzed = self.strategy.advise_sell(
+            self.strategy.advise_buy(pair_data, {'pair': pair}), {'pair': pair}).copy()
+        # Trim startup period from analyzed dataframe
+        df_analyzed = trim_dataframe(df_analyzed, self.timerange,
+                                     startup_candles=self.required_startup)
+        # To avoid using data from future, we use buy/sell signals shifted
+        # from the previous candle
+        df_analyzed.loc[:, 'buy'] = df_analyzed.loc[:, 'buy'].shift(1)
+        df_analyzed.loc[:, 'sell'] = df_analyzed.loc[:, 'sell'].shift(1)
+        df_analyzed.loc[:, 'buy_tag'] = df_analyzed.loc[:, 'buy_tag'].shift(1)
+        df_analyzed.loc[:, 'exit_tag'] = df_analyzed.loc[:, 'exit_tag'].shift(1)
+        return df_analyzed
+
     def _get_close_rate(self, sell_row: Tuple, trade: LocalTrade, sell: SellCheckTuple,
                         trade_dur: int) -> float:
         """
@@ -392,23 +589,37 @@ class Backtesting:
 
         return None
 
+    def _get_detail_rows(self, pair: str, candle_time: pd.Timestamp) -> List[List]:
+        """
+        Get detail candles within the regular candle starting at candle_time.
+        Detail data is converted to numpy arrays once per pair, candles are located by
+        binary search on the detail dates - so no dataframe operations are necessary
+        while backtesting.
+        :return: List of [date, open, close, low, high] rows
+        """
+        detail_data = self.detail_data[pair]
+        index = self._detail_index.get(pair)
+        if index is None or index[0] is not detail_data:
+            index = (detail_data, detail_data['date'].values.astype(np.int64),
+                     detail_data[DETAIL_HEADERS].to_numpy(dtype=float))
+            self._detail_index[pair] = index
+        _, dates, rates = index
+
+        candle_start = candle_time.value
+        candle_end = candle_start + self.timeframe_min * 60 * 10**9
+        start, end = dates.searchsorted(candle_start), dates.searchsorted(candle_end)
+        return [[pd.Timestamp(date, tz='UTC'), *rate]
+                for date, rate in zip(dates[start:end].tolist(), rates[start:end].tolist())]
+
     def _get_sell_trade_entry(self, trade: LocalTrade, sell_row: Tuple) -> Optional[LocalTrade]:
         if self.timeframe_detail and trade.pair in self.detail_data:
-            sell_candle_time = sell_row[DATE_IDX].to_pydatetime()
-            sell_candle_end = sell_candle_time + timedelta(minutes=self.timeframe_min)
-
-            detail_data = self.detail_data[trade.pair]
-            detail_data = detail_data.loc[
-                (detail_data['date'] >= sell_candle_time) &
-                (detail_data['date'] < sell_candle_end)
-            ].copy()
-            if len(detail_data) == 0:
+            detail_rows = self._get_detail_rows(trade.pair, sell_row[DATE_IDX])
+            if len(detail_rows) == 0:
                 # Fall back to "regular" data if no detail data was found for this candle
                 return self._get_sell_trade_entry_for_candle(trade, sell_row)
-            detail_data.loc[:, 'buy'] = sell_row[BUY_IDX]
-            detail_data.loc[:, 'sell'] = sell_row[SELL_IDX]
-            headers = ['date', 'buy', 'open', 'close', 'sell', 'low', 'high']
-            for det_row in detail_data[headers].values.tolist():
+            buy, sell = sell_row[BUY_IDX], sell_row[SELL_IDX]
+            for date, open_, close, low, high in detail_rows:
+                det_row = (date, buy, open_, close, sell, low, high)
                 res = self._get_sell_trade_entry_for_candle(trade, det_row)
                 if res:
                     return res
@@ -510,9 +721,35 @@ class Backtesting:
         :param enable_protections: Should protections be enabled?
         :return: DataFrame with trades (results of backtesting)
         """
-        trades: List[LocalTrade] = []
         self.prepare_backtest(enable_protections)
 
+        if self.use_vectorized:
+            trades = self._backtest_vectorized(processed, start_date, end_date, max_open_trades,
+                                               position_stacking, enable_protections)
+        else:
+            trades = self._backtest_loop(processed, start_date, end_date, max_open_trades,
+                                         position_stacking, enable_protections)
+        self.wallets.update()
+
+        results = trade_list_to_dataframe(trades)
+        return {
+            'results': results,
+            'config': self.strategy.config,
+            'locks': PairLocks.get_all_locks(),
+            'rejected_signals': self.rejected_trades,
+            'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
+        }
+
+    def _backtest_loop(self, processed: Dict, start_date: datetime, end_date: datetime,
+                       max_open_trades: int, position_stacking: bool,
+                       enable_protections: bool) -> List[LocalTrade]:
+        """
+        Loop engine - evaluates every candle for every pair.
+        Parameters are the same as for backtest().
+        :return: List of trades (closed and force-closed at the end)
+        """
+        trades: List[LocalTrade] = []
+
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
         data: Dict = self._get_ohlcv_as_lists(processed)
@@ -584,6 +821,7 @@ class Backtesting:
                         LocalTrade.close_bt_trade(trade)
                         trades.append(trade_entry)
                         if enable_protections:
+                            self.protections.trade_closed(trade)
                             self.protections.stop_per_pair(pair, row[DATE_IDX])
                             self.protections.global_stop(tmp)
 
@@ -592,16 +830,192 @@ class Backtesting:
             tmp += timedelta(minutes=self.timeframe_min)
 
         trades += self.handle_left_open(open_trades, data=data)
-        self.wallets.update()
+        return trades
 
-        results = trade_list_to_dataframe(trades)
-        return {
-            'results': results,
-            'config': self.strategy.config,
-            'locks': PairLocks.get_all_locks(),
-            'rejected_signals': self.rejected_trades,
-            'final_balance': self.wallets.get_total(self.strategy.config['stake_currency']),
+    def _find_sell_candidate(self, trade: LocalTrade, pair_data: Dict[str, Any],
+                             start: int, end: int) -> Optional[int]:
+        """
+        Find the next candle (between start and end) which may cause a sell for this trade.
+        Candles before the candidate can't trigger a sell, so the trade state
+        (min / max rate, trailing stoploss) is forwarded using array operations.
+        The candidate candle itself must be evaluated by the regular sell logic.
+        Only valid for strategies without custom_sell / custom_stoploss.
+        :return: index of the candidate candle, None if the trade stays open until end.
+        """
+        strategy = self.strategy
+        open_ts = int(trade.open_date_utc.timestamp()) * 1_000_000_000
+        sl_offset = strategy.trailing_stop_positive_offset
+        window = VECTORIZED_WINDOW
+        while start < end:
+            stop = min(start + window, end)
+            high = pair_data['high'][start:stop]
+            low = pair_data['low'][start:stop]
+            # Same as trade.calc_profit_ratio(high) - without rounding
+            high_profit = (trade.amount * high * (1 - trade.fee_close)
+                           / trade.open_trade_value) - 1
+
+            # ROI - use the ROI entry valid for the trade duration of each candle
+            trade_dur = (pair_data['date'][start:stop] - open_ts) // 60_000_000_000
+            if len(self._roi_durations):
+                roi_idx = np.searchsorted(self._roi_durations, trade_dur, side='right') - 1
+                roi = np.where(roi_idx >= 0, self._roi_values[np.maximum(roi_idx, 0)], np.inf)
+                candidate = high_profit > roi - VECTORIZED_TOLERANCE
+            else:
+                candidate = np.zeros(len(high), dtype=bool)
+
+            if strategy.use_sell_signal:
+                # NaN signals are treated as sell by the regular sell logic, too.
+                candidate |= pair_data['sell'][start:stop] != 0
+
+            if strategy.trailing_stop:
+                if strategy.trailing_stop_positive is not None:
+                    stop_value = np.where(high_profit > sl_offset,
+                                          strategy.trailing_stop_positive, strategy.stoploss)
+                else:
+                    stop_value = np.full(len(high), strategy.stoploss)
+                new_stop = high * (1 - np.abs(stop_value))
+                if strategy.trailing_only_offset_is_reached:
+                    new_stop = np.where(high_profit < sl_offset, -np.inf, new_stop)
+                # Candles close to the offset are left to the regular logic
+                candidate |= np.abs(high_profit - sl_offset) < VECTORIZED_TOLERANCE
+                stop_loss = np.maximum.accumulate(np.maximum(new_stop, trade.stop_loss))
+                candidate |= stop_loss * (1 + VECTORIZED_TOLERANCE) >= low
+            else:
+                candidate |= trade.stop_loss * (1 + VECTORIZED_TOLERANCE) >= low
+
+            hits = np.flatnonzero(candidate)
+            skip = int(hits[0]) if len(hits) else len(candidate)
+            if skip > 0:
+                # Forward trade state over candles without sell
+                trade.max_rate = max(trade.max_rate or trade.open_rate, float(high[:skip].max()))
+                trade.min_rate = min(trade.min_rate or trade.open_rate, float(low[:skip].min()))
+                if strategy.trailing_stop:
+                    idx = int(np.argmax(new_stop[:skip]))
+                    if new_stop[idx] > trade.stop_loss:
+                        trade._set_new_stoploss(float(new_stop[idx]), float(stop_value[idx]))
+            if len(hits):
+                return start + skip
+            start = stop
+            window *= 2
+        return None
+
+    def _get_vectorized_ticks(self, data: Dict[str, Dict[str, Any]], start_date: datetime,
+                              end_date: datetime) -> Tuple[List[np.ndarray], int]:
+        """
+        Calculate the candle of the backtest loop (tick) at which each row is evaluated.
+        This is the candle date, unless a pair has gaps in it's data.
+        Rows evaluated after end_date are not included.
+        :return: Tuple of (ticks per pair, number of ticks)
+        """
+        timeframe_ns = self.timeframe_min * 60 * 1_000_000_000
+        first_tick = int(pd.Timestamp(start_date).value) + timeframe_ns
+        end_ts = int(pd.Timestamp(end_date).value)
+
+        pair_ticks = []
+        for pair_data in data.values():
+            dates = pair_data['date']
+            offsets = np.arange(len(dates), dtype=np.int64) * timeframe_ns
+            aligned = first_tick - ((first_tick - dates) // timeframe_ns) * timeframe_ns
+            ticks = np.maximum.accumulate(np.maximum(aligned - offsets, first_tick)) + offsets
+            ticks = ticks[:np.searchsorted(ticks, end_ts, side='right')]
+            pair_ticks.append((ticks - first_tick) // timeframe_ns)
+        return pair_ticks, max((end_ts - first_tick) // timeframe_ns + 1, 0)
+
+    def _backtest_vectorized(self, processed: Dict, start_date: datetime, end_date: datetime,
+                             max_open_trades: int, position_stacking: bool,
+                             enable_protections: bool) -> List[LocalTrade]:
+        """
+        Vectorized engine - entry candidates are found with array operations, and each
+        open trade is forwarded to the next candle which may cause a sell.
+        Entries and sells are then processed as events, in the same sequence as the loop
+        engine would process them (candle by candle, pair by pair), so results are identical.
+        Parameters are the same as for backtest().
+        :return: List of trades (closed and force-closed at the end)
+        """
+        trades: List[LocalTrade] = []
+        data = self._get_ohlcv_as_arrays(processed)
+        pairs = list(data.keys())
+
+        roi_durations = sorted(self.strategy.minimal_roi.keys())
+        self._roi_durations = np.array(roi_durations, dtype=np.int64)
+        self._roi_values = np.array([self.strategy.minimal_roi[k] for k in roi_durations],
+                                    dtype=float)
+
+        pair_ticks, tick_count = self._get_vectorized_ticks(data, start_date, end_date)
+        slots = TradeSlots(max_open_trades, position_stacking, pair_ticks, tick_count)
+
+        # Events are (tick, pair index, event type (0: entry, 1: sell), trade sequence,
+        # row index, trade) - so they're processed in the same order as the loop engine does.
+        events: List[Tuple] = []
+        for pair_idx, pair in enumerate(pairs):
+            ticks = pair_ticks[pair_idx]
+            buy = data[pair]['buy'][:len(ticks)]
+            sell = data[pair]['sell'][:len(ticks)]
+            # Don't open on the last row
+            for row_idx in np.flatnonzero((buy == 1) & (sell != 1) & (ticks != tick_count - 1)):
+                events.append((int(ticks[row_idx]), pair_idx, 0, 0, int(row_idx), None))
+        heapq.heapify(events)
+
+        # Keep the order in which pairs have been seen first - used for force-closing at the end
+        open_trades: Dict[str, List[LocalTrade]] = {
+            pairs[pair_idx]: [] for _, pair_idx in sorted(
+                (ticks[0], pair_idx) for pair_idx, ticks in enumerate(pair_ticks) if len(ticks))
         }
+        trade_seq = 0
+
+        self.progress.init_step(BacktestState.BACKTEST, int(
+            (end_date - start_date) / timedelta(minutes=self.timeframe_min)))
+
+        while events:
+            tick, pair_idx, event_type, seq, row_idx, trade = heapq.heappop(events)
+            slots.start_tick(tick)
+            self.check_abort()
+            self.progress.set_new_value(tick)
+
+            pair = pairs[pair_idx]
+            rows = data[pair]['rows']
+            self.dataprovider._set_dataframe_max_index(row_idx + 1)
+
+            if event_type == 0:
+                if (slots.slot_available(pair_idx)
+                        and not PairLocks.is_pair_locked(pair, rows[row_idx][DATE_IDX])):
+                    trade = self._enter_trade(pair, rows[row_idx].tolist())
+                    if trade:
+                        slots.add_trade(pair_idx)
+                        open_trades[pair].append(trade)
+                        LocalTrade.add_bt_trade(trade)
+                        trade_seq += 1
+                        # Also check the buying candle for sell conditions.
+                        heapq.heappush(events, (tick, pair_idx, 1, trade_seq, row_idx, trade))
+                continue
+
+            row = rows[row_idx].tolist()
+            trade_entry = self._get_sell_trade_entry(trade, row)
+            if trade_entry:
+                slots.remove_trade(pair_idx)
+                open_trades[pair].remove(trade)
+
+                LocalTrade.close_bt_trade(trade)
+                trades.append(trade_entry)
+                if enable_protections:
+                    self.protections.trade_closed(trade)
+                    self.protections.stop_per_pair(pair, row[DATE_IDX])
+                    self.protections.global_stop(
+                        start_date + timedelta(minutes=self.timeframe_min * (tick + 1)))
+                continue
+
+            next_idx = self._find_sell_candidate(trade, data[pair], row_idx + 1,
+                                                 len(pair_ticks[pair_idx]))
+            if next_idx is not None:
+                heapq.heappush(events, (int(pair_ticks[pair_idx][next_idx]), pair_idx, 1, seq,
+                                        next_idx, trade))
+
+        slots.finish()
+        self.rejected_trades += slots.rejected
+
+        trades += self.handle_left_open(
+            open_trades, data={pair: [data[pair]['rows'][-1].tolist()] for pair in open_trades})
+        return trades
 
     def backtest_one_strategy(self, strat: IStrategy, data: Dict[str, DataFrame],
                               timerange: TimeRange):
@@ -623,7 +1037,7 @@ class Backtesting:
             max_open_trades = 0
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        preprocessed = self.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe
         preprocessed_tmp = trim_dataframes(preprocessed, timerange, self.required_startup)
@@ -656,6 +1070,49 @@ class Backtesting:
 
         return min_date, max_date
 
+    def _backtest_strategy_job(self, strategy_idx: int, data: Dict[str, DataFrame],
+                               detail_data: Dict[str, DataFrame], timerange: TimeRange
+                               ) -> Tuple[Dict[str, Any], datetime, datetime]:
+        """
+        Backtest one strategy of the strategy list - executed in a worker process.
+        :return: Tuple of (backtest results, min_date, max_date)
+        """
+        self.detail_data = detail_data
+        strat = self.strategylist[strategy_idx]
+        min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+        return self.all_results[strat.get_strategy_name()], min_date, max_date
+
+    def backtest_strategies_parallel(self, data: Dict[str, DataFrame], timerange: TimeRange,
+                                     jobs: int) -> Tuple[datetime, datetime]:
+        """
+        Backtest all strategies of the strategy list using parallel worker processes.
+        Candle data is handed to the workers as argument, so joblib shares it through
+        memory-mapped files instead of copying it into every worker.
+        Results are merged into self.all_results.
+        """
+        try:
+            from joblib import Parallel, delayed, wrap_non_picklable_objects
+        except ImportError:
+            raise OperationalException("Please install hyperopt dependencies (which include "
+                                       "joblib) to use --backtest-jobs.")
+        # Detail data is shared like the candle data - don't pickle it with this instance.
+        detail_data = self.detail_data
+        self.detail_data = {}
+        self._detail_index = {}
+        try:
+            with Parallel(n_jobs=jobs) as parallel:
+                logger.info(f"Backtesting {len(self.strategylist)} strategies using "
+                            f"{parallel._effective_n_jobs()} parallel jobs.")
+                job = wrap_non_picklable_objects(self._backtest_strategy_job)
+                results = parallel(delayed(job)(idx, data, detail_data, timerange)
+                                   for idx in range(len(self.strategylist)))
+        finally:
+            self.detail_data = detail_data
+
+        for strat, (strat_results, min_date, max_date) in zip(self.strategylist, results):
+            self.all_results[strat.get_strategy_name()] = strat_results
+        return min_date, max_date
+
     def start(self) -> None:
         """
         Run backtesting end-to-end
@@ -667,8 +1124,12 @@ class Backtesting:
         self.load_bt_data_detail()
         logger.info("Dataload complete. Calculating indicators")
 
-        for strat in self.strategylist:
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+        jobs = self.config.get('backtest_jobs', 1)
+        if jobs != 1 and len(self.strategylist) > 1:
+            min_date, max_date = self.backtest_strategies_parallel(data, timerange, jobs)
+        else:
+            for strat in self.strategylist:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
         if len(self.strategylist) > 0:
 
             self.results = generate_backtest_stats(data, self.all_results,
@@ -6,17 +6,23 @@ This module contains the hyperopt logic
 
 import logging
 import random
+import time
 import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
 
 import progressbar
 import rapidjson
+from cachetools import LRUCache
 from colorama import Fore, Style
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import (Parallel, cpu_count, delayed, dump, effective_n_jobs, load,
+                    wrap_non_picklable_objects)
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame
 
 from freqtrade.constants import DATETIME_PRINT_FORMAT, FTHYPT_FILEVERSION, LAST_BT_RESULT_FN
@@ -53,6 +59,14 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Number of buy / sell parameter combinations to keep analyzed signals for (per worker)
+SIGNAL_CACHE_SIZE = 10
+
+# Preprocessed data and signal cache of the current (worker) process.
+# Keyed by data file and the token of the hyperopt run which published the data.
+_processed_cache: Dict[Tuple[str, str], Dict[str, DataFrame]] = {}
+_signal_cache: Dict[Tuple[str, str], LRUCache] = {}
+
 
 class Hyperopt:
     """
@@ -95,9 +109,15 @@ class Hyperopt:
                                    f'strategy_{strategy}_{time_now}.fthypt')
         self.data_pickle_file = (self.config['user_data_dir'] /
                                  'hyperopt_results' / 'hyperopt_tickerdata.pkl')
+        # Identifies the data published by prepare_hyperopt_data() for this run
+        self.data_token = ''
         self.total_epochs = config.get('epochs', 0)
 
         self.current_best_loss = 100
+        self.signal_cache_hits = 0
+        self.signal_cache_misses = 0
+        # Summed up duration of all evaluated epochs (within the worker processes)
+        self.epochs_duration = 0.0
 
         self.clean_hyperopt()
 
@@ -132,6 +152,8 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
+        _processed_cache.clear()
+        _signal_cache.clear()
         for f in [self.data_pickle_file, self.results_file]:
             p = Path(f)
             if p.is_file():
@@ -306,8 +328,10 @@ class Hyperopt:
             self.backtesting.strategy.trailing_only_offset_is_reached = \
                 d['trailing_only_offset_is_reached']
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
+        processed = self._get_processed_data()
+        self.backtesting.signal_cache = self._get_signal_cache(len(processed))
+        self.backtesting.signal_cache_hits = 0
+        self.backtesting.signal_cache_misses = 0
         bt_results = self.backtesting.backtest(
             processed=processed,
             start_date=self.min_date,
@@ -322,9 +346,44 @@ class Hyperopt:
             'backtest_end_time': int(backtest_end_time.timestamp()),
         })
 
-        return self._get_results_dict(bt_results, self.min_date, self.max_date,
-                                      params_dict,
-                                      processed=processed)
+        results = self._get_results_dict(bt_results, self.min_date, self.max_date,
+                                         params_dict,
+                                         processed=processed)
+        results.update({
+            'signal_cache_hits': self.backtesting.signal_cache_hits,
+            'signal_cache_misses': self.backtesting.signal_cache_misses,
+            'epoch_duration': (datetime.now(timezone.utc) - backtest_start_time).total_seconds(),
+        })
+        return results
+
+    def _get_processed_data(self) -> Dict[str, DataFrame]:
+        """
+        Attach to the preprocessed data published by prepare_hyperopt_data().
+        The data file is memory-mapped (read-only) once per process and kept across epochs,
+        so all workers share the same pages instead of loading the data every epoch.
+        Each epoch receives shallow copies, so columns added by the strategy
+        don't leak into the next epoch.
+        """
+        key = (str(self.data_pickle_file), self.data_token)
+        if key not in _processed_cache:
+            # Only keep data of the current run attached
+            _processed_cache.clear()
+            with self.data_pickle_file.open('rb') as f:
+                _processed_cache[key] = load(f, mmap_mode='r')
+            logger.debug(f"Attached to hyperopt data in `{self.data_pickle_file}`.")
+        return {pair: df.copy(deep=False) for pair, df in _processed_cache[key].items()}
+
+    def _get_signal_cache(self, pair_count: int) -> LRUCache:
+        """
+        Get the signal cache of this process for the current hyperopt run.
+        Signals (columns set by the signal functions only, no indicators) are cached per pair
+        for the last SIGNAL_CACHE_SIZE buy / sell parameter combinations.
+        """
+        key = (str(self.data_pickle_file), self.data_token)
+        if key not in _signal_cache:
+            _signal_cache.clear()
+            _signal_cache[key] = LRUCache(maxsize=SIGNAL_CACHE_SIZE * max(pair_count, 1))
+        return _signal_cache[key]
 
     def _get_results_dict(self, backtesting_results, min_date, max_date,
                           params_dict, processed: Dict[str, DataFrame]
@@ -390,6 +449,113 @@ class Hyperopt:
         return parallel(delayed(
                         wrap_non_picklable_objects(self.generate_optimizer))(v, i) for v in asked)
 
+    def run_optimizer_async(self, jobs: int, pbar: progressbar.ProgressBar) -> None:
+        """
+        Evaluate epochs on a process pool, asking the optimizer for a new point as soon as
+        a worker finishes (instead of waiting for the slowest epoch of a batch).
+        Results are passed to the optimizer as they arrive.
+        """
+        executor = get_reusable_executor(max_workers=jobs)
+        optimizer = wrap_non_picklable_objects(self.generate_optimizer)
+        pending: Dict[Future, List[Any]] = {}
+        submitted = 0
+        current = 0
+        try:
+            while current < self.total_epochs:
+                while len(pending) < jobs and submitted < self.total_epochs:
+                    asked = self._ask_point(list(pending.values()))
+                    pending[executor.submit(optimizer, asked, submitted)] = asked
+                    submitted += 1
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    asked = pending.pop(future)
+                    val = future.result()
+                    self.opt.tell(asked, val['loss'])
+                    current += 1
+                    self._process_epoch_result(val, current, pbar)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _ask_point(self, pending: List[List[Any]]) -> List[Any]:
+        """
+        Ask the optimizer for a point which is not being evaluated already.
+        """
+        asked = self.opt.ask()
+        if asked in pending:
+            # The optimizer doesn't know about pending points - so generate a batch
+            # (using the constant liar strategy) and use the first new point.
+            asked = next((x for x in self.opt.ask(n_points=len(pending) + 1)
+                          if x not in pending), asked)
+        return asked
+
+    def _process_epoch_result(self, val: Dict[str, Any], current: int,
+                              pbar: progressbar.ProgressBar) -> None:
+        """
+        Print and store the result of one epoch.
+        :param current: Human-friendly epoch index (starting from 1)
+        """
+        self.signal_cache_hits += val.pop('signal_cache_hits', 0)
+        self.signal_cache_misses += val.pop('signal_cache_misses', 0)
+        self.epochs_duration += val.pop('epoch_duration', 0)
+
+        val['current_epoch'] = current
+        val['is_initial_point'] = current <= INITIAL_POINTS
+
+        logger.debug(f"Optimizer epoch evaluated: {val}")
+
+        is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
+        # This value is assigned here and not in the optimization method
+        # to keep proper order in the list of results. That's because
+        # evaluations can take different time. Here they are aligned in the
+        # order they will be shown to the user.
+        val['is_best'] = is_best
+        self.print_results(val)
+
+        if is_best:
+            self.current_best_loss = val['loss']
+            self.current_best_epoch = val
+
+        self._save_result(val)
+
+        pbar.update(current)
+
+    def _log_utilization(self, jobs: int, elapsed: float) -> None:
+        """
+        Log how busy the worker processes were while optimizing.
+        """
+        if jobs > 0 and elapsed > 0:
+            logger.info(f"Worker utilization: {self.epochs_duration / (jobs * elapsed):.1%} "
+                        f"({self.epochs_duration:.1f}s of epochs on {jobs} "
+                        f"{plural(jobs, 'worker')} in {elapsed:.1f}s).")
+
+    def _get_progressbar(self) -> progressbar.ProgressBar:
+        if self.print_colorized:
+            widgets = [
+                ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
+                ' (', progressbar.Percentage(), ')] ',
+                progressbar.Bar(marker=progressbar.AnimatedMarker(
+                    fill='\N{FULL BLOCK}',
+                    fill_wrap=Fore.GREEN + '{}' + Fore.RESET,
+                    marker_wrap=Style.BRIGHT + '{}' + Style.RESET_ALL,
+                )),
+                ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
+            ]
+        else:
+            widgets = [
+                ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
+                ' (', progressbar.Percentage(), ')] ',
+                progressbar.Bar(marker=progressbar.AnimatedMarker(
+                    fill='\N{FULL BLOCK}',
+                )),
+                ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
+            ]
+        return progressbar.ProgressBar(
+            max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
+            widgets=widgets
+        )
+
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
 
@@ -397,7 +563,7 @@ class Hyperopt:
         data, timerange = self.backtesting.load_bt_data()
         logger.info("Dataload complete. Calculating indicators")
 
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        preprocessed = self.backtesting.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         processed = trim_dataframes(preprocessed, timerange, self.backtesting.required_startup)
@@ -408,6 +574,7 @@ class Hyperopt:
                     f'({(self.max_date - self.min_date).days} days)..')
         # Store non-trimmed data - will be trimmed after signal generation.
         dump(preprocessed, self.data_pickle_file)
+        self.data_token = uuid4().hex
 
     def start(self) -> None:
         self.random_state = self._set_random_state(self.config.get('hyperopt_random_state', None))
@@ -435,77 +602,42 @@ class Hyperopt:
         if self.print_colorized:
             colorama_init(autoreset=True)
 
+        jobs = 0
+        start_time = time.time()
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
+            if self.config.get('hyperopt_scheduler', 'batch') == 'async':
+                jobs = effective_n_jobs(config_jobs)
                 logger.info(f'Effective number of parallel workers used: {jobs}')
-
-                # Define progressbar
-                if self.print_colorized:
-                    widgets = [
-                        ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
-                        ' (', progressbar.Percentage(), ')] ',
-                        progressbar.Bar(marker=progressbar.AnimatedMarker(
-                            fill='\N{FULL BLOCK}',
-                            fill_wrap=Fore.GREEN + '{}' + Fore.RESET,
-                            marker_wrap=Style.BRIGHT + '{}' + Style.RESET_ALL,
-                        )),
-                        ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
-                    ]
-                else:
-                    widgets = [
-                        ' [Epoch ', progressbar.Counter(), ' of ', str(self.total_epochs),
-                        ' (', progressbar.Percentage(), ')] ',
-                        progressbar.Bar(marker=progressbar.AnimatedMarker(
-                            fill='\N{FULL BLOCK}',
-                        )),
-                        ' [', progressbar.ETA(), ', ', progressbar.Timer(), ']',
-                    ]
-                with progressbar.ProgressBar(
-                    max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
-                    widgets=widgets
-                ) as pbar:
-                    EVALS = ceil(self.total_epochs / jobs)
-                    for i in range(EVALS):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - self.total_epochs
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked = self.opt.ask(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked, i)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        # Calculate progressbar outputs
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1
-                            val['current_epoch'] = current
-                            val['is_initial_point'] = current <= INITIAL_POINTS
-
-                            logger.debug(f"Optimizer epoch evaluated: {val}")
-
-                            is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
-                            # This value is assigned here and not in the optimization method
-                            # to keep proper order in the list of results. That's because
-                            # evaluations can take different time. Here they are aligned in the
-                            # order they will be shown to the user.
-                            val['is_best'] = is_best
-                            self.print_results(val)
-
-                            if is_best:
-                                self.current_best_loss = val['loss']
-                                self.current_best_epoch = val
-
-                            self._save_result(val)
-
-                            pbar.update(current)
+                with self._get_progressbar() as pbar:
+                    self.run_optimizer_async(jobs, pbar)
+            else:
+                with Parallel(n_jobs=config_jobs) as parallel:
+                    jobs = parallel._effective_n_jobs()
+                    logger.info(f'Effective number of parallel workers used: {jobs}')
+                    with self._get_progressbar() as pbar:
+                        EVALS = ceil(self.total_epochs / jobs)
+                        for i in range(EVALS):
+                            # Correct the number of epochs to be processed for the last
+                            # iteration (should not exceed self.total_epochs in total)
+                            n_rest = (i + 1) * jobs - self.total_epochs
+                            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+                            asked = self.opt.ask(n_points=current_jobs)
+                            f_val = self.run_optimizer_parallel(parallel, asked, i)
+                            self.opt.tell(asked, [v['loss'] for v in f_val])
+
+                            for j, val in enumerate(f_val):
+                                # Use human-friendly indexes here (starting from 1)
+                                self._process_epoch_result(val, i * jobs + j + 1, pbar)
 
         except KeyboardInterrupt:
             print('User interrupted..')
 
+        self._log_utilization(jobs, time.time() - start_time)
         logger.info(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
                     f"saved to '{self.results_file}'.")
+        logger.info(f"Signal cache: {self.signal_cache_hits} hits, "
+                    f"{self.signal_cache_misses} misses.")
 
         if self.current_best_epoch:
             HyperoptTools.try_export_params(
@@ -0,0 +1,219 @@
+"""
+Persistent cache of populated indicators, shared by backtesting and hyperopt runs.
+"""
+import hashlib
+import inspect
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+from pandas import DataFrame
+
+from freqtrade import __version__
+from freqtrade.constants import USERPATH_INDICATOR_CACHE
+from freqtrade.data.history.idatahandler import get_datahandlerclass
+from freqtrade.exceptions import OperationalException
+from freqtrade.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_SUFFIX = '.arrow'
+# Key used to store entry details in the schema metadata of cache files
+CACHE_METADATA_KEY = b'freqtrade'
+
+
+class IndicatorCache:
+    """
+    Content-addressed cache of dataframes returned by populate_indicators().
+    Entries are stored as uncompressed Arrow IPC files in user_data/indicator_cache,
+    so they can be loaded memory-mapped.
+    The filename is a hash of everything the populated indicators depend on:
+    the strategy source, the strategy parameter values (or ranges, for parameters being
+    optimized), pair, timeframe, the candle data and fingerprints of informative data files.
+    Least recently used entries are removed once the cache exceeds the configured size.
+    """
+
+    def __init__(self, config: Dict[str, Any], strategy: IStrategy) -> None:
+        self._cache_dir = self.get_cache_dir(config)
+        self._max_size = int(config.get('indicator_cache_size', 1024) * 1024 * 1024)
+        self._strategy_name = strategy.get_strategy_name()
+        self._timeframe = strategy.timeframe
+        self._strategy_hash = self._hash_strategy(config, strategy)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_cache_dir(config: Dict[str, Any]) -> Path:
+        return Path(config['user_data_dir']) / USERPATH_INDICATOR_CACHE
+
+    def get(self, pair: str, dataframe: DataFrame) -> Optional[DataFrame]:
+        """
+        Load populated indicators for this pair from the cache.
+        :param pair: Pair the candle data belongs to
+        :param dataframe: Candle data indicators were populated for
+        :return: Dataframe with populated indicators - or None if not cached.
+        """
+        filename = self._entry_filename(pair, dataframe)
+        try:
+            with pa.memory_map(str(filename)) as source:
+                analyzed = pa.ipc.open_file(source).read_all().to_pandas()
+        except (FileNotFoundError, pa.ArrowInvalid):
+            self.misses += 1
+            return None
+        # Mark entry as recently used
+        os.utime(filename)
+        self.hits += 1
+        return analyzed
+
+    def store(self, pair: str, dataframe: DataFrame, analyzed: DataFrame) -> None:
+        """
+        Store populated indicators for this pair.
+        Dataframes containing columns which can't be converted to Arrow are not cached.
+        :param pair: Pair the candle data belongs to
+        :param dataframe: Candle data indicators were populated for
+        :param analyzed: Dataframe with populated indicators
+        """
+        filename = self._entry_filename(pair, dataframe)
+        try:
+            table = pa.Table.from_pandas(analyzed)
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            logger.warning(f"Not caching indicators for {pair}: {e}")
+            return
+        metadata = {
+            'strategy': self._strategy_name,
+            'pair': pair,
+            'timeframe': self._timeframe,
+            'created': int(datetime.now(timezone.utc).timestamp()),
+        }
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               CACHE_METADATA_KEY: json.dumps(metadata)})
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_filename = filename.with_suffix('.tmp')
+        with pa.OSFile(str(tmp_filename), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        tmp_filename.replace(filename)
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits into the configured size.
+        """
+        entries = sorted(self.get_entries(self._cache_dir), key=lambda entry: entry['last_used'])
+        size = sum(entry['size'] for entry in entries)
+        for entry in entries:
+            if size <= self._max_size:
+                break
+            entry['file'].unlink()
+            size -= entry['size']
+            logger.debug(f"Removed indicator cache entry {entry['file'].name}.")
+
+    @staticmethod
+    def get_entries(cache_dir: Path) -> List[Dict[str, Any]]:
+        """
+        List all cache entries with their details.
+        :param cache_dir: Cache directory
+        :return: List of dicts with file, strategy, pair, timeframe, size and last_used
+        """
+        entries = []
+        for filename in cache_dir.glob(f'*{CACHE_FILE_SUFFIX}'):
+            try:
+                with pa.memory_map(str(filename)) as source:
+                    schema = pa.ipc.open_file(source).schema
+                metadata = json.loads(schema.metadata[CACHE_METADATA_KEY])
+            except (pa.ArrowInvalid, KeyError, TypeError, ValueError):
+                metadata = {}
+            stat = filename.stat()
+            entries.append({
+                'file': filename,
+                'strategy': metadata.get('strategy', ''),
+                'pair': metadata.get('pair', ''),
+                'timeframe': metadata.get('timeframe', ''),
+                'size': stat.st_size,
+                'last_used': datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            })
+        return entries
+
+    @staticmethod
+    def clear(cache_dir: Path) -> int:
+        """
+        Remove all cache entries.
+        :param cache_dir: Cache directory
+        :return: Number of removed entries
+        """
+        entries = list(cache_dir.glob(f'*{CACHE_FILE_SUFFIX}'))
+        for filename in entries:
+            filename.unlink()
+        return len(entries)
+
+    def _entry_filename(self, pair: str, dataframe: DataFrame) -> Path:
+        key = hashlib.sha256(self._strategy_hash.encode())
+        key.update(f'{pair}|{self._timeframe}'.encode())
+        key.update(pd.util.hash_pandas_object(dataframe, index=False).values.tobytes())
+        key.update(','.join(str(col) for col in dataframe.columns).encode())
+        return self._cache_dir / f'{key.hexdigest()}{CACHE_FILE_SUFFIX}'
+
+    @staticmethod
+    def _hash_strategy(config: Dict[str, Any], strategy: IStrategy) -> str:
+        """
+        Hash everything (but the candle data of the pair) populated indicators depend on.
+        """
+        parts = [__version__, pd.__version__, strategy.get_strategy_name(),
+                 strategy.timeframe, str(strategy.startup_candle_count)]
+        parts.extend(IndicatorCache._strategy_sources(strategy))
+        # Parameter values - or the whole range for parameters being optimized,
+        # as populate_indicators() may calculate indicators for every value of the range.
+        for name, param in sorted(strategy.enumerate_parameters()):
+            parts.append(f'{name}={param.value!r}|{getattr(param, "range", None)!r}')
+        parts.extend(IndicatorCache._informative_fingerprints(config, strategy))
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    @staticmethod
+    def _strategy_sources(strategy: IStrategy) -> List[str]:
+        """
+        Source of the strategy class and all user-defined base classes.
+        """
+        sources = []
+        for cls in type(strategy).__mro__:
+            if cls is IStrategy:
+                break
+            try:
+                sources.append(inspect.getsource(cls))
+            except (OSError, TypeError):
+                if cls is not type(strategy) or not strategy.__source__:
+                    raise OperationalException(
+                        f"Can't read the source of {cls.__name__} to use the indicator cache.")
+                sources.append(strategy.__source__)
+        return sources
+
+    @staticmethod
+    def _informative_fingerprints(config: Dict[str, Any], strategy: IStrategy) -> List[str]:
+        """
+        Informative pairs are loaded from disk while populating indicators - use size and
+        modification time of their data files.
+        Without the informative pairs, changes to their data would go unnoticed - so the cache
+        can't be used in this case.
+        """
+        try:
+            informative_pairs = sorted(set(strategy.gather_informative_pairs()))
+        except OperationalException as e:
+            raise OperationalException(
+                f"Can't determine the informative pairs of {strategy.get_strategy_name()} "
+                f"to use the indicator cache: {e}") from e
+        if not informative_pairs:
+            return []
+        fingerprints = [str(config.get('timerange'))]
+        handler = get_datahandlerclass(config.get('dataformat_ohlcv', 'json'))
+        for pair, timeframe in informative_pairs:
+            filename = handler._pair_data_filename(Path(config['datadir']), pair, timeframe)
+            try:
+                stat = filename.stat()
+                fingerprints.append(f'{pair}|{timeframe}|{stat.st_size}|{stat.st_mtime_ns}')
+            except FileNotFoundError:
+                fingerprints.append(f'{pair}|{timeframe}|missing')
+        return fingerprints
@@ -0,0 +1,102 @@
+"""
+Trade slot accounting for the vectorized backtest engine
+"""
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+
+class TradeSlots:
+    """
+    Keeps track of open trades (in total and per pair) while the vectorized engine
+    processes its events.
+    Rejected signals are counted the same way the loop engine counts them - once for every
+    evaluated pair (without open trade) per candle while all trade slots are taken.
+
+    Ticks are candle indexes of the backtest loop (0 = first evaluated candle).
+    """
+
+    def __init__(self, max_open_trades: int, position_stacking: bool,
+                 pair_ticks: List[np.ndarray], tick_count: int) -> None:
+        """
+        :param max_open_trades: maximum number of concurrent trades, <= 0 means unlimited
+        :param position_stacking: Are multiple trades per pair allowed?
+        :param pair_ticks: Sorted ticks at which each pair is evaluated
+        :param tick_count: Total number of ticks in the backtest
+        """
+        self.max_open_trades = max_open_trades
+        self.position_stacking = position_stacking
+        self.pair_ticks = pair_ticks
+        self.tick_count = tick_count
+        active = np.zeros(tick_count + 1, dtype=np.int64)
+        for ticks in pair_ticks:
+            np.add.at(active, ticks + 1, 1)
+        # Number of evaluated pairs before each tick
+        self._active_cum = np.cumsum(active)
+
+        self.open_count = 0
+        self.pair_open_count: Dict[int, int] = defaultdict(int)
+        self.rejected = 0
+        self._tick = -1
+        self._open_count_start = 0
+
+    def _full(self, count: int) -> bool:
+        return 0 < self.max_open_trades <= count
+
+    def _pair_evaluated(self, pair_idx: int, from_tick: int, to_tick: int) -> int:
+        ticks = self.pair_ticks[pair_idx]
+        return int(np.searchsorted(ticks, to_tick) - np.searchsorted(ticks, from_tick))
+
+    def _count_rejected(self, from_tick: int, to_tick: int) -> None:
+        """
+        Count rejected signals from_tick (inclusive) to to_tick (exclusive),
+        assuming all slots are taken and open trades don't change.
+        """
+        if to_tick <= from_tick:
+            return
+        rejected = int(self._active_cum[to_tick] - self._active_cum[from_tick])
+        if not self.position_stacking:
+            rejected -= sum(self._pair_evaluated(pair_idx, from_tick, to_tick)
+                            for pair_idx, count in self.pair_open_count.items() if count > 0)
+        self.rejected += rejected
+
+    def start_tick(self, tick: int) -> None:
+        """
+        Move to tick - must be called before the first event of each tick is processed.
+        """
+        if tick == self._tick:
+            return
+        if self._full(self.open_count):
+            self._count_rejected(self._tick + 1, tick + 1)
+        self._tick = tick
+        self._open_count_start = self.open_count
+
+    def finish(self) -> None:
+        """
+        Count rejected signals up to the end of the backtest.
+        """
+        if self._full(self.open_count):
+            self._count_rejected(self._tick + 1, self.tick_count)
+
+    def slot_available(self, pair_idx: int) -> bool:
+        """
+        Check if pair_idx may open a new trade on the current tick.
+        """
+        return ((self.position_stacking or self.pair_open_count[pair_idx] == 0)
+                and not self._full(self._open_count_start))
+
+    def add_trade(self, pair_idx: int) -> None:
+        self._open_count_start += 1
+        self.open_count += 1
+        self.pair_open_count[pair_idx] += 1
+        if self._full(self._open_count_start):
+            # All remaining pairs evaluated on this candle are rejected
+            for next_idx in range(pair_idx + 1, len(self.pair_ticks)):
+                if ((self.position_stacking or self.pair_open_count[next_idx] == 0)
+                        and self._pair_evaluated(next_idx, self._tick, self._tick + 1)):
+                    self.rejected += 1
+
+    def remove_trade(self, pair_idx: int) -> None:
+        self.open_count -= 1
+        self.pair_open_count[pair_idx] -= 1
@@ -2,12 +2,13 @@
 This module contains the class to persist trades into SQLite
 """
 import logging
-from datetime import datetime, timedelta, timezone
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import (Boolean, Column, DateTime, Float, ForeignKey, Integer, String,
-                        create_engine, desc, func, inspect)
+from sqlalchemy import (Boolean, Column, Date, DateTime, Float, ForeignKey, Integer, String, case,
+                        create_engine, desc, event, func, inspect)
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.orm import Query, declarative_base, relationship, scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -211,7 +212,13 @@ class LocalTrade():
     # Trades container for backtesting
     trades: List['LocalTrade'] = []
     trades_open: List['LocalTrade'] = []
+    # Closed trades for backtesting, per pair (None for all pairs) - sorted by close_date.
+    # Contains the sort keys (see _close_date_key()) and the trades in the same order.
+    trades_closed_index: Dict[Optional[str],
+                              Tuple[List[Tuple[bool, Optional[datetime]]], List['LocalTrade']]] = {}
     total_profit: float = 0
+    # Sum of stake_amount over trades_open - updated incrementally by add_bt_trade / close_bt_trade
+    total_open_stake: float = 0
 
     id: int = 0
 
@@ -354,7 +361,9 @@ class LocalTrade():
         """
         LocalTrade.trades = []
         LocalTrade.trades_open = []
+        LocalTrade.trades_closed_index = {}
         LocalTrade.total_profit = 0
+        LocalTrade.total_open_stake = 0
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
         """
@@ -597,12 +606,12 @@ class LocalTrade():
         """
 
         # Offline mode - without database
-        if is_open is not None:
-            if is_open:
-                sel_trades = LocalTrade.trades_open
-            else:
-                sel_trades = LocalTrade.trades
-
+        if is_open is False:
+            # Use index of closed trades - also filters on pair / close_date
+            sel_trades = LocalTrade._get_closed_trades(pair, close_date)
+            pair = close_date = None
+        elif is_open:
+            sel_trades = LocalTrade.trades_open
         else:
             # Not used during backtesting, but might be used by a strategy
             sel_trades = list(LocalTrade.trades + LocalTrade.trades_open)
@@ -617,18 +626,58 @@ class LocalTrade():
 
         return sel_trades
 
+    @staticmethod
+    def _close_date_key(close_date: Optional[datetime]) -> Tuple[bool, Optional[datetime]]:
+        """
+        Sort key for the closed trades index - trades without close_date are sorted first.
+        """
+        return (close_date is not None, close_date)
+
+    @staticmethod
+    def _get_closed_trades(pair: Optional[str],
+                           close_date: Optional[datetime]) -> List['LocalTrade']:
+        """
+        Get closed trades (for one pair or all pairs) closed after close_date.
+        Uses binary search on the closed trades index.
+        """
+        if pair is None and close_date is None:
+            return LocalTrade.trades
+        if pair not in LocalTrade.trades_closed_index:
+            return []
+        keys, trades = LocalTrade.trades_closed_index[pair]
+        start = 0 if close_date is None else bisect_right(
+            keys, LocalTrade._close_date_key(close_date))
+        return trades[start:]
+
+    @staticmethod
+    def _index_closed_trade(trade: 'LocalTrade') -> None:
+        key = LocalTrade._close_date_key(trade.close_date)
+        for index_key in (None, trade.pair):
+            keys, trades = LocalTrade.trades_closed_index.setdefault(index_key, ([], []))
+            # Trades are usually closed in order - so this will mostly append
+            idx = bisect_right(keys, key)
+            keys.insert(idx, key)
+            trades.insert(idx, trade)
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.trades_open.remove(trade)
         LocalTrade.trades.append(trade)
+        LocalTrade._index_closed_trade(trade)
         LocalTrade.total_profit += trade.close_profit_abs
+        # Reset to 0 once all trades are closed to avoid accumulating rounding errors
+        LocalTrade.total_open_stake = (
+            LocalTrade.total_open_stake - trade.stake_amount if LocalTrade.trades_open else 0)
 
     @staticmethod
     def add_bt_trade(trade):
         if trade.is_open:
             LocalTrade.trades_open.append(trade)
+            LocalTrade.total_open_stake += trade.stake_amount
         else:
             LocalTrade.trades.append(trade)
+            LocalTrade._index_closed_trade(trade)
+            LocalTrade.total_profit += trade.close_profit_abs or 0
 
     @staticmethod
     def get_open_trades() -> List[Any]:
@@ -667,6 +716,9 @@ class Trade(_DECL_BASE, LocalTrade):
     __tablename__ = 'trades'
 
     use_db: bool = True
+    # Incremented whenever closed trades are written to the database - allows to cache
+    # results derived from closed trades (see _closed_trades_changed()).
+    closed_trades_version: int = 0
 
     id = Column(Integer, primary_key=True)
 
@@ -836,8 +888,7 @@ class Trade(_DECL_BASE, LocalTrade):
             total_open_stake_amount = Trade.query.with_entities(
                 func.sum(Trade.stake_amount)).filter(Trade.is_open.is_(True)).scalar()
         else:
-            total_open_stake_amount = sum(
-                t.stake_amount for t in LocalTrade.get_trades_proxy(is_open=True))
+            total_open_stake_amount = LocalTrade.total_open_stake
         return total_open_stake_amount or 0
 
     @staticmethod
@@ -1002,6 +1053,88 @@ class Trade(_DECL_BASE, LocalTrade):
             .order_by(desc('profit_sum')).first()
         return best_pair
 
+    @staticmethod
+    def get_daily_profit(start_date: date) -> Dict[date, Tuple[float, int]]:
+        """
+        Sum of close_profit_abs and number of closed trades per close day (UTC),
+        for trades closed on or after start_date.
+        NOTE: Not supported in Backtesting.
+        :returns: Dict of close day: (profit_abs, trade_count) - days without trades are omitted
+        """
+        close_day = func.date(Trade.close_date, type_=Date)
+        rows = Trade.query.with_entities(
+            close_day.label('close_day'),
+            func.sum(Trade.close_profit_abs).label('profit_sum_abs'),
+            func.count(Trade.id).label('count')
+        ).filter(Trade.is_open.is_(False) & (Trade.close_date >= start_date)) \
+            .group_by(close_day) \
+            .all()
+        return {day: (profit or 0, count) for day, profit, count in rows}
+
+    @staticmethod
+    def get_closed_trades_stats(start_date: datetime) -> Dict[str, Any]:
+        """
+        Aggregated statistics of trades closed after start_date.
+        Trades without open_rate are only part of trade_count.
+        Unlike calc_profit(), calc_profit_sum doesn't round the profit of every trade
+        to 8 decimals - the sum may differ by up to 5e-9 per trade.
+        NOTE: Not supported in Backtesting.
+        :returns: Dict containing trade_count, profit_count, profit_sum_abs,
+            calc_profit_sum (profit recalculated from close_rate), profit_sum,
+            winning_trades, losing_trades, duration_sum (seconds),
+            and id / open_date of the first and the latest trade (by id)
+        """
+        closed_filter = Trade.is_open.is_(False) & (Trade.close_date >= start_date)
+        profit_filter = closed_filter & (Trade.open_rate > 0)
+
+        trade_count = Trade.query.with_entities(func.count(Trade.id)).filter(
+            closed_filter).scalar()
+        (profit_count, profit_sum_abs, calc_profit_sum, profit_sum,
+         winning_trades) = Trade.query.with_entities(
+            func.count(Trade.id),
+            func.sum(Trade.close_profit_abs),
+            # calc_profit() at close_rate
+            func.sum(Trade.amount * func.coalesce(Trade.close_rate, 0) * (1 - Trade.fee_close)
+                     - Trade.open_trade_value),
+            func.sum(Trade.close_profit),
+            func.sum(case([(Trade.close_profit >= 0, 1)], else_=0)),
+        ).filter(profit_filter).one()
+        # Date arithmetic is not portable across databases - only load the two columns
+        duration_sum = sum(
+            (close_date - open_date).total_seconds()
+            for open_date, close_date in Trade.query.with_entities(
+                Trade.open_date, Trade.close_date).filter(profit_filter)
+            if close_date is not None and open_date is not None
+        )
+        first_trade = Trade.query.with_entities(Trade.id, Trade.open_date).filter(
+            closed_filter).order_by(Trade.id).first()
+        latest_trade = Trade.query.with_entities(Trade.id, Trade.open_date).filter(
+            closed_filter).order_by(Trade.id.desc()).first()
+        return {
+            'trade_count': trade_count,
+            'profit_count': profit_count,
+            'profit_sum_abs': profit_sum_abs or 0.0,
+            'calc_profit_sum': calc_profit_sum or 0.0,
+            'profit_sum': profit_sum or 0.0,
+            'winning_trades': winning_trades or 0,
+            'losing_trades': profit_count - (winning_trades or 0),
+            'duration_sum': duration_sum,
+            'first_trade': tuple(first_trade) if first_trade else None,
+            'latest_trade': tuple(latest_trade) if latest_trade else None,
+        }
+
+
+@event.listens_for(Trade, 'after_insert')
+@event.listens_for(Trade, 'after_update')
+@event.listens_for(Trade, 'after_delete')
+def _closed_trades_changed(mapper, connection, target: Trade) -> None:
+    """
+    Invalidate results cached for closed trades once a closed trade is written.
+    Updates to open trades (happening every iteration) are ignored.
+    """
+    if not target.is_open:
+        Trade.closed_trades_version += 1
+
 
 class PairLock(_DECL_BASE):
     """
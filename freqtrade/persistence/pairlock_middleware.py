@@ -1,6 +1,7 @@
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from freqtrade.exchange import timeframe_to_next_date
 from freqtrade.persistence.models import PairLock
@@ -18,6 +19,10 @@ class PairLocks():
 
     use_db = True
     locks: List[PairLock] = []
+    # Index of locks per pair (including '*' for global locks) - only used without database.
+    # Lock end times are kept sorted (with (sequence, lock) tuples in the same order),
+    # so expired locks can be skipped using binary search.
+    _lock_index: Dict[str, Tuple[List[datetime], List[Tuple[int, PairLock]]]] = {}
 
     timeframe: str = ''
 
@@ -28,6 +33,7 @@ class PairLocks():
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._lock_index = {}
 
     @staticmethod
     def lock_pair(pair: str, until: datetime, reason: str = None, *,
@@ -52,6 +58,10 @@ class PairLocks():
             PairLock.query.session.add(lock)
             PairLock.query.session.commit()
         else:
+            ends, entries = PairLocks._lock_index.setdefault(lock.pair, ([], []))
+            idx = bisect_right(ends, lock.lock_end_time)
+            ends.insert(idx, lock.lock_end_time)
+            entries.insert(idx, (len(PairLocks.locks), lock))
             PairLocks.locks.append(lock)
         return lock
 
@@ -69,12 +79,15 @@ class PairLocks():
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now).all()
         else:
-            locks = [lock for lock in PairLocks.locks if (
-                lock.lock_end_time >= now
-                and lock.active is True
-                and (pair is None or lock.pair == pair)
-            )]
-            return locks
+            pairs = PairLocks._lock_index.keys() if pair is None else [pair]
+            entries: List[Tuple[int, PairLock]] = []
+            for p in pairs:
+                if p in PairLocks._lock_index:
+                    ends, pair_entries = PairLocks._lock_index[p]
+                    entries.extend(entry for entry in pair_entries[bisect_left(ends, now):]
+                                   if entry[1].active is True)
+            # Keep order of creation
+            return [lock for _, lock in sorted(entries, key=lambda entry: entry[0])]
 
     @staticmethod
     def get_pair_longest_lock(pair: str, now: Optional[datetime] = None) -> Optional[PairLock]:
@@ -128,7 +141,7 @@ class PairLocks():
             PairLock.query.session.commit()
         else:
             # used in backtesting mode; don't show log messages for speed
-            locks = PairLocks.get_pair_locks(None)
+            locks = PairLocks.get_pair_locks(None, now)
             for lock in locks:
                 if lock.reason == reason:
                     lock.active = False
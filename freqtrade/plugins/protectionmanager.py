@@ -5,7 +5,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
-from freqtrade.persistence import PairLocks
+from freqtrade.persistence import LocalTrade, PairLocks
 from freqtrade.persistence.models import PairLock
 from freqtrade.plugins.protections import IProtection
 from freqtrade.resolvers import ProtectionResolver
@@ -44,6 +44,13 @@ class ProtectionManager():
         """
         return [{p.name: p.short_desc()} for p in self._protection_handlers]
 
+    def trade_closed(self, trade: LocalTrade) -> None:
+        """
+        Update protections with a trade closed during backtesting.
+        """
+        for protection_handler in self._protection_handlers:
+            protection_handler.trade_closed(trade)
+
     def global_stop(self, now: Optional[datetime] = None) -> Optional[PairLock]:
         if not now:
             now = datetime.now(timezone.utc)
@@ -1,8 +1,7 @@
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -26,24 +25,18 @@ class CooldownPeriod(IProtection):
         """
         return (f"{self.name} - Cooldown period of {self.stop_duration_str}.")
 
+    @property
+    def _window_period(self) -> int:
+        return self._stop_duration
+
     def _cooldown_period(self, pair: str, date_now: datetime, ) -> ProtectionReturn:
         """
         Get last trade for this pair
         """
-        look_back_until = date_now - timedelta(minutes=self._stop_duration)
-        # filters = [
-        #     Trade.is_open.is_(False),
-        #     Trade.close_date > look_back_until,
-        #     Trade.pair == pair,
-        # ]
-        # trade = Trade.get_trades(filters).first()
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
+        trades = self._get_trade_window(date_now, pair)
         if trades:
-            # Get latest trade
-            # Ignore type error as we know we only get closed trades.
-            trade = sorted(trades, key=lambda t: t.close_date)[-1]  # type: ignore
             self.log_once(f"Cooldown for {pair} for {self.stop_duration_str}.", logger.info)
-            until = self.calculate_lock_end([trade], self._stop_duration)
+            until = self.calculate_lock_end(trades, self._stop_duration)
 
             return True, until, self._reason()
 
@@ -1,13 +1,14 @@
 
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import plural
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import LocalTrade
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.plugins.protections.trade_window import TradeWindow
 
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,10 @@ class IProtection(LoggingMixin, ABC):
             self._lookback_period_candles = None
             self._lookback_period = int(protection_config.get('lookback_period', 60))
 
+        # Closed trades within the lookback period - per pair, and for all pairs (key None).
+        # Fed by trade_closed() in backtesting.
+        self._trade_windows: Dict[Optional[str], TradeWindow] = {}
+
         LoggingMixin.__init__(self, logger)
 
     @property
@@ -95,16 +100,64 @@ class IProtection(LoggingMixin, ABC):
             If true, this pair will be locked with <reason> until <until>
         """
 
-    @staticmethod
-    def calculate_lock_end(trades: List[LocalTrade], stop_minutes: int) -> datetime:
+    @property
+    def _window_period(self) -> int:
         """
-        Get lock end time
+        Minutes closed trades are relevant for this protection.
         """
-        max_date: datetime = max([trade.close_date for trade in trades if trade.close_date])
-        # comming from Database, tzinfo is not set.
-        if max_date.tzinfo is None:
-            max_date = max_date.replace(tzinfo=timezone.utc)
+        return self._lookback_period
 
-        until = max_date + timedelta(minutes=stop_minutes)
+    def _track_trade(self, trade: LocalTrade) -> bool:
+        """
+        Should this closed trade be considered by this protection?
+        """
+        return True
 
-        return until
+    def trade_closed(self, trade: LocalTrade) -> None:
+        """
+        Add a closed trade to the trade windows of this protection.
+        Used in backtesting only - in dry / live mode, trades are loaded from the database.
+        """
+        if not self._track_trade(trade):
+            return
+        keys: List[Optional[str]] = []
+        if self.has_global_stop:
+            keys.append(None)
+        if self.has_local_stop:
+            keys.append(trade.pair)
+        for key in keys:
+            if key not in self._trade_windows:
+                self._trade_windows[key] = TradeWindow(timedelta(minutes=self._window_period))
+            self._add_to_window(self._trade_windows[key], trade)
+
+    def _get_trade_window(self, date_now: datetime, pair: Optional[str] = None) -> TradeWindow:
+        """
+        Closed trades (for this pair, or for all pairs) within the lookback period.
+        """
+        lookback = timedelta(minutes=self._window_period)
+        if Trade.use_db:
+            window = TradeWindow(lookback)
+            trades = Trade.get_trades_proxy(pair=pair, is_open=False,
+                                            close_date=date_now - lookback)
+            # Ignore type error as we know we only get closed trades.
+            for trade in sorted(trades, key=lambda t: t.close_date):  # type: ignore
+                if self._track_trade(trade):
+                    self._add_to_window(window, trade)
+            return window
+        if pair not in self._trade_windows:
+            self._trade_windows[pair] = TradeWindow(lookback)
+        window = self._trade_windows[pair]
+        window.expire(date_now)
+        return window
+
+    @staticmethod
+    def _add_to_window(window: TradeWindow, trade: LocalTrade) -> None:
+        # Closed trades always have a close_date
+        window.add(cast(datetime, trade.close_date), trade.close_profit or 0.0)
+
+    @staticmethod
+    def calculate_lock_end(trades: TradeWindow, stop_minutes: int) -> datetime:
+        """
+        Get lock end time - based on the latest trade within the window
+        """
+        return trades.last_close_date + timedelta(minutes=stop_minutes)
@@ -1,9 +1,8 @@
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict
 
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -39,21 +38,12 @@ class LowProfitPairs(IProtection):
         """
         Evaluate recent trades for pair
         """
-        look_back_until = date_now - timedelta(minutes=self._lookback_period)
-        # filters = [
-        #     Trade.is_open.is_(False),
-        #     Trade.close_date > look_back_until,
-        # ]
-        # if pair:
-        #     filters.append(Trade.pair == pair)
-
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
-        # trades = Trade.get_trades(filters).all()
+        trades = self._get_trade_window(date_now, pair)
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
             return False, None, None
 
-        profit = sum(trade.close_profit for trade in trades if trade.close_profit)
+        profit = trades.profit
         if profit < self._required_profit:
             self.log_once(
                 f"Trading for {pair} stopped due to {profit:.2f} < {self._required_profit} "
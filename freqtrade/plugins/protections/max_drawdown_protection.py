@@ -1,12 +1,8 @@
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict
 
-import pandas as pd
-
-from freqtrade.data.btanalysis import calculate_max_drawdown
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -43,21 +39,14 @@ class MaxDrawdown(IProtection):
         """
         Evaluate recent trades for drawdown ...
         """
-        look_back_until = date_now - timedelta(minutes=self._lookback_period)
-
-        trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
-
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
+        trades = self._get_trade_window(date_now)
 
         if len(trades) < self._trade_limit:
             # Not enough trades in the relevant period
             return False, None, None
 
         # Drawdown is always positive
-        try:
-            drawdown, _, _, _, _ = calculate_max_drawdown(trades_df, value_col='close_profit')
-        except ValueError:
-            return False, None, None
+        drawdown = trades.drawdown
 
         if drawdown > self._max_allowed_drawdown:
             self.log_once(
@@ -1,10 +1,10 @@
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict
 
 from freqtrade.enums import SellType
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -36,27 +36,20 @@ class StoplossGuard(IProtection):
         return (f'{self._trade_limit} stoplosses in {self._lookback_period} min, '
                 f'locking for {self._stop_duration} min.')
 
-    def _stoploss_guard(self, date_now: datetime, pair: str = None) -> ProtectionReturn:
+    def _track_trade(self, trade: LocalTrade) -> bool:
         """
-        Evaluate recent trades
+        Only losing trades closed by a stoploss count.
         """
-        look_back_until = date_now - timedelta(minutes=self._lookback_period)
-        # filters = [
-        #     Trade.is_open.is_(False),
-        #     Trade.close_date > look_back_until,
-        #     or_(Trade.sell_reason == SellType.STOP_LOSS.value,
-        #         and_(Trade.sell_reason == SellType.TRAILING_STOP_LOSS.value,
-        #              Trade.close_profit < 0))
-        # ]
-        # if pair:
-        #     filters.append(Trade.pair == pair)
-        # trades = Trade.get_trades(filters).all()
-
-        trades1 = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
-        trades = [trade for trade in trades1 if (str(trade.sell_reason) in (
+        return bool(str(trade.sell_reason) in (
             SellType.TRAILING_STOP_LOSS.value, SellType.STOP_LOSS.value,
             SellType.STOPLOSS_ON_EXCHANGE.value)
-            and trade.close_profit and trade.close_profit < 0)]
+            and trade.close_profit and trade.close_profit < 0)
+
+    def _stoploss_guard(self, date_now: datetime, pair: str = None) -> ProtectionReturn:
+        """
+        Evaluate recent trades
+        """
+        trades = self._get_trade_window(date_now, pair)
 
         if len(trades) < self._trade_limit:
             return False, None, None
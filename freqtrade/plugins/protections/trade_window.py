@@ -0,0 +1,123 @@
+"""
+Rolling window of closed trades, used by protections.
+"""
+from bisect import bisect_right
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Deque, List, Optional, Tuple
+
+
+# Summary of consecutive trade results: (total, max cumulative, min cumulative, max drawdown).
+# Cumulative values are relative to the start of the summarized trades.
+# Summaries of neighbouring trades can be combined (see _combine()) - which allows to maintain
+# the drawdown of a sliding window using a queue built from two stacks.
+Summary = Tuple[float, float, float, float]
+
+
+def _ensure_utc(date: datetime) -> datetime:
+    # Dates coming from the database don't have tzinfo set.
+    return date.replace(tzinfo=timezone.utc) if date.tzinfo is None else date
+
+
+class TradeWindow:
+    """
+    Profits of closed trades within a lookback period, sorted by close date.
+    Aggregates (number of trades, profit sum, max drawdown and last close date) are updated
+    when trades are added or expire - so evaluating them does not depend on the number of
+    trades within the window.
+    Expiry assumes that the window is evaluated in chronological order.
+    """
+
+    def __init__(self, lookback: timedelta) -> None:
+        self._lookback = lookback
+        self._close_dates: Deque[datetime] = deque()
+        self._profits: Deque[float] = deque()
+        self.profit: float = 0.0
+        # Queue of summaries - the front stack holds the oldest trades (oldest at the end),
+        # each entry summarizing the trade and all newer trades on the front stack.
+        self._front: List[Summary] = []
+        # Newer trades, summarized in _back_summary.
+        self._back: List[float] = []
+        self._back_summary: Optional[Summary] = None
+
+    def __len__(self) -> int:
+        return len(self._close_dates)
+
+    @property
+    def last_close_date(self) -> datetime:
+        """
+        Close date of the latest trade - raises IndexError for empty windows.
+        """
+        return self._close_dates[-1]
+
+    @property
+    def drawdown(self) -> float:
+        """
+        Max drawdown of the cumulative profit of trades within the window.
+        Equivalent to calculate_max_drawdown(), without raising for windows without drawdown.
+        """
+        if self._front and self._back_summary:
+            return self._combine(self._front[-1], self._back_summary)[3]
+        summary = self._front[-1] if self._front else self._back_summary
+        return summary[3] if summary else 0.0
+
+    def add(self, close_date: datetime, profit: float) -> None:
+        """
+        Add a closed trade.
+        Trades are usually closed in chronological order - otherwise, summaries are rebuilt.
+        """
+        close_date = _ensure_utc(close_date)
+        if self._close_dates and close_date < self._close_dates[-1]:
+            idx = bisect_right(self._close_dates, close_date)
+            self._close_dates.insert(idx, close_date)
+            self._profits.insert(idx, profit)
+            self.profit += profit
+            self._front, self._back, self._back_summary = [], [], None
+            for value in self._profits:
+                self._push(value)
+            return
+        self._close_dates.append(close_date)
+        self._profits.append(profit)
+        self.profit += profit
+        self._push(profit)
+
+    def expire(self, date_now: datetime) -> None:
+        """
+        Remove trades closed before the lookback period ending at date_now.
+        """
+        look_back_until = _ensure_utc(date_now) - self._lookback
+        while self._close_dates and self._close_dates[0] <= look_back_until:
+            self._close_dates.popleft()
+            self.profit -= self._profits.popleft()
+            self._pop()
+        if not self._close_dates:
+            # Avoid accumulating rounding errors
+            self.profit = 0.0
+
+    def _push(self, profit: float) -> None:
+        summary = (profit, profit, profit, 0.0)
+        self._back.append(profit)
+        self._back_summary = (self._combine(self._back_summary, summary)
+                              if self._back_summary else summary)
+
+    def _pop(self) -> None:
+        if not self._front:
+            # Move newer trades to the front stack - newest first.
+            summary: Optional[Summary] = None
+            while self._back:
+                profit = self._back.pop()
+                element = (profit, profit, profit, 0.0)
+                summary = self._combine(element, summary) if summary else element
+                self._front.append(summary)
+            self._back_summary = None
+        self._front.pop()
+
+    @staticmethod
+    def _combine(older: Summary, newer: Summary) -> Summary:
+        total, max_cum, min_cum, drawdown = older
+        return (
+            total + newer[0],
+            max(max_cum, total + newer[1]),
+            min(min_cum, total + newer[2]),
+            max(drawdown, newer[3], max_cum - (total + newer[2])),
+        )
@@ -96,7 +96,9 @@ class StrategyResolver(IResolver):
                       ("ignore_roi_if_buy_signal",        False),
                       ("sell_profit_offset",              0.0),
                       ("disable_dataframe_checks",        False),
-                      ("ignore_buying_expired_candle_after",  0)
+                      ("ignore_buying_expired_candle_after",  0),
+                      ("incremental_indicators",          False),
+                      ("incremental_indicators_verify",   False),
                       ]
         for attribute, default in attributes:
             StrategyResolver._override_attribute_helper(strategy, config,
@@ -166,6 +168,17 @@ class StrategyResolver(IResolver):
             raise ImportError(f"Impossible to load Strategy '{strategy.__class__.__name__}'. "
                               f"Order-time-in-force mapping is incomplete.")
 
+        if strategy.incremental_indicators:
+            if (type(strategy).populate_indicators_incremental
+                    is IStrategy.populate_indicators_incremental):
+                raise ImportError(f"Impossible to load Strategy '{strategy.__class__.__name__}'. "
+                                  f"incremental_indicators requires "
+                                  f"populate_indicators_incremental() to be implemented.")
+            if strategy._ft_informative:
+                raise ImportError(f"Impossible to load Strategy '{strategy.__class__.__name__}'. "
+                                  f"incremental_indicators can't be combined with "
+                                  f"@informative decorated methods.")
+
     @staticmethod
     def _load_strategy(strategy_name: str,
                        config: dict, extra_dir: Optional[str] = None) -> IStrategy:
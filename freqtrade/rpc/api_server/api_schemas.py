@@ -376,3 +376,19 @@ class BacktestResponse(BaseModel):
 class SysInfo(BaseModel):
     cpu_pct: List[float]
     ram_pct: float
+
+
+class TimingStats(BaseModel):
+    count: int
+    sum: float
+    last: float
+    p50: float
+    p95: float
+    max: float
+
+
+class LoopTimings(BaseModel):
+    throttle_secs: float
+    window: int
+    stages: Dict[str, TimingStats]
+    pairs: Dict[str, TimingStats]
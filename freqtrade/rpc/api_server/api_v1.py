@@ -3,8 +3,9 @@ from copy import deepcopy
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi.exceptions import HTTPException
+from fastapi.responses import PlainTextResponse, Response
 
 from freqtrade import __version__
 from freqtrade.constants import USERPATH_STRATEGIES
@@ -15,17 +16,21 @@ from freqtrade.rpc.api_server.api_schemas import (AvailablePairs, Balances, Blac
                                                   BlacklistResponse, Count, Daily,
                                                   DeleteLockRequest, DeleteTrade, ForceBuyPayload,
                                                   ForceBuyResponse, ForceSellPayload, Locks, Logs,
-                                                  OpenTradeSchema, PairHistory, PerformanceEntry,
-                                                  Ping, PlotConfig, Profit, ResultMsg, ShowConfig,
-                                                  Stats, StatusMsg, StrategyListResponse,
-                                                  StrategyResponse, SysInfo, Version,
-                                                  WhitelistResponse)
+                                                  LoopTimings, OpenTradeSchema, PairHistory,
+                                                  PerformanceEntry, Ping, PlotConfig, Profit,
+                                                  ResultMsg, ShowConfig, Stats, StatusMsg,
+                                                  StrategyListResponse, StrategyResponse, SysInfo,
+                                                  Version, WhitelistResponse)
 from freqtrade.rpc.api_server.deps import get_config, get_rpc, get_rpc_optional
 from freqtrade.rpc.rpc import RPCException
 
 
 logger = logging.getLogger(__name__)
 
+PAIR_DATA_FORMATS = '^(json|arrow)$'
+ARROW_STREAM_MEDIA_TYPE = 'application/vnd.apache.arrow.stream'
+PROMETHEUS_MEDIA_TYPE = 'text/plain; version=0.0.4'
+
 # Public API, requires no auth.
 router_public = APIRouter()
 # Private API, protected by authentication
@@ -190,19 +195,34 @@ def reload_config(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_reload_config()
 
 
+def _pair_data_response(data):
+    """ Arrow payloads are returned as binary response """
+    if isinstance(data, bytes):
+        return Response(content=data, media_type=ARROW_STREAM_MEDIA_TYPE)
+    return data
+
+
 @router.get('/pair_candles', response_model=PairHistory, tags=['candle data'])
-def pair_candles(pair: str, timeframe: str, limit: Optional[int], rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_analysed_dataframe(pair, timeframe, limit)
+def pair_candles(pair: str, timeframe: str, limit: Optional[int], since_ms: Optional[int] = None,
+                 columns: Optional[List[str]] = Query(None),
+                 format: str = Query('json', regex=PAIR_DATA_FORMATS),
+                 rpc: RPC = Depends(get_rpc)):
+    return _pair_data_response(rpc._rpc_analysed_dataframe(
+        pair, timeframe, limit, since_ms, columns, arrow_format=format == 'arrow'))
 
 
 @router.get('/pair_history', response_model=PairHistory, tags=['candle data'])
 def pair_history(pair: str, timeframe: str, timerange: str, strategy: str,
+                 since_ms: Optional[int] = None,
+                 columns: Optional[List[str]] = Query(None),
+                 format: str = Query('json', regex=PAIR_DATA_FORMATS),
                  config=Depends(get_config)):
     config = deepcopy(config)
     config.update({
         'strategy': strategy,
     })
-    return RPC._rpc_analysed_history_full(config, pair, timeframe, timerange)
+    return _pair_data_response(RPC._rpc_analysed_history_full(
+        config, pair, timeframe, timerange, since_ms, columns, arrow_format=format == 'arrow'))
 
 
 @router.get('/plot_config', response_model=PlotConfig, tags=['candle data'])
@@ -265,3 +285,15 @@ def list_available_pairs(timeframe: Optional[str] = None, stake_currency: Option
 @router.get('/sysinfo', response_model=SysInfo, tags=['info'])
 def sysinfo():
     return RPC._rpc_sysinfo()
+
+
+@router.get('/loop_timings', response_model=LoopTimings, tags=['info'])
+def loop_timings(rpc: RPC = Depends(get_rpc)):
+    return rpc._rpc_loop_timings()
+
+
+@router.get('/metrics', response_class=PlainTextResponse, tags=['info'])
+def metrics(rpc: RPC = Depends(get_rpc), config=Depends(get_config)):
+    if not config['api_server'].get('enable_metrics', False):
+        raise HTTPException(status_code=404, detail='Metrics endpoint is not enabled.')
+    return PlainTextResponse(rpc._rpc_metrics(), media_type=PROMETHEUS_MEDIA_TYPE)
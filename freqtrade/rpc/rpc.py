@@ -1,21 +1,25 @@
 """
 This module contains class to define a RPC communications
 """
+import json
 import logging
 from abc import abstractmethod
 from datetime import date, datetime, timedelta, timezone
 from math import isnan
-from typing import Any, Dict, List, Optional, Tuple, Union
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import arrow
 import psutil
+import pyarrow as pa
+from cachetools import LRUCache
 from dateutil.relativedelta import relativedelta
-from numpy import NAN, inf, int64, mean
-from pandas import DataFrame
+from numpy import NAN, inf, int64
+from pandas import DataFrame, to_datetime
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
-from freqtrade.constants import CANCEL_REASON, DATETIME_PRINT_FORMAT
+from freqtrade.constants import CANCEL_REASON, DATETIME_PRINT_FORMAT, PROCESS_THROTTLE_SECS
 from freqtrade.data.history import load_data
 from freqtrade.enums import SellType, State
 from freqtrade.exceptions import ExchangeError, PricingError
@@ -96,6 +100,8 @@ class RPC:
         self._config: Dict[str, Any] = freqtrade.config
         if self._config.get('fiat_display_currency', None):
             self._fiat_converter = CryptoToFiatConverter()
+        self._closed_trades_cache: LRUCache = LRUCache(maxsize=16)
+        self._closed_trades_lock = Lock()
 
     @staticmethod
     def _rpc_show_config(config, botstate: Union[State, str]) -> Dict[str, Any]:
@@ -251,32 +257,55 @@ class RPC:
             columns = ['ID', 'Pair', 'Since', profitcol]
             return trades_list, columns, fiat_profit_sum
 
-    def _rpc_daily_profit(
-            self, timescale: int,
-            stake_currency: str, fiat_display_currency: str) -> Dict[str, Any]:
-        today = datetime.now(timezone.utc).date()
-        profit_days: Dict[date, Dict] = {}
+    def _get_closed_trades_cached(self, name: str, arg: Any,
+                                  func: Callable[[Any], Any]) -> Any:
+        """
+        Results derived from closed trades only change once a trade closes -
+        so they are cached until Trade.closed_trades_version changes.
+        Cached results must not be modified.
+        """
+        key = (name, arg, Trade.closed_trades_version)
+        with self._closed_trades_lock:
+            if key not in self._closed_trades_cache:
+                self._closed_trades_cache[key] = func(arg)
+            return self._closed_trades_cache[key]
 
+    @staticmethod
+    def _timeunit_start(day: date, timeunit: str) -> date:
+        """ First day of the day / week (Monday) / month containing day """
+        if timeunit == 'weeks':
+            return day - timedelta(days=day.weekday())
+        if timeunit == 'months':
+            return day.replace(day=1)
+        return day
+
+    def _rpc_timeunit_profit(
+            self, timescale: int,
+            stake_currency: str, fiat_display_currency: str,
+            timeunit: str = 'days') -> Dict[str, Any]:
+        """
+        Profit of closed trades per day, week or month - for the last `timescale` periods.
+        Uses one grouped query (per close day), which is rolled up into weeks / months.
+        """
         if not (isinstance(timescale, int) and timescale > 0):
             raise RPCException('timescale must be an integer greater than 0')
 
-        for day in range(0, timescale):
-            profitday = today - timedelta(days=day)
-            trades = Trade.get_trades(trade_filter=[
-                Trade.is_open.is_(False),
-                Trade.close_date >= profitday,
-                Trade.close_date < (profitday + timedelta(days=1))
-            ]).order_by(Trade.close_date).all()
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None)
-            profit_days[profitday] = {
-                'amount': curdayprofit,
-                'trades': len(trades)
-            }
+        first_day = self._timeunit_start(datetime.now(timezone.utc).date(), timeunit)
+        periods = [first_day - relativedelta(**{timeunit: unit}) for unit in range(0, timescale)]
+
+        profit_units: Dict[date, Dict] = {period: {'amount': 0, 'trades': 0}
+                                          for period in periods}
+        daily_profit = self._get_closed_trades_cached(
+            'daily_profit', periods[-1], Trade.get_daily_profit)
+        for day, (amount, trades) in sorted(daily_profit.items()):
+            unit = profit_units.get(self._timeunit_start(day, timeunit))
+            if unit is not None:
+                unit['amount'] += amount
+                unit['trades'] += trades
 
         data = [
             {
-                'date': key,
+                'date': f"{key.year}-{key.month:02d}" if timeunit == 'months' else key,
                 'abs_profit': value["amount"],
                 'fiat_value': self._fiat_converter.convert_amount(
                     value['amount'],
@@ -285,7 +314,7 @@ class RPC:
                 ) if self._fiat_converter else 0,
                 'trade_count': value["trades"],
             }
-            for key, value in profit_days.items()
+            for key, value in profit_units.items()
         ]
         return {
             'stake_currency': stake_currency,
@@ -293,90 +322,21 @@ class RPC:
             'data': data
         }
 
-    def _rpc_weekly_profit(
+    def _rpc_daily_profit(
             self, timescale: int,
             stake_currency: str, fiat_display_currency: str) -> Dict[str, Any]:
-        today = datetime.now(timezone.utc).date()
-        first_iso_day_of_week = today - timedelta(days=today.weekday())  # Monday
-        profit_weeks: Dict[date, Dict] = {}
+        return self._rpc_timeunit_profit(timescale, stake_currency, fiat_display_currency, 'days')
 
-        if not (isinstance(timescale, int) and timescale > 0):
-            raise RPCException('timescale must be an integer greater than 0')
-
-        for week in range(0, timescale):
-            profitweek = first_iso_day_of_week - timedelta(weeks=week)
-            trades = Trade.get_trades(trade_filter=[
-                Trade.is_open.is_(False),
-                Trade.close_date >= profitweek,
-                Trade.close_date < (profitweek + timedelta(weeks=1))
-            ]).order_by(Trade.close_date).all()
-            curweekprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None)
-            profit_weeks[profitweek] = {
-                'amount': curweekprofit,
-                'trades': len(trades)
-            }
-
-        data = [
-            {
-                'date': key,
-                'abs_profit': value["amount"],
-                'fiat_value': self._fiat_converter.convert_amount(
-                    value['amount'],
-                    stake_currency,
-                    fiat_display_currency
-                ) if self._fiat_converter else 0,
-                'trade_count': value["trades"],
-            }
-            for key, value in profit_weeks.items()
-        ]
-        return {
-            'stake_currency': stake_currency,
-            'fiat_display_currency': fiat_display_currency,
-            'data': data
-        }
+    def _rpc_weekly_profit(
+            self, timescale: int,
+            stake_currency: str, fiat_display_currency: str) -> Dict[str, Any]:
+        return self._rpc_timeunit_profit(timescale, stake_currency, fiat_display_currency, 'weeks')
 
     def _rpc_monthly_profit(
             self, timescale: int,
             stake_currency: str, fiat_display_currency: str) -> Dict[str, Any]:
-        first_day_of_month = datetime.now(timezone.utc).date().replace(day=1)
-        profit_months: Dict[date, Dict] = {}
-
-        if not (isinstance(timescale, int) and timescale > 0):
-            raise RPCException('timescale must be an integer greater than 0')
-
-        for month in range(0, timescale):
-            profitmonth = first_day_of_month - relativedelta(months=month)
-            trades = Trade.get_trades(trade_filter=[
-                Trade.is_open.is_(False),
-                Trade.close_date >= profitmonth,
-                Trade.close_date < (profitmonth + relativedelta(months=1))
-            ]).order_by(Trade.close_date).all()
-            curmonthprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None)
-            profit_months[profitmonth] = {
-                'amount': curmonthprofit,
-                'trades': len(trades)
-            }
-
-        data = [
-            {
-                'date': f"{key.year}-{key.month:02d}",
-                'abs_profit': value["amount"],
-                'fiat_value': self._fiat_converter.convert_amount(
-                    value['amount'],
-                    stake_currency,
-                    fiat_display_currency
-                ) if self._fiat_converter else 0,
-                'trade_count': value["trades"],
-            }
-            for key, value in profit_months.items()
-        ]
-        return {
-            'stake_currency': stake_currency,
-            'fiat_display_currency': fiat_display_currency,
-            'data': data
-        }
+        return self._rpc_timeunit_profit(timescale, stake_currency, fiat_display_currency,
+                                         'months')
 
     def _rpc_trade_history(self, limit: int, offset: int = 0, order_by_id: bool = False) -> Dict:
         """ Returns the X last trades """
@@ -433,54 +393,46 @@ class RPC:
             self, stake_currency: str, fiat_display_currency: str,
             start_date: datetime = datetime.fromtimestamp(0)) -> Dict[str, Any]:
         """ Returns cumulative profit statistics """
-        trade_filter = ((Trade.is_open.is_(False) & (Trade.close_date >= start_date)) |
-                        Trade.is_open.is_(True))
-        trades = Trade.get_trades(trade_filter).order_by(Trade.id).all()
-
-        profit_all_coin = []
-        profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
+        closed_stats = self._get_closed_trades_cached(
+            'closed_trades_stats', start_date, Trade.get_closed_trades_stats)
+        open_trades = Trade.get_trades(Trade.is_open.is_(True)).order_by(Trade.id).all()
 
-        for trade in trades:
-            current_rate: float = 0.0
+        # Closed trades are aggregated by the database
+        profit_closed_coin_sum = closed_stats['profit_sum_abs']
+        profit_closed_ratio_sum = closed_stats['profit_sum']
+        profit_all_coin = [closed_stats['calc_profit_sum']]
+        profit_all_ratio = [profit_closed_ratio_sum]
 
+        for trade in open_trades:
             if not trade.open_rate:
                 continue
-            if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_ratio = trade.close_profit
-                profit_closed_coin.append(trade.close_profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if trade.close_profit >= 0:
-                    winning_trades += 1
-                else:
-                    losing_trades += 1
-            else:
-                # Get current rate
-                try:
-                    current_rate = self._freqtrade.exchange.get_rate(
-                        trade.pair, refresh=False, side="sell")
-                except (PricingError, ExchangeError):
-                    current_rate = NAN
-                profit_ratio = trade.calc_profit_ratio(rate=current_rate)
-
-            profit_all_coin.append(
-                trade.calc_profit(rate=trade.close_rate or current_rate)
-            )
-            profit_all_ratio.append(profit_ratio)
-
-        best_pair = Trade.get_best_pair(start_date)
+            # Get current rate
+            try:
+                current_rate = self._freqtrade.exchange.get_rate(
+                    trade.pair, refresh=False, side="sell")
+            except (PricingError, ExchangeError):
+                current_rate = NAN
+            profit_all_coin.append(trade.calc_profit(rate=current_rate))
+            profit_all_ratio.append(trade.calc_profit_ratio(rate=current_rate))
+        profit_all_count = closed_stats['profit_count'] + len(profit_all_ratio) - 1
+        trade_count = closed_stats['trade_count'] + len(open_trades)
+
+        # Trades are ordered by id
+        first_trades = [(t.id, t.open_date) for t in open_trades[:1]]
+        latest_trades = [(t.id, t.open_date) for t in open_trades[-1:]]
+        if closed_stats['first_trade']:
+            first_trades.append(closed_stats['first_trade'])
+            latest_trades.append(closed_stats['latest_trade'])
+        first_date = min(first_trades)[1] if first_trades else None
+        last_date = max(latest_trades)[1] if latest_trades else None
+
+        best_pair = self._get_closed_trades_cached(
+            'best_pair', start_date, Trade.get_best_pair)
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(profit_closed_coin_sum, 8)
+        profit_closed_ratio_mean = (profit_closed_ratio_sum / closed_stats['profit_count']
+                                    if closed_stats['profit_count'] else 0.0)
 
         profit_closed_fiat = self._fiat_converter.convert_amount(
             profit_closed_coin_sum,
@@ -489,9 +441,10 @@ class RPC:
         ) if self._fiat_converter else 0
 
         profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
+        profit_all_ratio_sum = sum(profit_all_ratio)
+        profit_all_ratio_mean = (profit_all_ratio_sum / profit_all_count
+                                 if profit_all_count else 0.0)
         starting_balance = self._freqtrade.wallets.get_starting_balance()
         profit_closed_ratio_fromstart = 0
         profit_all_ratio_fromstart = 0
@@ -505,9 +458,7 @@ class RPC:
             fiat_display_currency
         ) if self._fiat_converter else 0
 
-        first_date = trades[0].open_date if trades else None
-        last_date = trades[-1].open_date if trades else None
-        num = float(len(durations) or 1)
+        num = float(closed_stats['profit_count'] or 1)
         return {
             'profit_closed_coin': profit_closed_coin_sum,
             'profit_closed_percent_mean': round(profit_closed_ratio_mean * 100, 2),
@@ -525,18 +476,19 @@ class RPC:
             'profit_all_ratio': profit_all_ratio_fromstart,
             'profit_all_percent': round(profit_all_ratio_fromstart * 100, 2),
             'profit_all_fiat': profit_all_fiat,
-            'trade_count': len(trades),
-            'closed_trade_count': len([t for t in trades if not t.is_open]),
+            'trade_count': trade_count,
+            'closed_trade_count': closed_stats['trade_count'],
             'first_trade_date': arrow.get(first_date).humanize() if first_date else '',
             'first_trade_timestamp': int(first_date.timestamp() * 1000) if first_date else 0,
             'latest_trade_date': arrow.get(last_date).humanize() if last_date else '',
             'latest_trade_timestamp': int(last_date.timestamp() * 1000) if last_date else 0,
-            'avg_duration': str(timedelta(seconds=sum(durations) / num)).split('.')[0],
+            'avg_duration': str(timedelta(
+                seconds=closed_stats['duration_sum'] / num)).split('.')[0],
             'best_pair': best_pair[0] if best_pair else '',
             'best_rate': round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             'best_pair_profit_ratio': best_pair[1] if best_pair else 0,
-            'winning_trades': winning_trades,
-            'losing_trades': losing_trades,
+            'winning_trades': closed_stats['winning_trades'],
+            'losing_trades': closed_stats['losing_trades'],
         }
 
     def _rpc_balance(self, stake_currency: str, fiat_display_currency: str) -> Dict:
@@ -894,40 +846,74 @@ class RPC:
 
         return {'log_count': len(records), 'logs': records}
 
-    def _rpc_edge(self) -> List[Dict[str, Any]]:
+    def _rpc_edge(self) -> Dict[str, Any]:
         """ Returns information related to Edge """
         if not self._freqtrade.edge:
             raise RPCException('Edge is not enabled.')
-        return self._freqtrade.edge.accepted_pairs()
+        return {
+            'pairs': self._freqtrade.edge.accepted_pairs(),
+            **self._freqtrade.edge.calculation_status(),
+        }
 
     @staticmethod
-    def _convert_dataframe_to_dict(strategy: str, pair: str, timeframe: str, dataframe: DataFrame,
-                                   last_analyzed: datetime) -> Dict[str, Any]:
-        has_content = len(dataframe) != 0
+    def _select_candles(dataframe: DataFrame, limit: Optional[int] = None,
+                        since_ms: Optional[int] = None,
+                        columns: Optional[List[str]] = None) -> DataFrame:
+        """
+        Select the candles / columns to return - before copying the dataframe.
+        :param limit: Limit result to the last n candles
+        :param since_ms: Only return candles after this timestamp (in ms)
+        :param columns: Columns to return. date and the signal columns are always returned,
+            unknown columns are ignored.
+        :return: copy of the selected part of dataframe
+        """
+        if since_ms and len(dataframe) > 0:
+            since = to_datetime(since_ms, unit='ms', utc=True)
+            dataframe = dataframe.iloc[dataframe['date'].searchsorted(since, side='right'):]
+        if limit:
+            dataframe = dataframe.iloc[-limit:]
+        if columns:
+            selected = set(columns) | {'date', 'buy', 'sell'}
+            dataframe = dataframe[[col for col in dataframe.columns if col in selected]]
+        return dataframe.copy()
+
+    @staticmethod
+    def _add_signal_columns(dataframe: DataFrame) -> Tuple[DataFrame, int, int]:
+        """
+        Add the candle timestamp (in ms) and the close rates of signal candles, for easy plotting.
+        Modifies dataframe in place.
+        :return: dataframe, number of buy signals, number of sell signals
+        """
         buy_signals = 0
         sell_signals = 0
-        if has_content:
-
+        if len(dataframe) != 0:
             dataframe.loc[:, '__date_ts'] = dataframe.loc[:, 'date'].view(int64) // 1000 // 1000
             # Move signal close to separate column when signal for easy plotting
+            # (close may not be part of the selected columns)
+            has_close = 'close' in dataframe.columns
             if 'buy' in dataframe.columns:
                 buy_mask = (dataframe['buy'] == 1)
                 buy_signals = int(buy_mask.sum())
-                dataframe.loc[buy_mask, '_buy_signal_close'] = dataframe.loc[buy_mask, 'close']
+                if has_close:
+                    dataframe.loc[buy_mask, '_buy_signal_close'] = dataframe.loc[buy_mask, 'close']
             if 'sell' in dataframe.columns:
                 sell_mask = (dataframe['sell'] == 1)
                 sell_signals = int(sell_mask.sum())
-                dataframe.loc[sell_mask, '_sell_signal_close'] = dataframe.loc[sell_mask, 'close']
-            dataframe = dataframe.replace([inf, -inf], NAN)
-            dataframe = dataframe.replace({NAN: None})
+                if has_close:
+                    dataframe.loc[sell_mask, '_sell_signal_close'] = dataframe.loc[sell_mask,
+                                                                                   'close']
+        return dataframe, buy_signals, sell_signals
 
+    @staticmethod
+    def _dataframe_details(strategy: str, pair: str, timeframe: str, dataframe: DataFrame,
+                           last_analyzed: datetime, buy_signals: int,
+                           sell_signals: int) -> Dict[str, Any]:
         res = {
             'pair': pair,
             'timeframe': timeframe,
             'timeframe_ms': timeframe_to_msecs(timeframe),
             'strategy': strategy,
             'columns': list(dataframe.columns),
-            'data': dataframe.values.tolist(),
             'length': len(dataframe),
             'buy_signals': buy_signals,
             'sell_signals': sell_signals,
@@ -938,7 +924,7 @@ class RPC:
             'data_stop': '',
             'data_stop_ts': 0,
         }
-        if has_content:
+        if len(dataframe) != 0:
             res.update({
                 'data_start': str(dataframe.iloc[0]['date']),
                 'data_start_ts': int(dataframe.iloc[0]['__date_ts']),
@@ -947,20 +933,58 @@ class RPC:
             })
         return res
 
-    def _rpc_analysed_dataframe(self, pair: str, timeframe: str,
-                                limit: Optional[int]) -> Dict[str, Any]:
+    @staticmethod
+    def _convert_dataframe_to_dict(strategy: str, pair: str, timeframe: str, dataframe: DataFrame,
+                                   last_analyzed: datetime) -> Dict[str, Any]:
+        dataframe, buy_signals, sell_signals = RPC._add_signal_columns(dataframe)
+        res = RPC._dataframe_details(strategy, pair, timeframe, dataframe, last_analyzed,
+                                     buy_signals, sell_signals)
+        if len(dataframe) != 0:
+            dataframe = dataframe.replace([inf, -inf], NAN)
+            dataframe = dataframe.replace({NAN: None})
+        res['data'] = dataframe.values.tolist()
+        return res
+
+    @staticmethod
+    def _convert_dataframe_to_arrow(strategy: str, pair: str, timeframe: str,
+                                    dataframe: DataFrame, last_analyzed: datetime) -> bytes:
+        """
+        Serialize dataframe as Arrow IPC stream.
+        Columns are transferred as typed arrays (NaN and inf are preserved) - the details
+        returned in the json format (besides columns and data) are stored as json in the
+        schema metadata (key: freqtrade).
+        """
+        dataframe, buy_signals, sell_signals = RPC._add_signal_columns(dataframe)
+        details = RPC._dataframe_details(strategy, pair, timeframe, dataframe, last_analyzed,
+                                         buy_signals, sell_signals)
+        details['last_analyzed'] = last_analyzed.strftime(DATETIME_PRINT_FORMAT)
+        try:
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+        except (pa.ArrowException, TypeError, ValueError) as e:
+            raise RPCException(f"Dataframe can't be converted to arrow: {e}")
+        table = table.replace_schema_metadata({b'freqtrade': json.dumps(details)})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def _rpc_analysed_dataframe(self, pair: str, timeframe: str, limit: Optional[int],
+                                since_ms: Optional[int] = None,
+                                columns: Optional[List[str]] = None,
+                                arrow_format: bool = False) -> Union[Dict[str, Any], bytes]:
 
         _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(
             pair, timeframe)
-        _data = _data.copy()
-        if limit:
-            _data = _data.iloc[-limit:]
-        return self._convert_dataframe_to_dict(self._freqtrade.config['strategy'],
-                                               pair, timeframe, _data, last_analyzed)
+        _data = self._select_candles(_data, limit, since_ms, columns)
+        convert = self._convert_dataframe_to_arrow if arrow_format else \
+            self._convert_dataframe_to_dict
+        return convert(self._freqtrade.config['strategy'], pair, timeframe, _data, last_analyzed)
 
     @staticmethod
-    def _rpc_analysed_history_full(config, pair: str, timeframe: str,
-                                   timerange: str) -> Dict[str, Any]:
+    def _rpc_analysed_history_full(config, pair: str, timeframe: str, timerange: str,
+                                   since_ms: Optional[int] = None,
+                                   columns: Optional[List[str]] = None,
+                                   arrow_format: bool = False) -> Union[Dict[str, Any], bytes]:
         timerange_parsed = TimeRange.parse_timerange(timerange)
 
         _data = load_data(
@@ -978,9 +1002,12 @@ class RPC:
         strategy.dp = DataProvider(config, exchange=None, pairlists=None)
 
         df_analyzed = strategy.analyze_ticker(_data[pair], {'pair': pair})
+        df_analyzed = RPC._select_candles(df_analyzed, since_ms=since_ms, columns=columns)
 
-        return RPC._convert_dataframe_to_dict(strategy.get_strategy_name(), pair, timeframe,
-                                              df_analyzed, arrow.Arrow.utcnow().datetime)
+        convert = RPC._convert_dataframe_to_arrow if arrow_format else \
+            RPC._convert_dataframe_to_dict
+        return convert(strategy.get_strategy_name(), pair, timeframe,
+                       df_analyzed, arrow.Arrow.utcnow().datetime)
 
     def _rpc_plot_config(self) -> Dict[str, Any]:
         if (self._freqtrade.strategy.plot_config and
@@ -988,6 +1015,45 @@ class RPC:
             self._freqtrade.strategy.plot_config['subplots'] = {}
         return self._freqtrade.strategy.plot_config
 
+    def _rpc_loop_timings(self) -> Dict[str, Any]:
+        """
+        Durations of the bot loop stages and of analyzing each pair (in seconds).
+        """
+        return {
+            'throttle_secs': self._config.get('internals', {}).get(
+                'process_throttle_secs', PROCESS_THROTTLE_SECS),
+            'window': self._freqtrade.loop_timings.window,
+            'stages': self._freqtrade.loop_timings.summary(),
+            'pairs': self._freqtrade.strategy.analyze_timings.summary(),
+        }
+
+    def _rpc_metrics(self) -> str:
+        """
+        Loop timings in the Prometheus text exposition format.
+        """
+        timings = self._rpc_loop_timings()
+        lines = [
+            '# HELP freqtrade_loop_throttle_seconds Configured duration of one bot iteration.',
+            '# TYPE freqtrade_loop_throttle_seconds gauge',
+            f'freqtrade_loop_throttle_seconds {timings["throttle_secs"]}',
+        ]
+        for metric, label, help_text, stats in (
+                ('freqtrade_loop_stage_seconds', 'stage', 'Duration of bot loop stages.',
+                 timings['stages']),
+                ('freqtrade_analyze_pair_seconds', 'pair', 'Duration of analyzing a pair.',
+                 timings['pairs'])):
+            lines.extend([f'# HELP {metric} {help_text}', f'# TYPE {metric} summary'])
+            for name, values in stats.items():
+                name = name.replace('\\', '\\\\').replace('"', '\\"')
+                lines.extend([
+                    f'{metric}{{{label}="{name}",quantile="0.5"}} {values["p50"]}',
+                    f'{metric}{{{label}="{name}",quantile="0.95"}} {values["p95"]}',
+                    f'{metric}{{{label}="{name}",quantile="1"}} {values["max"]}',
+                    f'{metric}_sum{{{label}="{name}"}} {values["sum"]}',
+                    f'{metric}_count{{{label}="{name}"}} {values["count"]}',
+                ])
+        return '\n'.join(lines) + '\n'
+
     @staticmethod
     def _rpc_sysinfo() -> Dict[str, Any]:
         return {
@@ -1217,15 +1217,22 @@ class Telegram(RPCHandler):
         Shows information related to Edge
         """
         try:
-            edge_pairs = self._rpc._rpc_edge()
+            edge = self._rpc._rpc_edge()
+            edge_pairs = edge['pairs']
+            if edge['last_calculated']:
+                calculated_at = arrow.get(edge['last_calculated_timestamp'] / 1000)
+                calculated = (f"Calculated {calculated_at.humanize()} "
+                              f"in {edge['calculation_duration']:.1f}s.")
+            else:
+                calculated = 'Not calculated yet.'
             if not edge_pairs:
-                message = '<b>Edge only validated following pairs:</b>'
+                message = f'<b>Edge only validated following pairs:</b>\n{calculated}'
                 self._send_msg(message, parse_mode=ParseMode.HTML)
 
             for chunk in chunks(edge_pairs, 25):
                 edge_pairs_tab = tabulate(chunk, headers='keys', tablefmt='simple')
                 message = (f'<b>Edge only validated following pairs:</b>\n'
-                           f'<pre>{edge_pairs_tab}</pre>')
+                           f'<pre>{edge_pairs_tab}</pre>\n{calculated}')
 
                 self._send_msg(message, parse_mode=ParseMode.HTML)
 
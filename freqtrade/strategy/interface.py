@@ -3,17 +3,19 @@ IStrategy interface
 This module defines the interface to apply for strategies
 """
 import logging
+import time
 import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
 import arrow
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Series
 
 from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.data.dataprovider import DataProvider
-from freqtrade.enums import SellType, SignalTagType, SignalType
+from freqtrade.enums import OPTIMIZE_MODES, RunMode, SellType, SignalTagType, SignalType
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.exchange.exchange import timeframe_to_next_date
@@ -23,11 +25,14 @@ from freqtrade.strategy.informative_decorator import (InformativeData, PopulateI
                                                       _create_and_merge_informative_pair,
                                                       _format_pair_name)
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
+from freqtrade.timings import Timings
 from freqtrade.wallets import Wallets
 
 
 logger = logging.getLogger(__name__)
 CUSTOM_SELL_MAX_LENGTH = 64
+# Number of slowest pairs to show after populating indicators
+INDICATOR_SLOWEST_PAIRS = 5
 
 
 class SellCheckTuple:
@@ -101,6 +106,11 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = False
 
+    # Populate indicators of new candles only (using populate_indicators_incremental())
+    incremental_indicators: bool = False
+    # Compare incrementally populated indicators against populate_indicators()
+    incremental_indicators_verify: bool = False
+
     use_sell_signal: bool
     sell_profit_only: bool
     sell_profit_offset: float
@@ -135,6 +145,8 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: Dict[str, datetime] = {}
+        # Duration of analyze_pair() calls of the bot loop
+        self.analyze_timings = Timings()
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -221,6 +233,21 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return False
 
+    def populate_indicators_incremental(self, dataframe: DataFrame, new_candles: int,
+                                        metadata: dict) -> DataFrame:
+        """
+        Populate indicators for new candles only.
+        Used instead of populate_indicators() in dry-run / live mode if incremental_indicators
+        is set - once the pair has been analyzed before.
+
+        :param dataframe: Previously analyzed dataframe (without buy / sell signals), extended
+            by the new candles - indicators of the last `new_candles` rows are not populated.
+        :param new_candles: Number of new candles at the end of the dataframe (may be 0)
+        :param metadata: Additional information, like the currently traded pair
+        :return: a Dataframe with indicators populated for the new candles
+        """
+        return self.populate_indicators(dataframe, metadata)
+
     def bot_loop_start(self, **kwargs) -> None:
         """
         Called at the start of the bot iteration (one loop).
@@ -500,7 +527,11 @@ class IStrategy(ABC, HyperStrategyMixin):
         if (not self.process_only_new_candles or
                 self._last_candle_seen_per_pair.get(pair, None) != dataframe.iloc[-1]['date']):
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            analyzed = None
+            if self.incremental_indicators and self.dp:
+                analyzed = self._analyze_ticker_incremental(dataframe, metadata)
+            dataframe = (analyzed if analyzed is not None
+                         else self.analyze_ticker(dataframe, metadata))
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
             if self.dp:
                 self.dp._set_cached_df(pair, self.timeframe, dataframe)
@@ -517,6 +548,68 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame,
+                                    metadata: dict) -> Optional[DataFrame]:
+        """
+        Extend the previously analyzed dataframe by the new candles, and populate indicators
+        for these candles only (using populate_indicators_incremental()).
+        Buy and sell signals are populated for the whole dataframe.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: Analyzed dataframe - or None if the previously analyzed dataframe
+            does not match the candle data.
+        """
+        pair = str(metadata.get('pair'))
+        # Signals are populated from scratch, as in analyze_ticker()
+        extended, new_candles = self.dp._extend_cached_df(
+            pair, self.timeframe, dataframe,
+            exclude_columns=[s.value for s in SignalType] + [s.value for s in SignalTagType])
+        if extended is None:
+            return None
+        logger.debug(f"Populating indicators for {new_candles} new candles of {pair}.")
+        extended = self.populate_indicators_incremental(extended, new_candles, metadata)
+        if self.incremental_indicators_verify:
+            full = self.advise_indicators(dataframe, metadata)
+            self._verify_incremental_indicators(pair, extended, full, new_candles)
+            # Continue with the full recalculation
+            extended = full
+        extended = self.advise_buy(extended, metadata)
+        extended = self.advise_sell(extended, metadata)
+        return extended
+
+    @staticmethod
+    def _verify_incremental_indicators(pair: str, incremental: DataFrame, full: DataFrame,
+                                       new_candles: int) -> None:
+        """
+        Log indicators of the new candles which differ between incremental and
+        full calculation.
+        """
+        if new_candles == 0:
+            return
+        mismatches = []
+        for column in full.columns:
+            if column not in incremental.columns:
+                mismatches.append(f"{column} (missing)")
+                continue
+            if incremental[column].dtype != full[column].dtype:
+                mismatches.append(f"{column} (dtype {incremental[column].dtype}, "
+                                  f"expected {full[column].dtype})")
+                continue
+            expected = full[column].iloc[-new_candles:].values
+            actual = incremental[column].iloc[-new_candles:].values
+            try:
+                matching = np.isclose(actual.astype(float), expected.astype(float),
+                                      equal_nan=True).all()
+            except (TypeError, ValueError):
+                matching = Series(actual).equals(Series(expected))
+            if not matching:
+                mismatches.append(column)
+        if mismatches:
+            logger.warning(f"Incremental indicators of {pair} differ from populate_indicators() "
+                           f"for the last {new_candles} candles: {', '.join(mismatches)}.")
+        else:
+            logger.debug(f"Incremental indicators of {pair} verified.")
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -553,7 +646,9 @@ class IStrategy(ABC, HyperStrategyMixin):
         :param pairs: List of pairs to analyze
         """
         for pair in pairs:
-            self.analyze_pair(pair)
+            with self.analyze_timings.measure(pair):
+                self.analyze_pair(pair)
+        self.analyze_timings.retain(pairs)
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
@@ -829,9 +924,62 @@ class IStrategy(ABC, HyperStrategyMixin):
         Also copy on output to avoid PerformanceWarnings pandas 1.3.0 started to show.
         Has positive effects on memory usage for whatever reason - also when
         using only one strategy.
+        Pairs are analyzed in parallel worker processes if `indicator_jobs` is configured.
+        """
+        start = time.perf_counter()
+        jobs = self.config.get('indicator_jobs', 1)
+        if (jobs != 1 and len(data) > 1
+                and RunMode(self.config.get('runmode', RunMode.OTHER)) in OPTIMIZE_MODES):
+            analyzed = self._advise_all_indicators_parallel(data, jobs)
+        else:
+            analyzed = [self._advise_pair_indicators(pair, pair_data)
+                        for pair, pair_data in data.items()]
+
+        self._log_indicator_durations(
+            {pair: duration for pair, (_, duration) in zip(data, analyzed)},
+            time.perf_counter() - start)
+        return {pair: dataframe for pair, (dataframe, _) in zip(data, analyzed)}
+
+    def _advise_pair_indicators(self, pair: str,
+                                pair_data: DataFrame) -> Tuple[DataFrame, float]:
         """
-        return {pair: self.advise_indicators(pair_data.copy(), {'pair': pair}).copy()
-                for pair, pair_data in data.items()}
+        Populates indicators for one pair.
+        :return: Tuple of (dataframe with indicators, duration in seconds)
+        """
+        start = time.perf_counter()
+        dataframe = self.advise_indicators(pair_data.copy(), {'pair': pair}).copy()
+        return dataframe, time.perf_counter() - start
+
+    def _advise_all_indicators_parallel(self, data: Dict[str, DataFrame],
+                                        jobs: int) -> List[Tuple[DataFrame, float]]:
+        """
+        Populates indicators using one joblib task per pair.
+        Each worker uses its own copy of the strategy (including the dataprovider, which loads
+        informative pairs from disk), so state assigned to the strategy
+        within populate_indicators() is not available in the main process.
+        """
+        try:
+            from joblib import Parallel, delayed, wrap_non_picklable_objects
+        except ImportError:
+            raise OperationalException("Please install hyperopt dependencies (which include "
+                                       "joblib) to use indicator_jobs.")
+        with Parallel(n_jobs=jobs) as parallel:
+            logger.info(f"Calculating indicators for {len(data)} pairs using "
+                        f"{parallel._effective_n_jobs()} parallel jobs.")
+            job = wrap_non_picklable_objects(self._advise_pair_indicators)
+            return parallel(delayed(job)(pair, pair_data) for pair, pair_data in data.items())
+
+    def _log_indicator_durations(self, durations: Dict[str, float], total: float) -> None:
+        """
+        Log time spent populating indicators, including the slowest pairs.
+        """
+        for pair, duration in durations.items():
+            logger.debug(f"Populated indicators for {pair} in {duration:.3f}s.")
+        slowest = sorted(durations.items(), key=lambda item: item[1], reverse=True)
+        slowest_str = ', '.join(f"{pair} ({duration:.2f}s)"
+                                for pair, duration in slowest[:INDICATOR_SLOWEST_PAIRS])
+        logger.info(f"Populated indicators for {len(durations)} pairs in {total:.2f}s "
+                    f"(slowest: {slowest_str}).")
 
     def advise_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
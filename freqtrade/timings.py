@@ -0,0 +1,82 @@
+"""
+Rolling duration statistics, used to instrument the bot loop.
+"""
+import time
+from collections import deque
+from contextlib import contextmanager
+from math import ceil
+from threading import Lock
+from typing import Deque, Dict, Iterable, Iterator, List, Tuple
+
+
+# Number of measurements (per name) percentiles are calculated from
+TIMINGS_WINDOW = 100
+
+
+def _percentile(ordered: List[float], quantile: float) -> float:
+    """ Nearest-rank percentile of a sorted, non-empty list """
+    return ordered[max(0, ceil(quantile * len(ordered)) - 1)]
+
+
+class Timings:
+    """
+    Durations (in seconds) of the latest measurements, per name (stage of the bot loop, pair).
+    Measurements are added by the bot, and read by the api server - so access is locked.
+    """
+
+    def __init__(self, window: int = TIMINGS_WINDOW) -> None:
+        self.window = window
+        self._durations: Dict[str, Deque[float]] = {}
+        # Number and sum of all measurements since startup
+        self._totals: Dict[str, Tuple[int, float]] = {}
+        self._lock = Lock()
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Measure the duration of the wrapped block - also if it raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, duration: float) -> None:
+        with self._lock:
+            if name not in self._durations:
+                self._durations[name] = deque(maxlen=self.window)
+            self._durations[name].append(duration)
+            count, total = self._totals.get(name, (0, 0.0))
+            self._totals[name] = (count + 1, total + duration)
+
+    def retain(self, names: Iterable[str]) -> None:
+        """
+        Drop measurements of all other names (e.g. pairs removed from the whitelist).
+        """
+        keep = set(names)
+        with self._lock:
+            for name in [name for name in self._durations if name not in keep]:
+                del self._durations[name]
+                del self._totals[name]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        :return: Dict of name: stats - with count and sum of all measurements since startup,
+            and last, p50, p95 and max of the latest measurements.
+        """
+        with self._lock:
+            measurements = [(name, list(durations), self._totals[name])
+                            for name, durations in self._durations.items()]
+        result = {}
+        for name, durations, (count, total) in measurements:
+            ordered = sorted(durations)
+            result[name] = {
+                'count': count,
+                'sum': total,
+                'last': durations[-1],
+                'p50': _percentile(ordered, 0.5),
+                'p95': _percentile(ordered, 0.95),
+                'max': ordered[-1],
+            }
+        return result
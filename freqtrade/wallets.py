@@ -3,7 +3,8 @@
 
 import logging
 from copy import deepcopy
-from typing import Any, Dict, NamedTuple
+from math import isclose
+from typing import Any, Dict, List, NamedTuple, Optional
 
 import arrow
 
@@ -32,47 +33,73 @@ class Wallets:
         self._log = log
         self._exchange = exchange
         self._wallets: Dict[str, Wallet] = {}
+        self._trade_wallets_outdated = False
         self.start_cap = config['dry_run_wallet']
         self._last_wallet_refresh = 0
         self.update()
 
     def get_free(self, currency: str) -> float:
-        balance = self._wallets.get(currency)
+        balance = self._get_wallet(currency)
         if balance and balance.free:
             return balance.free
         else:
             return 0
 
     def get_used(self, currency: str) -> float:
-        balance = self._wallets.get(currency)
+        balance = self._get_wallet(currency)
         if balance and balance.used:
             return balance.used
         else:
             return 0
 
     def get_total(self, currency: str) -> float:
-        balance = self._wallets.get(currency)
+        balance = self._get_wallet(currency)
         if balance and balance.total:
             return balance.total
         else:
             return 0
 
-    def _update_dry(self) -> None:
+    def _get_wallet(self, currency: str) -> Optional[Wallet]:
+        if currency == self._config['stake_currency']:
+            # Always up-to-date, also in backtesting
+            return self._wallets.get(currency)
+        return self._get_wallets().get(currency)
+
+    def _get_wallets(self) -> Dict[str, Wallet]:
         """
-        Update from database in dry-run mode
+        Return wallets - adding balances of currencies in open trades
+        if they were skipped by the last backtesting update.
+        """
+        if self._trade_wallets_outdated:
+            self._wallets.update(self._get_trade_wallets(Trade.get_trades_proxy(is_open=True)))
+            self._trade_wallets_outdated = False
+        return self._wallets
+
+    def _get_trade_wallets(self, open_trades: List[LocalTrade]) -> Dict[str, Wallet]:
+        """
+        Balances of currencies currently in trades
+        """
+        _wallets = {}
+        for trade in open_trades:
+            curr = self._exchange.get_pair_base_currency(trade.pair)
+            _wallets[curr] = Wallet(
+                curr,
+                trade.amount,
+                0,
+                trade.amount
+            )
+        return _wallets
+
+    def _calculate_dry_wallets(self, tot_profit: float) -> Dict[str, Wallet]:
+        """
+        Calculate all wallets from scratch
         - Apply apply profits of closed trades on top of stake amount
         - Subtract currently tied up stake_amount in open trades
         - update balances for currencies currently in trades
+        :param tot_profit: Realized profit of closed trades
         """
-        # Recreate _wallets to reset closed trade balances
         _wallets = {}
         open_trades = Trade.get_trades_proxy(is_open=True)
-        # If not backtesting...
-        # TODO: potentially remove the ._log workaround to determine backtest mode.
-        if self._log:
-            tot_profit = Trade.get_total_closed_profit()
-        else:
-            tot_profit = LocalTrade.total_profit
         tot_in_trades = sum(trade.stake_amount for trade in open_trades)
 
         current_stake = self.start_cap + tot_profit - tot_in_trades
@@ -82,16 +109,49 @@ class Wallets:
             0,
             current_stake
         )
+        _wallets.update(self._get_trade_wallets(open_trades))
+        return _wallets
 
-        for trade in open_trades:
-            curr = self._exchange.get_pair_base_currency(trade.pair)
-            _wallets[curr] = Wallet(
-                curr,
-                trade.amount,
-                0,
-                trade.amount
-            )
-        self._wallets = _wallets
+    def _update_dry(self) -> None:
+        """
+        Update from database in dry-run mode
+        - Apply apply profits of closed trades on top of stake amount
+        - Subtract currently tied up stake_amount in open trades
+        - update balances for currencies currently in trades
+        """
+        # If not backtesting...
+        # TODO: potentially remove the ._log workaround to determine backtest mode.
+        if self._log:
+            # Recreate _wallets to reset closed trade balances
+            self._wallets = self._calculate_dry_wallets(Trade.get_total_closed_profit())
+        else:
+            self._update_backtest()
+
+    def _update_backtest(self) -> None:
+        """
+        Update stake currency balance from the ledger maintained by
+        LocalTrade.add_bt_trade() / LocalTrade.close_bt_trade().
+        Balances of currencies in open trades are only recalculated when requested.
+        """
+        stake_currency = self._config['stake_currency']
+        current_stake = self.start_cap + LocalTrade.total_profit - LocalTrade.total_open_stake
+        self._wallets = {stake_currency: Wallet(stake_currency, current_stake, 0, current_stake)}
+        self._trade_wallets_outdated = len(LocalTrade.trades_open) > 0
+
+    def check_backtest_ledger(self) -> bool:
+        """
+        Compare the incrementally updated backtesting balances against a full recalculation
+        from all trades.
+        :return: True if both match, False otherwise
+        """
+        self._update_backtest()
+        ledger = self._get_wallets()
+        expected = self._calculate_dry_wallets(Trade.get_total_closed_profit())
+        if ledger.keys() != expected.keys():
+            return False
+        return all(isclose(getattr(ledger[curr], field), getattr(wallet, field), abs_tol=1e-8)
+                   for curr, wallet in expected.items()
+                   for field in ('free', 'used', 'total'))
 
     def _update_live(self) -> None:
         balances = self._exchange.get_balances()
@@ -127,7 +187,7 @@ class Wallets:
             self._last_wallet_refresh = arrow.utcnow().int_timestamp
 
     def get_all_balances(self) -> Dict[str, Any]:
-        return self._wallets
+        return self._get_wallets()
 
     def get_starting_balance(self) -> float:
         """
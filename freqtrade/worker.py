@@ -4,6 +4,7 @@ Main Freqtrade worker class.
 import logging
 import time
 import traceback
+from datetime import datetime, timedelta, timezone
 from os import getpid
 from typing import Any, Callable, Dict, Optional
 
@@ -13,6 +14,7 @@ from freqtrade import __version__, constants
 from freqtrade.configuration import Configuration
 from freqtrade.enums import State
 from freqtrade.exceptions import OperationalException, TemporaryError
+from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date, timeframe_to_seconds
 from freqtrade.freqtradebot import FreqtradeBot
 
 
@@ -55,6 +57,14 @@ class Worker:
         self._throttle_secs = internals_config.get('process_throttle_secs',
                                                    constants.PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get('heartbeat_interval', 60)
+        # Run full iterations once per candle (offset seconds after the candle started),
+        # only handling open trades and orders in between.
+        self._candle_sync = internals_config.get('candle_sync', False)
+        self._candle_sync_offset = internals_config.get('candle_sync_offset_secs', 1.0)
+        # Full iterations repeated while the closed candle is missing for some pairs
+        self._candle_sync_retries = internals_config.get('candle_sync_retries', 3)
+        self._last_candle_processed: Optional[datetime] = None
+        self._candle_retries = 0
 
         self._sd_notify = sdnotify.SystemdNotifier() if \
             self._config.get('internals', {}).get('sd_notify', False) else None
@@ -108,7 +118,10 @@ class Worker:
             # Ping systemd watchdog before throttling
             self._notify("WATCHDOG=1\nSTATUS=State: RUNNING.")
 
-            self._throttle(func=self._process_running, throttle_secs=self._throttle_secs)
+            self._throttle(func=self._process_running, throttle_secs=self._throttle_secs,
+                           timeframe=self.freqtrade.strategy.timeframe if self._candle_sync
+                           else None,
+                           timeframe_offset=self._candle_sync_offset)
 
         if self._heartbeat_interval:
             now = time.time()
@@ -119,19 +132,29 @@ class Worker:
 
         return state
 
-    def _throttle(self, func: Callable[..., Any], throttle_secs: float, *args, **kwargs) -> Any:
+    def _throttle(self, func: Callable[..., Any], throttle_secs: float, *args,
+                  timeframe: Optional[str] = None, timeframe_offset: float = 0.0,
+                  **kwargs) -> Any:
         """
         Throttles the given callable that it
         takes at least `min_secs` to finish execution.
         :param func: Any callable
         :param throttle_secs: throttling interation execution time limit in seconds
+        :param timeframe: Wake up early - once the next candle of this timeframe started
+        :param timeframe_offset: Offset (in seconds) to the start of the next candle
         :return: Any (result of execution of func)
         """
         self.last_throttle_start_time = time.time()
         logger.debug("========================================")
         result = func(*args, **kwargs)
-        time_passed = time.time() - self.last_throttle_start_time
+        now = time.time()
+        time_passed = now - self.last_throttle_start_time
         sleep_duration = max(throttle_secs - time_passed, 0.0)
+        if timeframe:
+            next_candle = timeframe_to_next_date(
+                timeframe, datetime.fromtimestamp(now - timeframe_offset, tz=timezone.utc))
+            sleep_duration = min(sleep_duration,
+                                 max(next_candle.timestamp() + timeframe_offset - now, 0.0))
         logger.debug(f"Throttling with '{func.__name__}()': sleep for {sleep_duration:.2f} s, "
                      f"last iteration took {time_passed:.2f} s.")
         time.sleep(sleep_duration)
@@ -140,9 +163,51 @@ class Worker:
     def _process_stopped(self) -> None:
         self.freqtrade.process_stopped()
 
+    def _current_candle(self) -> datetime:
+        """
+        Start of the current candle - candles are processed candle_sync_offset_secs after
+        they started.
+        """
+        now = datetime.now(timezone.utc) - timedelta(seconds=self._candle_sync_offset)
+        return timeframe_to_prev_date(self.freqtrade.strategy.timeframe, now)
+
+    def _candle_analyzed(self, candle: datetime) -> bool:
+        """
+        Check if the candle closed before candle has been analyzed for all pairs.
+        Exchanges can publish candles late - the candle is processed again until they did.
+        """
+        strategy = self.freqtrade.strategy
+        last_closed = candle - timedelta(seconds=timeframe_to_seconds(strategy.timeframe))
+        for pair in self.freqtrade.active_pair_whitelist:
+            last_seen = strategy._last_candle_seen_per_pair.get(pair)
+            if last_seen is None or last_seen < last_closed:
+                logger.debug(f"Candle {last_closed} of {pair} not analyzed yet, "
+                             f"processing again.")
+                return False
+        return True
+
     def _process_running(self) -> None:
         try:
-            self.freqtrade.process()
+            candle = self._current_candle() if self._candle_sync else None
+            if candle is not None and candle == self._last_candle_processed:
+                with self.freqtrade.loop_timings.measure('housekeeping'):
+                    self.freqtrade.process_housekeeping()
+            else:
+                with self.freqtrade.loop_timings.measure('process'):
+                    self.freqtrade.process()
+                if candle is None or self._candle_analyzed(candle):
+                    self._last_candle_processed = candle
+                    self._candle_retries = 0
+                elif self._candle_retries >= self._candle_sync_retries:
+                    # Pairs without new candles (e.g. halted markets) must not force full
+                    # iterations until the next candle.
+                    logger.info(f"Closed candle still missing for some pairs after "
+                                f"{self._candle_retries} retries, continuing with the next "
+                                f"candle.")
+                    self._last_candle_processed = candle
+                    self._candle_retries = 0
+                else:
+                    self._candle_retries += 1
         except TemporaryError as error:
             logger.warning(f"Error: {error}, retrying in {constants.RETRY_TIMEOUT} seconds...")
             time.sleep(constants.RETRY_TIMEOUT)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the /daily, /weekly, /monthly and /profit RPC methods
+against the number of trades in the database.
+
+Trades are spread over one year (plus 3 open trades) in an in-memory sqlite database.
+Prints the best of --repeat runs in ms - without ("cold") and with ("warm")
+results cached for closed trades.
+
+Usage: python scripts/benchmark_profit_rpc.py --trades 1000 10000 50000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from freqtrade.persistence import Trade, init_db
+from freqtrade.rpc import RPC
+
+
+def create_trades(count: int) -> None:
+    now = datetime.now(timezone.utc)
+    random.seed(count)
+    trades = []
+    for i in range(count + 3):
+        is_open = i >= count
+        open_date = now - timedelta(minutes=random.randint(60, 365 * 24 * 60))
+        open_rate = random.uniform(0.01, 0.1)
+        close_rate = open_rate * random.uniform(0.95, 1.05)
+        trade = Trade(
+            pair=f'PAIR{i % 50}/BTC', stake_amount=0.01, amount=0.01 / open_rate,
+            open_rate=open_rate, fee_open=0.001, fee_close=0.001, exchange='binance',
+            is_open=is_open, open_date=open_date,
+        )
+        if not is_open:
+            trade.close_rate = close_rate
+            trade.close_date = open_date + timedelta(minutes=random.randint(5, 600))
+            trade.close_profit = trade.calc_profit_ratio()
+            trade.close_profit_abs = trade.calc_profit()
+        trades.append(trade)
+    Trade.query.session.add_all(trades)
+    Trade.commit()
+
+
+def measure(func, repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--trades', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    freqtrade = SimpleNamespace(
+        config={'stake_currency': 'BTC'},
+        exchange=SimpleNamespace(get_rate=lambda pair, refresh, side: 0.05),
+        wallets=SimpleNamespace(get_starting_balance=lambda: 1.0),
+    )
+    calls = {
+        '/daily 30': lambda rpc: rpc._rpc_daily_profit(30, 'BTC', ''),
+        '/weekly 12': lambda rpc: rpc._rpc_weekly_profit(12, 'BTC', ''),
+        '/monthly 12': lambda rpc: rpc._rpc_monthly_profit(12, 'BTC', ''),
+        '/profit': lambda rpc: rpc._rpc_trade_statistics('BTC', ''),
+    }
+    print(f"{'trades':>8}  " + '  '.join(f'{name:>20}' for name in calls))
+    for count in args.trades:
+        init_db('sqlite://')
+        create_trades(count)
+        rpc = RPC(freqtrade)
+        results = []
+        for call in calls.values():
+            def cold():
+                rpc._closed_trades_cache.clear()
+                call(rpc)
+            cold_ms = measure(cold, args.repeat)
+            warm_ms = measure(lambda: call(rpc), args.repeat)
+            results.append(f'{cold_ms:.1f} / {warm_ms:.1f}')
+        print(f'{count:>8}  ' + '  '.join(f'{result:>20}' for result in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -49,7 +49,7 @@ class FtRestClient():
         # Split url
         schema, netloc, path, par, query, fragment = urlparse(basepath)
         # URLEncode query string
-        query = urlencode(params) if params else ""
+        query = urlencode(params, doseq=True) if params else ""
         # recombine url
         url = urlunparse((schema, netloc, path, par, query, fragment))
 
@@ -304,35 +304,50 @@ class FtRestClient():
             "timeframe": timeframe if timeframe else '',
         })
 
-    def pair_candles(self, pair, timeframe, limit=None):
+    def pair_candles(self, pair, timeframe, limit=None, since_ms=None, columns=None):
         """Return live dataframe for <pair><timeframe>.
 
         :param pair: Pair to get data for
         :param timeframe: Only pairs with this timeframe available.
         :param limit: Limit result to the last n candles.
+        :param since_ms: Only return candles after this timestamp (in ms).
+        :param columns: Only return these columns (besides date and signals).
         :return: json object
         """
-        return self._get("pair_candles", params={
+        params = {
             "pair": pair,
             "timeframe": timeframe,
             "limit": limit,
-        })
-
-    def pair_history(self, pair, timeframe, strategy, timerange=None):
+        }
+        if since_ms:
+            params['since_ms'] = since_ms
+        if columns:
+            params['columns'] = columns
+        return self._get("pair_candles", params=params)
+
+    def pair_history(self, pair, timeframe, strategy, timerange=None, since_ms=None,
+                     columns=None):
         """Return historic, analyzed dataframe
 
         :param pair: Pair to get data for
         :param timeframe: Only pairs with this timeframe available.
         :param strategy: Strategy to analyze and get values for
         :param timerange: Timerange to get data for (same format than --timerange endpoints)
+        :param since_ms: Only return candles after this timestamp (in ms).
+        :param columns: Only return these columns (besides date and signals).
         :return: json object
         """
-        return self._get("pair_history", params={
+        params = {
             "pair": pair,
             "timeframe": timeframe,
             "strategy": strategy,
             "timerange": timerange if timerange else '',
-        })
+        }
+        if since_ms:
+            params['since_ms'] = since_ms
+        if columns:
+            params['columns'] = columns
+        return self._get("pair_history", params=params)
 
     def sysinfo(self):
         """Provides system information (CPU, RAM usage)
@@ -341,6 +356,13 @@ class FtRestClient():
         """
         return self._get("sysinfo")
 
+    def loop_timings(self):
+        """Provides durations of the bot loop stages and of analyzing each pair
+
+        :return: json object
+        """
+        return self._get("loop_timings")
+
 
 def add_arguments():
     parser = argparse.ArgumentParser()
@@ -56,7 +56,6 @@ setup(
         'technical',
         'tabulate',
         'pycoingecko',
-        'py_find_1st',
         'python-rapidjson',
         'sdnotify',
         'colorama',
@@ -67,6 +66,7 @@ setup(
         'pandas',
         'tables',
         'blosc',
+        'pyarrow',
         'fastapi',
         'uvicorn',
         'pyjwt',
@@ -10,15 +10,19 @@ import pytest
 
 from freqtrade.commands import (start_backtesting_show, start_convert_data, start_convert_trades,
                                 start_create_userdir, start_download_data, start_hyperopt_list,
-                                start_hyperopt_show, start_install_ui, start_list_data,
-                                start_list_exchanges, start_list_markets, start_list_strategies,
-                                start_list_timeframes, start_new_strategy, start_show_trades,
-                                start_test_pairlist, start_trading, start_webserver)
+                                start_hyperopt_show, start_indicator_cache, start_install_ui,
+                                start_list_data, start_list_exchanges, start_list_markets,
+                                start_list_strategies, start_list_timeframes, start_new_strategy,
+                                start_show_trades, start_test_pairlist, start_trading,
+                                start_webserver)
 from freqtrade.commands.deploy_commands import (clean_ui_subdir, download_and_install_ui,
                                                 get_ui_download_url, read_ui_version)
 from freqtrade.configuration import setup_utils_configuration
+from freqtrade.data.history import load_pair_history
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.indicator_cache import IndicatorCache
+from freqtrade.resolvers import StrategyResolver
 from tests.conftest import (create_mock_trades, get_args, log_has, log_has_re, patch_exchange,
                             patched_configuration_load_config_file)
 from tests.conftest_trades import MOCK_TRADE_COUNT
@@ -1405,3 +1409,28 @@ def test_backtesting_show(mocker, testdatadir, capsys):
     assert sbr.call_count == 1
     out, err = capsys.readouterr()
     assert "Pairs for Strategy" in out
+
+
+def test_start_indicator_cache(default_conf, testdatadir, tmpdir, capsys):
+    default_conf['user_data_dir'] = Path(tmpdir)
+    cache = IndicatorCache(default_conf, StrategyResolver.load_strategy(default_conf))
+    for pair in ['UNITTEST/BTC', 'ETH/BTC']:
+        data = load_pair_history(pair, '5m', testdatadir)
+        cache.store(pair, data, data)
+
+    args = [
+        "indicator-cache",
+        "--userdir",
+        str(tmpdir),
+    ]
+    pargs = get_args(args)
+    pargs['config'] = None
+    start_indicator_cache(pargs)
+    captured = capsys.readouterr()
+    assert re.search(r"Found 2 cached indicator dataframes \(\d+\.\d MB\)", captured.out)
+    assert re.search(r"\| +StrategyTestV2 \| +5m \| +2 \| +2 \| +\d+\.\d MB \|", captured.out)
+
+    start_indicator_cache(get_args(args + ["--clear"]))
+    captured = capsys.readouterr()
+    assert "Removed 2 cached indicator dataframes" in captured.out
+    assert IndicatorCache.get_entries(IndicatorCache.get_cache_dir(default_conf)) == []
@@ -326,3 +326,44 @@ def test_convert_ohlcv_format(default_conf, testdatadir, tmpdir):
     assert file2.exists()
     assert not file1_new.exists()
     assert not file2_new.exists()
+
+
+def test_convert_ohlcv_format_parquet(default_conf, testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+
+    file_orig = testdatadir / "XRP_ETH-5m.json"
+    file = tmpdir1 / "XRP_ETH-5m.json"
+    file_new = tmpdir1 / "XRP_ETH-5m.parquet"
+    copyfile(file_orig, file)
+
+    default_conf['datadir'] = tmpdir1
+    default_conf['pairs'] = ['XRP_ETH']
+    default_conf['timeframes'] = ['5m']
+
+    convert_ohlcv_format(default_conf, convert_from='json',
+                         convert_to='parquet', erase=True)
+    assert file_new.exists()
+    assert not file.exists()
+
+    data = load_pair_history('XRP/ETH', '5m', tmpdir1, data_format='parquet')
+    data_orig = load_pair_history('XRP/ETH', '5m', testdatadir, data_format='json')
+    assert data.equals(data_orig)
+
+    # Convert back
+    convert_ohlcv_format(default_conf, convert_from='parquet',
+                         convert_to='json', erase=True)
+    assert file.exists()
+    assert not file_new.exists()
+
+
+def test_convert_trades_format_parquet(default_conf, testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    file = tmpdir1 / "XRP_ETH-trades.json.gz"
+    file_new = tmpdir1 / "XRP_ETH-trades.parquet"
+    copyfile(testdatadir / file.name, file)
+
+    default_conf['datadir'] = tmpdir1
+    convert_trades_format(default_conf, convert_from='jsongz',
+                          convert_to='parquet', erase=False)
+    assert file_new.exists()
+    assert file.exists()
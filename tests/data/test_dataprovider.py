@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
+from threading import Thread
 from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.data.history import load_pair_history
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.plugins.pairlistmanager import PairListManager
@@ -41,6 +43,22 @@ def test_ohlcv(mocker, default_conf, ohlcv_history):
     assert dp.ohlcv("UNITTEST/BTC", timeframe).empty
 
 
+def test_runmode_override(default_conf):
+    default_conf["runmode"] = RunMode.DRY_RUN
+    dp = DataProvider(default_conf, None)
+    runmodes = []
+
+    with dp._runmode_override(RunMode.EDGE):
+        assert dp.runmode == RunMode.EDGE
+        # Other threads are not affected
+        thread = Thread(target=lambda: runmodes.append(dp.runmode))
+        thread.start()
+        thread.join()
+    assert runmodes == [RunMode.DRY_RUN]
+    assert dp.runmode == RunMode.DRY_RUN
+    assert default_conf["runmode"] == RunMode.DRY_RUN
+
+
 def test_historic_ohlcv(mocker, default_conf, ohlcv_history):
     historymock = MagicMock(return_value=ohlcv_history)
     mocker.patch("freqtrade.data.dataprovider.load_pair_history", historymock)
@@ -289,3 +307,70 @@ def test_no_exchange_mode(default_conf):
 
     with pytest.raises(OperationalException, match=message):
         dp.available_pairs()
+
+
+def test_extend_cached_df(default_conf, testdatadir):
+    data = load_pair_history('UNITTEST/BTC', '5m', testdatadir).iloc[:100]
+    dp = DataProvider(default_conf, None)
+    assert dp._extend_cached_df('UNITTEST/BTC', '5m', data) == (None, 0)
+
+    analyzed = data.iloc[:-3].copy()
+    analyzed['sma'] = 1.0
+    dp._set_cached_df('UNITTEST/BTC', '5m', analyzed)
+
+    # 3 new candles, first 5 candles dropped
+    extended, new_candles = dp._extend_cached_df('UNITTEST/BTC', '5m',
+                                                 data.iloc[5:].reset_index(drop=True))
+    assert new_candles == 3
+    assert len(extended) == 95
+    assert list(extended.index) == list(range(95))
+    assert (extended['date'].values == data['date'].iloc[5:].values).all()
+    assert (extended['sma'].iloc[:-3] == 1.0).all()
+    assert extended['sma'].iloc[-3:].isna().all()
+    # Cached dataframe is not modified
+    assert len(analyzed) == 97
+
+    analyzed['count'] = 1
+    analyzed['flag'] = True
+    analyzed['tag'] = 'a'
+    analyzed['buy'] = 1
+    dp._set_cached_df('UNITTEST/BTC', '5m', analyzed)
+    extended, _ = dp._extend_cached_df('UNITTEST/BTC', '5m', data, exclude_columns=['buy'])
+    assert list(extended.columns) == list(data.columns) + ['sma', 'count', 'flag', 'tag']
+    assert extended['flag'].dtype == bool
+    assert not extended['flag'].iloc[-3:].any()
+    assert (extended['flag'] & (extended['close'] > 0)).iloc[:-3].all()
+    assert (~extended['flag']).iloc[-3:].all()
+    assert extended['date'].dt.tz is not None
+    # Boolean and integer columns keep their dtype
+    assert extended['count'].dtype == analyzed['count'].dtype
+    assert (extended['count'].iloc[-3:] == 0).all()
+    assert (extended['tag'].iloc[:-3] == 'a').all()
+    assert extended['tag'].iloc[-3:].isna().all()
+
+    # Extension dtypes
+    analyzed['last_date'] = analyzed['date']
+    dp._set_cached_df('UNITTEST/BTC', '5m', analyzed)
+    extended, new_candles = dp._extend_cached_df('UNITTEST/BTC', '5m', data)
+    assert new_candles == 3
+    assert (extended['last_date'].iloc[:-3] == data['date'].iloc[:-3]).all()
+    assert extended['last_date'].iloc[-3:].isna().all()
+    assert extended['last_date'].dt.tz is not None
+    assert extended['flag'].dtype == bool
+    assert extended['count'].dtype == analyzed['count'].dtype
+
+    # No new candles
+    extended, new_candles = dp._extend_cached_df('UNITTEST/BTC', '5m', data.iloc[:-3])
+    assert new_candles == 0
+    assert extended['buy'].equals(analyzed['buy'])
+    assert len(extended) == 97
+
+    # Candle data covering more than the analyzed dataframe
+    dp._set_cached_df('UNITTEST/BTC', '5m', analyzed.iloc[10:])
+    assert dp._extend_cached_df('UNITTEST/BTC', '5m', data) == (None, 0)
+    # Candle data starting after the analyzed dataframe
+    assert dp._extend_cached_df('UNITTEST/BTC', '5m', data.iloc[-2:]) == (None, 0)
+    # Changed candles
+    changed = data.copy()
+    changed.loc[50, 'close'] += 1
+    assert dp._extend_cached_df('UNITTEST/BTC', '5m', changed.iloc[10:]) == (None, 0)
@@ -1,28 +1,32 @@
 # pragma pylint: disable=missing-docstring, protected-access, C0103
 
+import asyncio
 import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import copyfile
 from unittest.mock import MagicMock, PropertyMock
 
 import arrow
+import pyarrow.parquet as pq
 import pytest
 from pandas import DataFrame
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
-from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.data.history.hdf5datahandler import HDF5DataHandler
 from freqtrade.data.history.history_utils import (_download_pair_history, _download_trades_history,
                                                   _load_cached_data_for_updating,
                                                   convert_trades_to_ohlcv, get_timerange, load_data,
-                                                  load_pair_history, refresh_backtest_ohlcv_data,
+                                                  load_data_lazy, load_pair_history,
+                                                  refresh_backtest_ohlcv_data,
                                                   refresh_backtest_trades_data, refresh_data,
                                                   validate_backtest_data)
 from freqtrade.data.history.idatahandler import IDataHandler, get_datahandler, get_datahandlerclass
 from freqtrade.data.history.jsondatahandler import JsonDataHandler, JsonGzDataHandler
+from freqtrade.data.history.parquetdatahandler import ParquetDataHandler
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import file_dump_json
 from freqtrade.resolvers import StrategyResolver
@@ -186,8 +190,6 @@ def test_load_cached_data_for_updating(mocker, testdatadir) -> None:
     with open(test_filename, "rt") as file:
         test_data = json.load(file)
 
-    test_data_df = ohlcv_to_dataframe(test_data, '1m', 'UNITTEST/BTC',
-                                      fill_missing=False, drop_incomplete=False)
     # now = last cached item + 1 hour
     now_ts = test_data[-1][0] / 1000 + 60 * 60
     mocker.patch('arrow.utcnow', return_value=arrow.get(now_ts))
@@ -195,36 +197,44 @@ def test_load_cached_data_for_updating(mocker, testdatadir) -> None:
     # timeframe starts earlier than the cached data
     # should fully update data
     timerange = TimeRange('date', None, test_data[0][0] / 1000 - 1, 0)
-    data, start_ts = _load_cached_data_for_updating('UNITTEST/BTC', '1m', timerange, data_handler)
-    assert data.empty
+    append, start_ts = _load_cached_data_for_updating('UNITTEST/BTC', '1m', timerange,
+                                                      data_handler)
+    assert not append
     assert start_ts == test_data[0][0] - 1000
 
     # timeframe starts in the center of the cached data
-    # should return the cached data w/o the last item
+    # should append, starting with the last item
     timerange = TimeRange('date', None, test_data[0][0] / 1000 + 1, 0)
-    data, start_ts = _load_cached_data_for_updating('UNITTEST/BTC', '1m', timerange, data_handler)
-
-    assert_frame_equal(data, test_data_df.iloc[:-1])
-    assert test_data[-2][0] <= start_ts < test_data[-1][0]
+    append, start_ts = _load_cached_data_for_updating('UNITTEST/BTC', '1m', timerange,
+                                                      data_handler)
+    assert append
+    assert start_ts == test_data[-1][0]
 
     # timeframe starts after the cached data
-    # should return the cached data w/o the last item
+    # should append, starting with the last item
     timerange = TimeRange('date', None, test_data[-1][0] / 1000 + 100, 0)
-    data, start_ts = _load_cached_data_for_updating('UNITTEST/BTC', '1m', timerange, data_handler)
-    assert_frame_equal(data, test_data_df.iloc[:-1])
-    assert test_data[-2][0] <= start_ts < test_data[-1][0]
+    append, start_ts = _load_cached_data_for_updating('UNITTEST/BTC', '1m', timerange,
+                                                      data_handler)
+    assert append
+    assert start_ts == test_data[-1][0]
+
+    # no timerange - should append, starting with the last item
+    append, start_ts = _load_cached_data_for_updating('UNITTEST/BTC', '1m', None, data_handler)
+    assert append
+    assert start_ts == test_data[-1][0]
 
     # no datafile exist
     # should return timestamp start time
     timerange = TimeRange('date', None, now_ts - 10000, 0)
-    data, start_ts = _load_cached_data_for_updating('NONEXIST/BTC', '1m', timerange, data_handler)
-    assert data.empty
+    append, start_ts = _load_cached_data_for_updating('NONEXIST/BTC', '1m', timerange,
+                                                      data_handler)
+    assert not append
     assert start_ts == (now_ts - 10000) * 1000
 
     # no datafile exist, no timeframe is set
-    # should return an empty array and None
-    data, start_ts = _load_cached_data_for_updating('NONEXIST/BTC', '1m', None, data_handler)
-    assert data.empty
+    # should return False and None
+    append, start_ts = _load_cached_data_for_updating('NONEXIST/BTC', '1m', None, data_handler)
+    assert not append
     assert start_ts is None
 
 
@@ -276,13 +286,20 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
     json_dump_mock = mocker.patch(
         'freqtrade.data.history.jsondatahandler.JsonDataHandler.ohlcv_store',
         return_value=None)
+    json_append_mock = mocker.patch(
+        'freqtrade.data.history.jsondatahandler.JsonDataHandler.ohlcv_append',
+        return_value=None)
     mocker.patch('freqtrade.exchange.Exchange.get_historic_ohlcv', return_value=tick)
     exchange = get_patched_exchange(mocker, default_conf)
+    # Existing data is appended to
     _download_pair_history(datadir=testdatadir, exchange=exchange, pair="UNITTEST/BTC",
                            timeframe='1m')
+    assert json_append_mock.call_count == 1
+    assert json_dump_mock.call_count == 0
     _download_pair_history(datadir=testdatadir, exchange=exchange, pair="UNITTEST/BTC",
                            timeframe='3m')
-    assert json_dump_mock.call_count == 2
+    assert json_append_mock.call_count == 1
+    assert json_dump_mock.call_count == 1
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmpdir) -> None:
@@ -330,6 +347,36 @@ def test_load_partial_missing(testdatadir, caplog) -> None:
                    caplog)
 
 
+@pytest.mark.parametrize('releases_gil', [True, False])
+def test_load_data_load_jobs(mocker, testdatadir, releases_gil) -> None:
+    mocker.patch.object(JsonDataHandler, 'releases_gil', releases_gil)
+    pairs = ['UNITTEST/BTC', 'NOPAIR/XXX', 'ETH/BTC', 'ADA/BTC', 'LTC/BTC']
+    expected = load_data(testdatadir, '5m', pairs)
+    assert list(expected) == ['UNITTEST/BTC', 'ETH/BTC', 'ADA/BTC', 'LTC/BTC']
+
+    data = load_data(testdatadir, '5m', pairs, load_jobs=3)
+    # Same order as requested - independent of the order pairs finished loading in
+    assert list(data) == list(expected)
+    for pair, pair_data in expected.items():
+        assert_frame_equal(data[pair], pair_data)
+
+
+def test_load_data_lazy(mocker, testdatadir, caplog) -> None:
+    data = load_data_lazy(testdatadir, '5m', ['UNITTEST/BTC', 'NOPAIR/XXX', 'ETH/BTC'])
+    # Nothing is loaded before iterating
+    assert not caplog.records
+    assert [pair for pair, _ in data] == ['UNITTEST/BTC', 'ETH/BTC']
+
+    executor = mocker.patch('freqtrade.data.history.history_utils.ThreadPoolExecutor',
+                            wraps=ThreadPoolExecutor)
+    mocker.patch.object(JsonDataHandler, 'releases_gil', True)
+    data = dict(load_data_lazy(testdatadir, '5m', ['UNITTEST/BTC', 'NOPAIR/XXX', 'ETH/BTC'],
+                               load_jobs=2))
+    assert set(data) == {'UNITTEST/BTC', 'ETH/BTC'}
+    assert executor.call_count == 1
+    assert log_has('Loading 3 pairs using 2 parallel threads.', caplog)
+
+
 def test_init(default_conf, mocker) -> None:
     assert {} == load_data(
         datadir=Path(''),
@@ -464,6 +511,54 @@ def test_refresh_backtest_ohlcv_data(mocker, default_conf, markets, caplog, test
     assert log_has("Downloading pair ETH/BTC, interval 1m.", caplog)
 
 
+def test_refresh_backtest_ohlcv_data_concurrent(mocker, default_conf, markets, caplog, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    mocker.patch('freqtrade.exchange.Exchange.markets', PropertyMock(return_value=markets))
+    ex = get_patched_exchange(mocker, default_conf)
+    in_flight = []
+    max_in_flight = []
+    # Downloads run on the exchange loop, like all other exchange calls
+    loops = set()
+
+    async def fetch_ohlcv(pair, timeframe, since, limit, params):
+        loops.add((asyncio.get_event_loop() is ex.loop, ex._loop_lock.locked()))
+        if pair == 'XRP/BTC':
+            raise ValueError('Error downloading')
+        in_flight.append((pair, timeframe))
+        max_in_flight.append(len(set(in_flight)))
+        await asyncio.sleep(0.01)
+        in_flight.remove((pair, timeframe))
+        tf_ms = timeframe_to_minutes(timeframe) * 60 * 1000
+        until = min(since + limit * tf_ms, arrow.utcnow().int_timestamp * 1000)
+        return [[date, 1, 2, 0.5, 1.5, 10] for date in range(since, until, tf_ms)]
+
+    ex._api_async.fetch_ohlcv = fetch_ohlcv
+    timerange = TimeRange('date', None, arrow.utcnow().shift(hours=-10).int_timestamp, 0)
+    pairs = ['ETH/BTC', 'XRP/BTC', 'NEO/BTC', 'LTC/BTC']
+    refresh_backtest_ohlcv_data(exchange=ex, pairs=pairs, timeframes=['1m', '5m'],
+                                datadir=tmpdir1, timerange=timerange, download_jobs=2)
+
+    assert max(max_in_flight) == 2
+    assert loops == {(True, True)}
+    for pair in ['ETH/BTC', 'NEO/BTC', 'LTC/BTC']:
+        for timeframe in ['1m', '5m']:
+            assert JsonDataHandler._pair_data_filename(tmpdir1, pair, timeframe).is_file()
+    assert not JsonDataHandler._pair_data_filename(tmpdir1, 'XRP/BTC', '5m').is_file()
+    assert log_has('Downloading 8 pair / timeframe combinations with up to 2 concurrent '
+                   'downloads.', caplog)
+    assert log_has_re(r'Downloaded 21\d\d candles in .*s \(\d+ candles/s\)\.', caplog)
+
+    # Update existing data - only the missing candles are downloaded and appended.
+    caplog.clear()
+    refresh_backtest_ohlcv_data(exchange=ex, pairs=['ETH/BTC'], timeframes=['1m', '5m'],
+                                datadir=tmpdir1, download_jobs=4)
+    assert log_has_re(r'Downloaded \d candles in .*', caplog)
+    ohlcv = JsonDataHandler(tmpdir1).ohlcv_load('ETH/BTC', '5m', fill_missing=False,
+                                                drop_incomplete=False)
+    assert len(ohlcv) in (119, 120)
+    assert ohlcv['date'].is_unique
+
+
 def test_download_data_no_markets(mocker, default_conf, caplog, testdatadir):
     dl_mock = mocker.patch('freqtrade.data.history.history_utils._download_pair_history',
                            MagicMock())
@@ -687,10 +782,62 @@ def test_jsondatahandler_trades_purge(mocker, testdatadir):
 
 
 @pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
-def test_datahandler_ohlcv_append(datahandler, testdatadir, ):
-    dh = get_datahandler(testdatadir, datahandler)
-    with pytest.raises(NotImplementedError):
-        dh.ohlcv_append('UNITTEST/ETH', '5m', DataFrame())
+def test_datahandler_ohlcv_append(datahandler, testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    ohlcv = JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m',
+                                                    drop_incomplete=False)
+    dh = get_datahandler(tmpdir1, datahandler)
+    assert dh.ohlcv_data_min_max('UNITTEST/NEW', '5m') == (None, None)
+    dh.ohlcv_append('UNITTEST/NEW', '5m', DataFrame())
+    assert dh.ohlcv_data_min_max('UNITTEST/NEW', '5m') == (None, None)
+
+    # Appending to non-existing data creates it
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[:2000])
+    assert dh.ohlcv_data_min_max('UNITTEST/NEW', '5m') == (ohlcv.iloc[0]['date'],
+                                                           ohlcv.iloc[1999]['date'])
+    # Append without overlap
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[2000:3000])
+    # Append with overlap - overlapping candles are replaced.
+    changed = ohlcv.iloc[2995:].copy()
+    changed.loc[2995:2999, 'volume'] = 0
+    dh.ohlcv_append('UNITTEST/NEW', '5m', changed)
+    assert dh.ohlcv_data_min_max('UNITTEST/NEW', '5m') == (ohlcv.iloc[0]['date'],
+                                                           ohlcv.iloc[-1]['date'])
+
+    expected = ohlcv.copy()
+    expected.loc[2995:2999, 'volume'] = 0
+    result = dh.ohlcv_load('UNITTEST/NEW', '5m', drop_incomplete=False)
+    assert_frame_equal(result, expected, check_dtype=False)
+
+    # Overlap with all stored data
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[:10])
+    result = dh.ohlcv_load('UNITTEST/NEW', '5m', drop_incomplete=False)
+    assert_frame_equal(result, ohlcv.iloc[:10], check_dtype=False)
+
+
+def test_jsondatahandler_ohlcv_append_tail(mocker, testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    mocker.patch('freqtrade.data.history.jsondatahandler.TAIL_CHUNK_SIZE', 2000)
+    ohlcv = JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m',
+                                                    drop_incomplete=False)
+    dh = JsonDataHandler(tmpdir1)
+    dh.ohlcv_store('UNITTEST/NEW', '5m', ohlcv.iloc[:1000])
+    store_mock = mocker.spy(dh, 'ohlcv_store')
+    load_mock = mocker.spy(dh, '_ohlcv_load')
+
+    assert dh.ohlcv_data_min_max('UNITTEST/NEW', '5m') == (ohlcv.iloc[0]['date'],
+                                                           ohlcv.iloc[999]['date'])
+    # Appending close to the end of the file modifies the file in place
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[998:1500])
+    assert store_mock.call_count == 0
+    assert load_mock.call_count == 0
+    assert_frame_equal(dh.ohlcv_load('UNITTEST/NEW', '5m', drop_incomplete=False),
+                       ohlcv.iloc[:1500])
+
+    # The seam is not within the end of the file - the file is rewritten.
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[500:])
+    assert store_mock.call_count == 1
+    assert_frame_equal(dh.ohlcv_load('UNITTEST/NEW', '5m', drop_incomplete=False), ohlcv)
 
 
 @pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
@@ -816,6 +963,104 @@ def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 1
 
 
+def test_parquetdatahandler_ohlcv_load_and_resave(testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    ohlcv = JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m')
+    assert len(ohlcv) > 0
+
+    file = tmpdir1 / 'UNITTEST_NEW-5m.parquet'
+    assert not file.is_file()
+
+    dh = ParquetDataHandler(tmpdir1)
+    dh.ohlcv_store('UNITTEST/NEW', '5m', ohlcv)
+    assert file.is_file()
+    assert dh.ohlcv_get_pairs(tmpdir1, '5m') == ['UNITTEST/NEW']
+    assert dh.ohlcv_get_available_data(tmpdir1) == [('UNITTEST/NEW', '5m')]
+
+    ohlcv1 = dh.ohlcv_load('UNITTEST/NEW', '5m', drop_incomplete=False)
+    assert_frame_equal(ohlcv, ohlcv1)
+
+    # Data goes from 2018-01-10 - 2018-01-30
+    timerange = TimeRange.parse_timerange('20180115-20180119')
+    ohlcv = JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m', timerange=timerange)
+    ohlcv1 = dh.ohlcv_load('UNITTEST/NEW', '5m', timerange=timerange)
+    assert_frame_equal(ohlcv, ohlcv1)
+    assert ohlcv1[ohlcv1['date'] < '2018-01-15'].empty
+    assert ohlcv1[ohlcv1['date'] > '2018-01-19'].empty
+
+    # Try loading inexisting file
+    ohlcv = dh.ohlcv_load('UNITTEST/NONEXIST', '5m')
+    assert ohlcv.empty
+
+
+def test_parquetdatahandler_ohlcv_load_row_groups(mocker, testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    mocker.patch('freqtrade.data.history.parquetdatahandler.ROW_GROUP_SIZE', 1000)
+    ohlcv = JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m')
+    dh = ParquetDataHandler(tmpdir1)
+    dh.ohlcv_store('UNITTEST/NEW', '5m', ohlcv)
+
+    read_mock = mocker.spy(pq.ParquetFile, 'read_row_groups')
+    # Only row groups 1 and 2 are read
+    timerange = TimeRange('date', 'date', int(ohlcv.loc[1500, 'date'].timestamp()),
+                          int(ohlcv.loc[2500, 'date'].timestamp()))
+    ohlcv1 = dh._ohlcv_load('UNITTEST/NEW', '5m', timerange)
+    assert read_mock.call_count == 1
+    assert read_mock.call_args_list[0][0][1] == [1, 2]
+    assert_frame_equal(ohlcv1, ohlcv.loc[1000:2999].reset_index(drop=True))
+
+    # Open end timerange
+    ohlcv1 = dh._ohlcv_load('UNITTEST/NEW', '5m', TimeRange.parse_timerange('20180128-'))
+    assert read_mock.call_args_list[1][0][1] == [len(ohlcv) // 1000]
+    assert ohlcv1['date'].max() == ohlcv['date'].max()
+
+    # Timerange outside of the data
+    ohlcv1 = dh._ohlcv_load('UNITTEST/NEW', '5m', TimeRange.parse_timerange('20190101-'))
+    assert ohlcv1.empty
+    assert list(ohlcv1.columns) == ParquetDataHandler._columns
+
+
+def test_parquetdatahandler_trades_load_and_store(testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    trades = JsonGzDataHandler(testdatadir).trades_load('XRP/ETH')
+    dh = ParquetDataHandler(tmpdir1)
+    assert dh.trades_load('XRP/ETH') == []
+
+    dh.trades_store('XRP/ETH', trades)
+    assert (tmpdir1 / 'XRP_ETH-trades.parquet').is_file()
+    assert dh.trades_get_pairs(tmpdir1) == ['XRP/ETH']
+
+    trades_new = dh.trades_load('XRP/ETH')
+    assert trades_new == trades
+
+    # data goes from 2019-10-11 - 2019-10-13
+    timerange = TimeRange.parse_timerange('20191011-20191012')
+    trades2 = dh.trades_load('XRP/ETH', timerange)
+    assert 0 < len(trades2) < len(trades)
+    assert len([t for t in trades2 if t[0] < timerange.startts * 1000]) == 0
+    assert len([t for t in trades2 if t[0] > timerange.stopts * 1000]) == 0
+
+
+@pytest.mark.parametrize('pair,timeframe', [
+    ('UNITTEST/NONEXIST', '5m'),
+    ('UNITTEST/NONEXIST', None),
+])
+def test_parquetdatahandler_purge(mocker, testdatadir, pair, timeframe):
+    mocker.patch.object(Path, "exists", MagicMock(return_value=False))
+    unlinkmock = mocker.patch.object(Path, "unlink", MagicMock())
+    dh = ParquetDataHandler(testdatadir)
+
+    def purge():
+        return dh.ohlcv_purge(pair, timeframe) if timeframe else dh.trades_purge(pair)
+
+    assert not purge()
+    assert unlinkmock.call_count == 0
+
+    mocker.patch.object(Path, "exists", MagicMock(return_value=True))
+    assert purge()
+    assert unlinkmock.call_count == 1
+
+
 def test_gethandlerclass():
     cl = get_datahandlerclass('json')
     assert cl == JsonDataHandler
@@ -827,6 +1072,9 @@ def test_gethandlerclass():
     cl = get_datahandlerclass('hdf5')
     assert cl == HDF5DataHandler
     assert issubclass(cl, IDataHandler)
+    cl = get_datahandlerclass('parquet')
+    assert cl == ParquetDataHandler
+    assert issubclass(cl, IDataHandler)
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass('DeadBeef')
 
@@ -841,3 +1089,5 @@ def test_get_datahandler(testdatadir):
 
     dh = get_datahandler(testdatadir, 'hdf5')
     assert type(dh) == HDF5DataHandler
+    dh = get_datahandler(testdatadir, 'parquet')
+    assert type(dh) == ParquetDataHandler
@@ -3,6 +3,7 @@
 
 import logging
 import math
+import time
 from unittest.mock import MagicMock
 
 import arrow
@@ -12,7 +13,7 @@ from pandas import DataFrame, to_datetime
 
 from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.edge import Edge, PairInfo
-from freqtrade.enums import SellType
+from freqtrade.enums import RunMode, SellType
 from freqtrade.exceptions import OperationalException
 from tests.conftest import get_patched_freqtradebot, log_has
 from tests.optimize import (BTContainer, BTrade, _build_backtest_dataframe,
@@ -153,7 +154,7 @@ def test_edge_results(edge_conf, mocker, caplog, data) -> None:
     edge.fee = 0
 
     trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', [data.stop_loss])
-    results = edge._fill_calculable_fields(DataFrame(trades)) if trades else DataFrame()
+    results = edge._fill_calculable_fields(trades) if not trades.empty else DataFrame()
 
     assert len(trades) == len(data.trades)
 
@@ -167,6 +168,41 @@ def test_edge_results(edge_conf, mocker, caplog, data) -> None:
         assert res.close_date == _get_frame_time_from_offset(trade.close_tick).replace(tzinfo=None)
 
 
+def test_edge_results_stoploss_range(edge_conf, mocker) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    frame = _build_backtest_dataframe([
+        # D  O     H     L     C     V    B  S
+        [0, 5000, 5025, 4975, 4987, 6172, 1, 0],
+        [1, 5000, 5025, 4840, 4987, 6172, 0, 0],  # enter trade, -1% / -3% stoploss hit
+        [2, 5000, 5025, 4975, 4987, 6172, 1, 0],
+        [3, 5000, 5025, 4975, 4987, 6172, 0, 1],  # -1% / -3%: enter second trade
+        [4, 5100, 5125, 4975, 4987, 6172, 0, 0],  # sell
+        [5, 5000, 5025, 4975, 4987, 6172, 1, 0],
+        [6, 5000, 5025, 4975, 4987, 6172, 0, 0],  # enter trade, never closed
+    ])
+    stoploss_range = [-0.01, -0.03, -0.05]
+
+    trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', stoploss_range)
+    assert trades['stoploss'].tolist() == [-0.01, -0.01, -0.03, -0.03, -0.05]
+    assert trades['exit_type'].tolist() == [SellType.STOP_LOSS, SellType.SELL_SIGNAL,
+                                            SellType.STOP_LOSS, SellType.SELL_SIGNAL,
+                                            SellType.SELL_SIGNAL]
+    assert trades['open_date'].tolist() == [
+        _get_frame_time_from_offset(tick).replace(tzinfo=None) for tick in [1, 3, 1, 3, 1]]
+    assert trades['close_date'].tolist() == [
+        _get_frame_time_from_offset(tick).replace(tzinfo=None) for tick in [1, 4, 1, 4, 4]]
+    assert trades['close_rate'].tolist() == [4950, 5100, 4850, 5100, 5100]
+
+    # Same as evaluating every stoploss on its own
+    for stoploss in stoploss_range:
+        single = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', [stoploss])
+        assert single.equals(trades[trades['stoploss'] == stoploss].reset_index(drop=True))
+
+    assert edge._find_trades_for_stoploss_range(frame.iloc[:1], 'TEST/BTC',
+                                                stoploss_range).empty
+
+
 def test_adjust(mocker, edge_conf):
     freqtrade = get_patched_freqtradebot(mocker, edge_conf)
     edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
@@ -314,6 +350,64 @@ def test_edge_process_downloaded_data(mocker, edge_conf):
     assert edge._last_updated <= arrow.utcnow().int_timestamp + 2
 
 
+def test_edge_background_calculation(mocker, edge_conf):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
+    mocker.patch('freqtrade.edge.edge_positioning.refresh_data', MagicMock())
+    mocker.patch('freqtrade.edge.edge_positioning.load_data', mocked_load_data)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    runmodes = []
+    advise_all_indicators = freqtrade.strategy.advise_all_indicators
+
+    def advise_mock(data):
+        runmodes.append(freqtrade.strategy.dp.runmode)
+        return advise_all_indicators(data)
+    mocker.patch.object(freqtrade.strategy, 'advise_all_indicators', advise_mock)
+
+    assert edge.calculation_status() == {
+        'calculating': False,
+        'last_calculated': None,
+        'last_calculated_timestamp': None,
+        'snapshot_age': None,
+        'calculation_duration': 0,
+    }
+    edge.start_background_calculation()
+    # Waits for the first whitelist
+    assert edge._calculation_thread.is_alive()
+    assert edge._last_updated == 0
+
+    edge.refresh(edge_conf['exchange']['pair_whitelist'])
+    for _ in range(500):
+        if edge._last_updated:
+            break
+        time.sleep(0.01)
+    assert len(edge._cached_pairs) == 2
+    # Only the calculating thread analyzes in edge mode
+    assert runmodes == [RunMode.EDGE]
+    assert freqtrade.strategy.dp.runmode == RunMode.DRY_RUN
+
+    status = edge.calculation_status()
+    assert status['last_calculated_timestamp'] == edge._last_updated * 1000
+    assert 0 <= status['snapshot_age'] <= 2
+    assert status['calculation_duration'] > 0
+
+    edge.stop_background_calculation()
+    assert edge._calculation_thread is None
+    # Calculated once only, as process_throttle_secs did not pass yet
+    assert runmodes == [RunMode.EDGE]
+
+
+def test_edge_next_calculation_in(mocker, edge_conf):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    edge_conf['internals'] = {'process_throttle_secs': 7}
+    # Retry failed calculations on the bot's schedule
+    assert edge._next_calculation_in() == 7
+
+    edge._last_updated = arrow.utcnow().int_timestamp - 800
+    assert 999 <= edge._next_calculation_in() <= 1000
+
+
 def test_edge_process_no_data(mocker, edge_conf, caplog):
     freqtrade = get_patched_freqtradebot(mocker, edge_conf)
     mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
@@ -333,7 +427,8 @@ def test_edge_process_no_trades(mocker, edge_conf, caplog):
     mocker.patch('freqtrade.edge.edge_positioning.refresh_data', )
     mocker.patch('freqtrade.edge.edge_positioning.load_data', mocked_load_data)
     # Return empty
-    mocker.patch('freqtrade.edge.Edge._find_trades_for_stoploss_range', return_value=[])
+    mocker.patch('freqtrade.edge.Edge._find_trades_for_stoploss_range',
+                 return_value=DataFrame())
     edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
 
     assert not edge.calculate(edge_conf['exchange']['pair_whitelist'])
@@ -350,7 +445,8 @@ def test_edge_process_no_pairs(mocker, edge_conf, caplog):
     mocker.patch('freqtrade.edge.edge_positioning.refresh_data')
     mocker.patch('freqtrade.edge.edge_positioning.load_data', mocked_load_data)
     # Return empty
-    mocker.patch('freqtrade.edge.Edge._find_trades_for_stoploss_range', return_value=[])
+    mocker.patch('freqtrade.edge.Edge._find_trades_for_stoploss_range',
+                 return_value=DataFrame())
     edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
     assert fee_mock.call_count == 0
     assert edge.fee is None
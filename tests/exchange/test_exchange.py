@@ -1,5 +1,7 @@
+import asyncio
 import copy
 import logging
+import pickle
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from math import isclose
@@ -20,7 +22,7 @@ from freqtrade.exchange.exchange import (market_is_active, timeframe_to_minutes,
                                          timeframe_to_next_date, timeframe_to_prev_date,
                                          timeframe_to_seconds)
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
-from tests.conftest import get_mock_coro, get_patched_exchange, log_has, log_has_re
+from tests.conftest import get_markets, get_mock_coro, get_patched_exchange, log_has, log_has_re
 
 
 # Make sure to always keep one exchange here which is NOT subclassed!!
@@ -140,6 +142,26 @@ def test_destroy(default_conf, mocker, caplog):
     assert log_has('Exchange object destroyed, closing async loop', caplog)
 
 
+def test_exchange_pickle(default_conf, mocker):
+    mocker.patch('freqtrade.exchange.Exchange._load_async_markets')
+    mocker.patch('freqtrade.exchange.Exchange.validate_pairs')
+    mocker.patch('freqtrade.exchange.Exchange.validate_timeframes')
+    mocker.patch('freqtrade.exchange.Exchange.validate_stakecurrency')
+    mocker.patch('freqtrade.exchange.Exchange.validate_required_startup_candles', return_value=1)
+    mocker.patch('freqtrade.exchange.Exchange._load_markets')
+    exchange = Exchange(default_conf)
+    exchange._markets = get_markets()
+    assert isinstance(exchange._api, ccxt.Exchange)
+
+    unpickled = pickle.loads(pickle.dumps(exchange))
+    assert unpickled._api is None
+    assert unpickled._api_async is None
+    assert unpickled._markets == exchange._markets
+    assert unpickled.get_pair_base_currency('ETH/BTC') == 'ETH'
+    # Original instance is unchanged
+    assert isinstance(exchange._api, ccxt.Exchange)
+
+
 def test_init_exception(default_conf, mocker):
     default_conf['exchange']['name'] = 'wrong_exchange_name'
 
@@ -1979,6 +2001,104 @@ def test_get_sell_rate_orderbook(default_conf, mocker, caplog, side, expected, o
     assert log_has("Using cached sell rate for ETH/BTC.", caplog)
 
 
+def test_prefetched_rates_tickers(default_conf, mocker, caplog):
+    caplog.set_level(logging.DEBUG)
+    default_conf['ask_strategy']['price_side'] = 'bid'
+    default_conf['bid_strategy']['price_side'] = 'ask'
+    api_mock = MagicMock()
+    api_mock.has = {'fetchTickers': True}
+    api_mock.fetch_tickers = MagicMock(return_value={
+        'ETH/BTC': {'ask': 0.5, 'bid': 0.4, 'last': 0.45},
+        'LTC/BTC': {'ask': 0.2, 'bid': 0.1, 'last': 0.15},
+        # No bid / ask provided by fetch_tickers
+        'XRP/BTC': {'ask': None, 'bid': None, 'last': 0.3},
+    })
+    fetch_ticker_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_ticker',
+                                     return_value={'ask': 0.4, 'bid': 0.3, 'last': 0.35})
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+
+    with exchange.prefetched_rates(['ETH/BTC', 'LTC/BTC', 'XRP/BTC'], side='sell'):
+        # Nothing fetched before a rate is needed
+        assert api_mock.fetch_tickers.call_count == 0
+        assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.4
+        assert exchange.get_rate('LTC/BTC', refresh=True, side='sell') == 0.1
+        assert api_mock.fetch_tickers.call_count == 1
+        assert fetch_ticker_mock.call_count == 0
+        # Fall back to fetching the pair on its own
+        assert exchange.get_rate('XRP/BTC', refresh=True, side='sell') == 0.3
+        assert fetch_ticker_mock.call_count == 1
+        # Other side / pairs are not part of this stage
+        exchange.get_rate('ETH/BTC', refresh=True, side='buy')
+        exchange.get_rate('NEO/BTC', refresh=True, side='sell')
+        assert fetch_ticker_mock.call_count == 3
+    assert log_has_re(r"Fetched sell rates for 2 of 3 pairs in \d+\.\d+s \(fetch_tickers\)\.",
+                      caplog)
+
+    assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.3
+    assert fetch_ticker_mock.call_count == 4
+    assert api_mock.fetch_tickers.call_count == 1
+
+    # Failing fetch_tickers
+    api_mock.fetch_tickers = MagicMock(side_effect=ccxt.NotSupported("Not supported"))
+    with exchange.prefetched_rates(['ETH/BTC', 'LTC/BTC'], side='sell'):
+        assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.3
+    assert fetch_ticker_mock.call_count == 5
+    assert log_has_re(r"Could not prefetch sell rates: .*", caplog)
+
+    # Prefetching a single pair doesn't gain anything
+    api_mock.fetch_tickers.reset_mock()
+    with exchange.prefetched_rates(['ETH/BTC'], side='sell'):
+        exchange.get_rate('ETH/BTC', refresh=True, side='sell')
+    assert api_mock.fetch_tickers.call_count == 0
+    assert fetch_ticker_mock.call_count == 6
+
+
+def test_prefetched_rates_concurrent(default_conf, mocker, caplog, order_book_l2):
+    caplog.set_level(logging.DEBUG)
+    default_conf['ask_strategy']['price_side'] = 'bid'
+    default_conf['bid_strategy']['price_side'] = 'ask'
+    default_conf['bid_strategy']['use_order_book'] = True
+    default_conf['bid_strategy']['order_book_top'] = 1
+    api_mock = MagicMock()
+    api_mock.has = {'fetchTickers': False}
+    fetch_ticker_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_ticker',
+                                     return_value={'ask': 0.4, 'bid': 0.3, 'last': 0.35})
+    fetch_l2_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_l2_order_book',
+                                 order_book_l2)
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    exchange._api_async.fetch_ticker = get_mock_coro({'ask': 0.5, 'bid': 0.4, 'last': 0.45})
+    exchange._api_async.fetch_l2_order_book = get_mock_coro(order_book_l2())
+    fetch_l2_mock.reset_mock()
+
+    pairs = ['ETH/BTC', 'LTC/BTC', 'XRP/BTC']
+    with exchange.prefetched_rates(pairs, side='sell'):
+        for pair in pairs:
+            assert exchange.get_rate(pair, refresh=True, side='sell') == 0.4
+    assert exchange._api_async.fetch_ticker.call_count == 3
+    assert fetch_ticker_mock.call_count == 0
+    assert log_has_re(r"Fetched sell rates for 3 of 3 pairs in \d+\.\d+s \(tickers\)\.", caplog)
+
+    with exchange.prefetched_rates(pairs, side='buy'):
+        for pair in pairs:
+            assert exchange.get_rate(pair, refresh=True, side='buy') == 0.043949
+    assert exchange._api_async.fetch_l2_order_book.call_count == 3
+    assert fetch_l2_mock.call_count == 0
+
+    # Concurrent requests not allowed
+    with exchange.prefetched_rates(pairs, side='sell', concurrent=False):
+        for pair in pairs:
+            exchange.get_rate(pair, refresh=True, side='sell')
+    assert exchange._api_async.fetch_ticker.call_count == 3
+    assert fetch_ticker_mock.call_count == 3
+
+    # Failing requests fall back to fetching the pair on its own
+    exchange._api_async.fetch_ticker = MagicMock(side_effect=ccxt.BadSymbol("Unknown pair"))
+    with exchange.prefetched_rates(pairs, side='sell'):
+        assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.3
+    assert fetch_ticker_mock.call_count == 4
+    assert log_has("Async code raised an exception: TemporaryError", caplog)
+
+
 def test_get_sell_rate_orderbook_exception(default_conf, mocker, caplog):
     # Test orderbook mode
     default_conf['ask_strategy']['price_side'] = 'ask'
@@ -2552,6 +2672,72 @@ def test_fetch_order_or_stoploss_order(default_conf, mocker):
     assert fetch_stoploss_order_mock.call_args_list[0][0][1] == 'ETH/BTC'
 
 
+def test_fetch_orders_or_stoploss_orders(default_conf, mocker, caplog):
+    default_conf['dry_run'] = False
+    api_mock = MagicMock()
+    exchange = get_patched_exchange(mocker, default_conf, api_mock, id='binance')
+    exchange._ft_has['order_fetch_concurrency'] = 2
+    running = []
+    max_running = []
+    asyncio_sleep = asyncio.sleep
+
+    async def fetch_order(order_id, pair):
+        running.append(order_id)
+        max_running.append(len(running))
+        await asyncio_sleep(0)
+        running.remove(order_id)
+        if order_id == 'missing':
+            raise ccxt.OrderNotFound("Order not found")
+        return {'id': order_id, 'symbol': pair}
+
+    exchange._api_async.fetch_order = MagicMock(side_effect=fetch_order)
+    orders = [('1', 'ETH/BTC', False), ('missing', 'LTC/BTC', False),
+              ('2', 'XRP/BTC', False), ('3', 'NEO/BTC', True)]
+    with patch('freqtrade.exchange.common.asyncio.sleep', get_mock_coro(None)) as sleep_mock:
+        res = exchange.fetch_orders_or_stoploss_orders(orders)
+    assert res[0] == {'id': '1', 'symbol': 'ETH/BTC'}
+    assert isinstance(res[1], InvalidOrderException)
+    assert res[2] == {'id': '2', 'symbol': 'XRP/BTC'}
+    assert res[3] == {'id': '3', 'symbol': 'NEO/BTC'}
+    assert max(max_running) == 2
+    # Not found orders are retried with backoff
+    assert exchange._api_async.fetch_order.call_count == 3 + API_FETCH_ORDER_RETRY_COUNT + 1
+    assert sleep_mock.call_count == API_FETCH_ORDER_RETRY_COUNT
+
+    # A single order is fetched directly, using the sync api
+    exchange._api.fetch_order = MagicMock(return_value={'id': '1'})
+    assert exchange.fetch_orders_or_stoploss_orders([('1', 'ETH/BTC', False)]) == [{'id': '1'}]
+    assert exchange._api.fetch_order.call_count == 1
+
+    # Exceptions other than ExchangeErrors are raised
+    exchange._api_async.fetch_order = MagicMock(side_effect=ccxt.BaseError("Something broke"))
+    with pytest.raises(OperationalException, match=r"Something broke"):
+        exchange.fetch_orders_or_stoploss_orders(orders[:2])
+
+    # Dry-run orders
+    default_conf['dry_run'] = True
+    exchange = get_patched_exchange(mocker, default_conf, id='binance')
+    exchange._dry_run_open_orders['X'] = {'id': 'X', 'status': 'closed'}
+    res = exchange.fetch_orders_or_stoploss_orders([('X', 'ETH/BTC', False),
+                                                    ('Y', 'ETH/BTC', False)])
+    assert res[0]['id'] == 'X'
+    assert isinstance(res[1], InvalidOrderException)
+
+
+def test_fetch_orders_or_stoploss_orders_custom_stoploss(default_conf, mocker):
+    default_conf['dry_run'] = False
+    exchange = get_patched_exchange(mocker, default_conf, id='ftx')
+    exchange._api_async.fetch_order = get_mock_coro({'id': '1'})
+    fetch_stoploss_order_mock = mocker.patch('freqtrade.exchange.Ftx.fetch_stoploss_order',
+                                             return_value={'id': '2'})
+
+    res = exchange.fetch_orders_or_stoploss_orders([('1', 'ETH/BTC', False),
+                                                    ('2', 'ETH/BTC', True)])
+    assert res == [{'id': '1'}, {'id': '2'}]
+    assert exchange._api_async.fetch_order.call_count == 1
+    assert fetch_stoploss_order_mock.call_count == 1
+
+
 @pytest.mark.parametrize("exchange_name", EXCHANGES)
 def test_name(default_conf, mocker, exchange_name):
     exchange = get_patched_exchange(mocker, default_conf, id=exchange_name)
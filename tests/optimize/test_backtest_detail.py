@@ -575,10 +575,12 @@ TESTS = [
 
 
 @pytest.mark.parametrize("data", TESTS)
-def test_backtest_results(default_conf, fee, mocker, caplog, data) -> None:
+@pytest.mark.parametrize("engine", ['loop', 'vectorized'])
+def test_backtest_results(default_conf, fee, mocker, caplog, data, engine) -> None:
     """
     run functional tests
     """
+    default_conf["backtest_engine"] = engine
     default_conf["stoploss"] = data.stop_loss
     default_conf["minimal_roi"] = data.roi
     default_conf["timeframe"] = tests_timeframe
@@ -595,11 +597,11 @@ def test_backtest_results(default_conf, fee, mocker, caplog, data) -> None:
     patch_exchange(mocker)
     frame = _build_backtest_dataframe(data.data)
     backtesting = Backtesting(default_conf)
+    backtesting.strategylist[0].use_custom_stoploss = data.use_custom_stoploss
     backtesting._set_strategy(backtesting.strategylist[0])
     backtesting.required_startup = 0
     backtesting.strategy.advise_buy = lambda a, m: frame
     backtesting.strategy.advise_sell = lambda a, m: frame
-    backtesting.strategy.use_custom_stoploss = data.use_custom_stoploss
     caplog.set_level(logging.DEBUG)
 
     pair = "UNITTEST/BTC"
@@ -3,12 +3,14 @@
 import random
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import MagicMock, PropertyMock, call
 
 import numpy as np
 import pandas as pd
 import pytest
 from arrow import Arrow
+from cachetools import LRUCache
+from joblib import Parallel
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_backtesting
 from freqtrade.configuration import TimeRange
@@ -22,7 +24,7 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import LocalTrade
 from freqtrade.resolvers import StrategyResolver
-from tests.conftest import (get_args, log_has, log_has_re, patch_exchange,
+from tests.conftest import (get_args, get_markets, log_has, log_has_re, patch_exchange,
                             patched_configuration_load_config_file)
 
 
@@ -396,6 +398,74 @@ def test_backtesting_start(default_conf, mocker, testdatadir, caplog) -> None:
     assert sbs.call_count == 1
 
 
+def test_backtesting_load_bt_data_load_jobs(default_conf, mocker, testdatadir, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC', 'NOPAIR/XXX', 'ETH/BTC', 'LTC/BTC']))
+    mocker.patch('freqtrade.data.history.jsondatahandler.JsonDataHandler.releases_gil', True)
+    default_conf['timeframe'] = '5m'
+    default_conf['datadir'] = testdatadir
+    default_conf['load_jobs'] = 2
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    advise_all = mocker.spy(backtesting.strategy, 'advise_all_indicators')
+    data, _ = backtesting.load_bt_data()
+    assert list(data) == ['UNITTEST/BTC', 'ETH/BTC', 'LTC/BTC']
+    assert log_has_re(r'Populated indicators for 3 pairs in .*', caplog)
+
+    # Indicators populated while loading are used once
+    preprocessed = backtesting.advise_all_indicators(data)
+    assert advise_all.call_count == 0
+    assert list(preprocessed) == list(data)
+    expected = backtesting.advise_all_indicators(data)
+    assert advise_all.call_count == 1
+    for pair in data:
+        pd.testing.assert_frame_equal(preprocessed[pair], expected[pair])
+
+    # Indicators aren't populated while loading if jobs are used to populate indicators
+    default_conf['indicator_jobs'] = 2
+    backtesting = Backtesting(default_conf)
+    data, _ = backtesting.load_bt_data()
+    assert list(data) == ['UNITTEST/BTC', 'ETH/BTC', 'LTC/BTC']
+    assert backtesting._preprocessed is None
+
+
+def test_backtesting_indicator_cache(default_conf, mocker, testdatadir, tmpdir, caplog) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC', 'ETH/BTC', 'LTC/BTC']))
+    mocker.patch('freqtrade.data.history.jsondatahandler.JsonDataHandler.releases_gil', True)
+    default_conf['timeframe'] = '5m'
+    default_conf['datadir'] = testdatadir
+    default_conf['user_data_dir'] = Path(tmpdir)
+    default_conf['indicator_cache'] = True
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    advise_all = mocker.spy(backtesting.strategy, 'advise_all_indicators')
+    data, _ = backtesting.load_bt_data()
+    expected = backtesting.advise_all_indicators(data)
+    assert advise_all.call_count == 1
+    assert log_has('Loaded indicators for 0 of 3 pairs from the indicator cache.', caplog)
+
+    preprocessed = backtesting.advise_all_indicators(data)
+    assert advise_all.call_count == 1
+    assert log_has('Loaded indicators for 3 of 3 pairs from the indicator cache.', caplog)
+    assert list(preprocessed) == list(expected)
+    for pair in data:
+        pd.testing.assert_frame_equal(preprocessed[pair], expected[pair])
+
+    # Cached indicators are used while loading data
+    caplog.clear()
+    default_conf['load_jobs'] = 2
+    backtesting = Backtesting(default_conf)
+    advise_pair = mocker.spy(backtesting.strategylist[0], '_advise_pair_indicators')
+    backtesting.load_bt_data()
+    assert advise_pair.call_count == 0
+    assert log_has('Loaded indicators for 3 of 3 pairs from the indicator cache.', caplog)
+
+
 def test_backtesting_start_no_data(default_conf, mocker, caplog, testdatadir) -> None:
     def get_timerange(input1):
         return Arrow(2017, 11, 14, 21, 17), Arrow(2017, 11, 14, 22, 59)
@@ -513,11 +583,12 @@ def test_backtest__enter_trade(default_conf, fee, mocker) -> None:
     assert trade.stake_amount == 495
 
     # Fake 2 trades, so there's not enough amount for the next trade left.
-    LocalTrade.trades_open.append(trade)
-    LocalTrade.trades_open.append(trade)
-    trade = backtesting._enter_trade(pair, row=row)
-    assert trade is None
-    LocalTrade.trades_open.pop()
+    LocalTrade.add_bt_trade(trade)
+    LocalTrade.add_bt_trade(trade)
+    trade1 = backtesting._enter_trade(pair, row=row)
+    assert trade1 is None
+    LocalTrade.reset_trades()
+    LocalTrade.add_bt_trade(trade)
     trade = backtesting._enter_trade(pair, row=row)
     assert trade is not None
 
@@ -632,6 +703,37 @@ def test_backtest__get_sell_trade_entry(default_conf, fee, mocker) -> None:
     assert round(res.close_rate, 3) == round(209.0225, 3)
 
 
+def test_backtest__get_detail_rows(default_conf, mocker) -> None:
+    default_conf['timeframe_detail'] = '1m'
+    patch_exchange(mocker)
+    backtesting = Backtesting(default_conf)
+    pair = 'UNITTEST/BTC'
+    dates = pd.date_range('2020-01-01 04:58', periods=10, freq='1min', tz='UTC')
+    backtesting.detail_data[pair] = pd.DataFrame({
+        'date': dates, 'open': range(10), 'close': range(10), 'low': range(10),
+        'high': range(10), 'volume': range(10)
+    })
+
+    rows = backtesting._get_detail_rows(pair, pd.Timestamp('2020-01-01 05:00', tz='UTC'))
+    index = backtesting._detail_index[pair]
+    assert len(rows) == 5
+    assert rows[0] == [dates[2], 2.0, 2.0, 2.0, 2.0]
+    assert rows[-1][0] == dates[6]
+
+    # Candle at the end of the detail data
+    rows = backtesting._get_detail_rows(pair, pd.Timestamp('2020-01-01 05:05', tz='UTC'))
+    assert [r[0] for r in rows] == list(dates[7:])
+    assert backtesting._get_detail_rows(pair, pd.Timestamp('2020-01-01 05:10', tz='UTC')) == []
+    # Detail data is only converted once
+    assert backtesting._detail_index[pair] is index
+
+    # Conversion is repeated for new detail data
+    backtesting.detail_data[pair] = backtesting.detail_data[pair].copy()
+    rows = backtesting._get_detail_rows(pair, pd.Timestamp('2020-01-01 04:55', tz='UTC'))
+    assert [r[0] for r in rows] == list(dates[:2])
+    assert backtesting._detail_index[pair] is not index
+
+
 def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
     default_conf['use_sell_signal'] = False
     mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
@@ -721,6 +823,74 @@ def test_backtest_1min_timeframe(default_conf, fee, mocker, testdatadir) -> None
     assert len(results['results']) == 1
 
 
+def test_backtest_signal_cache(default_conf, fee, mocker, testdatadir) -> None:
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    patch_exchange(mocker)
+    default_conf['strategy'] = 'HyperoptableStrategy'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.signal_cache = LRUCache(maxsize=10)
+    strategy = backtesting.strategy
+
+    # Helper column depending on a buy parameter
+    populate_buy_trend = strategy.populate_buy_trend
+
+    def populate_buy_trend_helper(dataframe, metadata):
+        dataframe['rsi_limit'] = dataframe['rsi'] < strategy.buy_rsi.value
+        return populate_buy_trend(dataframe, metadata)
+
+    mocker.patch.object(strategy, 'populate_buy_trend', side_effect=populate_buy_trend_helper)
+
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'])
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    advise_buy = mocker.spy(backtesting.strategy, 'advise_buy')
+
+    def run_backtest():
+        return backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date,
+                                    max_open_trades=1, position_stacking=False)['results']
+
+    def analyzed_dataframe():
+        return backtesting.dataprovider.get_analyzed_dataframe('UNITTEST/BTC', '5m')[0].copy()
+
+    result1 = run_backtest()
+    analyzed1 = analyzed_dataframe()
+    assert backtesting.signal_cache_misses == 1
+    assert backtesting.signal_cache_hits == 0
+
+    result2 = run_backtest()
+    assert backtesting.signal_cache_misses == 1
+    assert backtesting.signal_cache_hits == 1
+    assert advise_buy.call_count == 1
+    pd.testing.assert_frame_equal(result1, result2)
+    # The dataprovider receives the same dataframe on hits and misses
+    pd.testing.assert_frame_equal(analyzed_dataframe(), analyzed1)
+    assert 'rsi' in analyzed1.columns
+    assert analyzed1['buy'].sum() > 0
+    # Only columns set by the signal functions are cached, indicators are taken
+    # from the processed data
+    assert all(list(signals.columns) == ['buy', 'sell', 'buy_tag', 'exit_tag', 'rsi_limit']
+               for signals in backtesting.signal_cache.values())
+    assert 'rsi_limit' not in processed['UNITTEST/BTC'].columns
+
+    # Changing a buy parameter requires new signals
+    buy_rsi = strategy.buy_rsi.value
+    strategy.buy_rsi.value = 40
+    run_backtest()
+    assert backtesting.signal_cache_misses == 2
+    assert advise_buy.call_count == 2
+    assert len(backtesting.signal_cache) == 2
+    assert not analyzed_dataframe()['rsi_limit'].equals(analyzed1['rsi_limit'])
+
+    # Helper columns of the cached parameters are restored
+    strategy.buy_rsi.value = buy_rsi
+    run_backtest()
+    assert backtesting.signal_cache_hits == 2
+    assert advise_buy.call_count == 2
+    pd.testing.assert_frame_equal(analyzed_dataframe(), analyzed1)
+
+
 def test_processed(default_conf, mocker, testdatadir) -> None:
     patch_exchange(mocker)
     backtesting = Backtesting(default_conf)
@@ -917,6 +1087,82 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results['results'], '5m', 1)) == 0
 
 
+@pytest.mark.parametrize("max_open_trades,position_stacking", [(1, False), (3, False), (3, True)])
+@pytest.mark.parametrize("trailing", [{}, {
+    'trailing_stop': True,
+    'trailing_stop_positive': 0.01,
+}, {
+    'trailing_stop': True,
+    'trailing_stop_positive': 0.01,
+    'trailing_stop_positive_offset': 0.015,
+    'trailing_only_offset_is_reached': True,
+}])
+def test_backtest_vectorized_engine(default_conf, fee, mocker, testdatadir,
+                                    max_open_trades, position_stacking, trailing) -> None:
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+    default_conf.update(trailing)
+    default_conf.update({
+        'timeframe': '5m',
+        'minimal_roi': {"0": 0.05, "30": 0.02, "90": 0.01, "300": -0.01},
+        'stoploss': -0.03,
+        'protections': [{"method": "CooldownPeriod", "stop_duration_candles": 3}],
+        'enable_protections': True,
+    })
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC', 'XLM/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    # Remove data for one pair from the beginning of the data
+    data['LTC/BTC'] = data['LTC/BTC'][50:].reset_index()
+
+    results = {}
+    for engine in ['loop', 'vectorized']:
+        default_conf['backtest_engine'] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        assert backtesting.use_vectorized is (engine == 'vectorized')
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=processed,
+            start_date=min_date,
+            end_date=max_date,
+            max_open_trades=max_open_trades,
+            position_stacking=position_stacking,
+            enable_protections=True,
+        )
+
+    assert len(results['loop']['results']) > 0
+    pd.testing.assert_frame_equal(results['loop']['results'], results['vectorized']['results'])
+    assert results['loop']['rejected_signals'] == results['vectorized']['rejected_signals']
+    assert results['loop']['final_balance'] == results['vectorized']['final_balance']
+    assert len(results['loop']['locks']) == len(results['vectorized']['locks'])
+
+
+def test_backtest_vectorized_engine_fallback(default_conf, mocker, caplog) -> None:
+    patch_exchange(mocker)
+    default_conf['backtest_engine'] = 'vectorized'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting.use_vectorized
+
+    backtesting.strategy.use_custom_stoploss = True
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert not backtesting.use_vectorized
+    assert log_has("Vectorized backtest engine not available (strategy uses custom_stoploss), "
+                   "falling back to the loop engine.", caplog)
+
+    backtesting.strategy.use_custom_stoploss = False
+    backtesting.timeframe_detail = '1m'
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert not backtesting.use_vectorized
+
+    default_conf['backtest_engine'] = 'loop'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert not backtesting.use_vectorized
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
 
     patch_exchange(mocker)
@@ -1032,6 +1278,84 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog, testdatadir):
         assert log_has(line, caplog)
 
 
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, caplog, testdatadir):
+    patch_exchange(mocker)
+    backtestmock = MagicMock(return_value={
+        'results': pd.DataFrame(columns=BT_DATA_COLUMNS),
+        'config': default_conf,
+        'locks': [],
+        'rejected_signals': 20,
+        'final_balance': 1000,
+    })
+    mocker.patch('freqtrade.plugins.pairlistmanager.PairListManager.whitelist',
+                 PropertyMock(return_value=['UNITTEST/BTC']))
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.backtest', backtestmock)
+    stats_mock = mocker.patch('freqtrade.optimize.backtesting.generate_backtest_stats')
+    mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+    # Run jobs in this process
+    parallel_mock = mocker.patch('joblib.Parallel',
+                                 side_effect=lambda n_jobs: Parallel(n_jobs=1))
+    default_conf.update({
+        'strategy_list': ['StrategyTestV2', 'TestStrategyLegacyV1'],
+        'strategy_path': str(Path(__file__).parents[1] / 'strategy/strats'),
+        'datadir': testdatadir,
+        'timeframe': '1m',
+        'timerange': '1510694220-1510700340',
+        'backtest_jobs': 2,
+        'export': 'none',
+    })
+    backtesting = Backtesting(default_conf)
+    api = backtesting.exchange._api
+    backtesting.start()
+
+    assert parallel_mock.call_args_list == [call(n_jobs=2)]
+    assert backtestmock.call_count == 2
+    assert log_has('Backtesting 2 strategies using 1 parallel jobs.', caplog)
+    assert list(backtesting.all_results) == ['StrategyTestV2', 'TestStrategyLegacyV1']
+    assert stats_mock.call_args[0][1] is backtesting.all_results
+    assert backtesting.exchange._api is api
+
+    # Single job - no parallel execution
+    parallel_mock.reset_mock()
+    backtesting.config['backtest_jobs'] = 1
+    backtesting.start()
+    assert parallel_mock.call_count == 0
+    assert backtestmock.call_count == 4
+
+
+def test_backtest_start_multi_strat_worker_processes(default_conf, mocker, testdatadir):
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.optimize.backtesting.generate_backtest_stats')
+    mocker.patch('freqtrade.optimize.backtesting.show_backtest_results')
+    default_conf['exchange']['pair_whitelist'] = ['ETH/BTC', 'LTC/BTC']
+    default_conf.update({
+        'strategy_list': ['StrategyTestV2', 'TestStrategyLegacyV1'],
+        'strategy_path': str(Path(__file__).parents[1] / 'strategy/strats'),
+        'datadir': testdatadir,
+        'timeframe': '5m',
+        'fee': 0.0025,
+        'export': 'none',
+    })
+
+    def run_backtesting(jobs):
+        backtesting = Backtesting(default_conf)
+        # Markets are loaded before the backtesting instance is sent to the worker processes
+        backtesting.exchange._markets = get_markets()
+        backtesting.config['backtest_jobs'] = jobs
+        backtesting.start()
+        return backtesting.all_results
+
+    expected = run_backtesting(1)
+    results = run_backtesting(2)
+    assert list(results) == list(expected)
+    for strategy_name, strat_results in expected.items():
+        pd.testing.assert_frame_equal(results[strategy_name]['results'],
+                                      strat_results['results'])
+        assert len(strat_results['results']) > 0
+        for key in ('locks', 'rejected_signals', 'final_balance'):
+            assert results[strategy_name][key] == strat_results[key]
+
+
 @pytest.mark.filterwarnings("ignore:deprecated")
 def test_backtest_start_multi_strat_nomock(default_conf, mocker, caplog, testdatadir, capsys):
     default_conf.update({
@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import ANY, MagicMock
@@ -7,6 +8,8 @@ import pandas as pd
 import pytest
 from arrow import Arrow
 from filelock import Timeout
+from joblib import dump, load
+from skopt import Optimizer
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
@@ -271,7 +274,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
     assert res['stoploss']['stoploss'] == -0.1
 
 
-def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
+def test_start_calls_optimizer(mocker, hyperopt_conf, capsys, caplog) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump')
     dumper2 = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_result')
     mocker.patch('freqtrade.optimize.hyperopt.file_dump_json')
@@ -312,6 +315,7 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
 
     out, err = capsys.readouterr()
     assert 'Best result:\n\n*    1/1: foo result Objective: 1.00000\n' in out
+    assert log_has("Signal cache: 0 hits, 0 misses.", caplog)
     # Should be called for historical candle data
     assert dumper.call_count == 1
     assert dumper2.call_count == 1
@@ -425,7 +429,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     patch_exchange(mocker)
     mocker.patch.object(Path, 'open')
     mocker.patch('freqtrade.configuration.config_validation.validate_config_schema')
-    mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': None})
+    mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': pd.DataFrame()})
 
     optimizer_param = {
         'buy_plusdi': 0.02,
@@ -474,7 +478,10 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
         'params_dict': optimizer_param,
         'params_not_optimized': {'buy': {}, 'protection': {}, 'sell': {}},
         'results_metrics': ANY,
-        'total_profit': 3.1e-08
+        'total_profit': 3.1e-08,
+        'signal_cache_hits': 0,
+        'signal_cache_misses': 0,
+        'epoch_duration': ANY,
     }
 
     hyperopt = Hyperopt(hyperopt_conf)
@@ -486,6 +493,33 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     assert generate_optimizer_value == response_expected
 
 
+def test_get_processed_data(mocker, hyperopt_conf, tmpdir) -> None:
+    patch_exchange(mocker)
+    hyperopt = Hyperopt(hyperopt_conf)
+    data = {'UNITTEST/BTC': pd.DataFrame({'close': [1.0, 2.0, 3.0]})}
+    hyperopt.data_pickle_file = Path(tmpdir) / 'hyperopt_tickerdata.pkl'
+    dump(data, hyperopt.data_pickle_file)
+    hyperopt.data_token = 'abc'
+    loadmock = mocker.patch('freqtrade.optimize.hyperopt.load', side_effect=load)
+    try:
+        processed = hyperopt._get_processed_data()
+        assert loadmock.call_count == 1
+        assert processed['UNITTEST/BTC']['close'].tolist() == [1.0, 2.0, 3.0]
+        # Modifications of one epoch must not leak into the next epoch
+        processed['UNITTEST/BTC']['buy'] = 1
+
+        processed = hyperopt._get_processed_data()
+        assert loadmock.call_count == 1
+        assert 'buy' not in processed['UNITTEST/BTC']
+
+        # New data published - attach again
+        hyperopt.data_token = 'def'
+        hyperopt._get_processed_data()
+        assert loadmock.call_count == 2
+    finally:
+        hyperopt.clean_hyperopt()
+
+
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     patch_exchange(mocker)
 
@@ -499,6 +533,69 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
+def test_start_async_scheduler(mocker, hyperopt_conf, caplog) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt.dump')
+    saver = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_result')
+    mocker.patch('freqtrade.optimize.hyperopt.file_dump_json')
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting.load_bt_data',
+                 MagicMock(return_value=(MagicMock(), None)))
+    mocker.patch(
+        'freqtrade.optimize.hyperopt.get_timerange',
+        MagicMock(return_value=(datetime(2017, 12, 10), datetime(2017, 12, 13)))
+    )
+    executor = ThreadPoolExecutor(max_workers=2)
+    mocker.patch('freqtrade.optimize.hyperopt.get_reusable_executor', return_value=executor)
+    losses = iter([3, 1, 2, 4, 0.5])
+    optimizer = mocker.patch(
+        'freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer',
+        side_effect=lambda *args: {
+            'loss': next(losses), 'results_explanation': 'foo result',
+            'params_details': {}, 'results_metrics': {'total_trades': 1},
+            'total_profit': 0.001, 'epoch_duration': 0.5,
+        }
+    )
+    mocker.patch('freqtrade.optimize.hyperopt.Hyperopt.print_results')
+    mocker.patch('freqtrade.optimize.hyperopt.HyperoptTools.try_export_params')
+    mocker.patch('freqtrade.optimize.hyperopt.HyperoptTools.show_epoch_details')
+    patch_exchange(mocker)
+    hyperopt_conf.update({'hyperopt_scheduler': 'async', 'hyperopt_jobs': 2, 'epochs': 5})
+
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.backtesting.strategy.advise_all_indicators = MagicMock()
+    hyperopt.custom_hyperopt.generate_roi_table = MagicMock(return_value={})
+    tell = mocker.spy(Optimizer, 'tell')
+
+    hyperopt.start()
+    executor.shutdown()
+
+    assert optimizer.call_count == 5
+    assert saver.call_count == 5
+    # Results are passed to the optimizer one by one
+    assert tell.call_count == 5
+    assert hyperopt.current_best_loss == 0.5
+    assert [c[0][0]['current_epoch'] for c in saver.call_args_list] == [1, 2, 3, 4, 5]
+    assert hyperopt.epochs_duration == 2.5
+    assert log_has('Effective number of parallel workers used: 2', caplog)
+    assert log_has_re(r'Worker utilization: .*% \(2.5s of epochs on 2 workers in .*s\)\.', caplog)
+
+
+def test_ask_point(hyperopt) -> None:
+    hyperopt.random_state = 42
+    hyperopt.init_spaces()
+    hyperopt.opt = hyperopt.get_optimizer(hyperopt.dimensions, 1)
+
+    first = hyperopt._ask_point([])
+    assert hyperopt._ask_point([]) != first
+
+    hyperopt.opt.ask = MagicMock(side_effect=[first, [first, [1]], first])
+    assert hyperopt._ask_point([first]) == [1]
+    assert hyperopt.opt.ask.call_count == 2
+    assert hyperopt.opt.ask.call_args_list[1][1] == {'n_points': 2}
+    # Keep point from the optimizer if no other point is available
+    hyperopt.opt.ask = MagicMock(side_effect=[first, [first]])
+    assert hyperopt._ask_point([first]) == first
+
+
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
     dumper = mocker.patch('freqtrade.optimize.hyperopt.dump')
     dumper2 = mocker.patch('freqtrade.optimize.hyperopt.Hyperopt._save_result')
@@ -0,0 +1,123 @@
+import os
+from pathlib import Path
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.history import load_pair_history
+from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.indicator_cache import IndicatorCache
+from freqtrade.resolvers import StrategyResolver
+from tests.conftest import log_has_re
+
+
+@pytest.fixture
+def cache_conf(default_conf, testdatadir, tmpdir):
+    default_conf.update({
+        'strategy': 'HyperoptableStrategy',
+        'datadir': testdatadir,
+        'user_data_dir': Path(tmpdir),
+    })
+    return default_conf
+
+
+def test_indicator_cache_get_store(cache_conf, testdatadir) -> None:
+    strategy = StrategyResolver.load_strategy(cache_conf)
+    data = load_pair_history('UNITTEST/BTC', '5m', testdatadir)
+    analyzed, _ = strategy._advise_pair_indicators('UNITTEST/BTC', data)
+
+    cache = IndicatorCache(cache_conf, strategy)
+    assert cache.get('UNITTEST/BTC', data) is None
+    cache.store('UNITTEST/BTC', data, analyzed)
+    assert_frame_equal(cache.get('UNITTEST/BTC', data), analyzed)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    # Different pair, different data
+    assert cache.get('ETH/BTC', data) is None
+    assert cache.get('UNITTEST/BTC', data.iloc[1:]) is None
+
+    # Parameter values are part of the key
+    buy_rsi = strategy.buy_rsi.value
+    strategy.buy_rsi.value = buy_rsi + 1
+    assert IndicatorCache(cache_conf, strategy).get('UNITTEST/BTC', data) is None
+    strategy.buy_rsi.value = buy_rsi
+    assert IndicatorCache(cache_conf, strategy).get('UNITTEST/BTC', data) is not None
+
+    # So are the parameter ranges of parameters being optimized
+    strategy.buy_rsi.in_space = True
+    assert IndicatorCache(cache_conf, strategy).get('UNITTEST/BTC', data) is None
+
+
+def test_indicator_cache_store_unsupported(cache_conf, testdatadir, caplog) -> None:
+    strategy = StrategyResolver.load_strategy(cache_conf)
+    data = load_pair_history('UNITTEST/BTC', '5m', testdatadir)
+    analyzed = data.copy()
+    analyzed['mixed'] = ['a' if idx % 2 else 1 for idx in range(len(data))]
+
+    cache = IndicatorCache(cache_conf, strategy)
+    cache.store('UNITTEST/BTC', data, analyzed)
+    assert cache.get('UNITTEST/BTC', data) is None
+    assert log_has_re(r"Not caching indicators for UNITTEST/BTC: .*column mixed.*", caplog)
+
+
+def test_indicator_cache_informative_pairs(mocker, cache_conf, testdatadir, tmpdir) -> None:
+    strategy = StrategyResolver.load_strategy(cache_conf)
+    data = load_pair_history('UNITTEST/BTC', '5m', testdatadir)
+    mocker.patch.object(strategy, 'informative_pairs', return_value=[('XRP/ETH', '5m')])
+    cache = IndicatorCache(cache_conf, strategy)
+    cache.store('UNITTEST/BTC', data, data)
+    assert cache.get('UNITTEST/BTC', data) is not None
+
+    # Informative data changed
+    cache_conf['datadir'] = Path(tmpdir)
+    assert IndicatorCache(cache_conf, strategy).get('UNITTEST/BTC', data) is None
+
+    # Informative pairs can't be determined
+    mocker.patch.object(strategy, 'gather_informative_pairs',
+                        side_effect=OperationalException('requires DataProvider instance.'))
+    with pytest.raises(OperationalException,
+                       match=r"Can't determine the informative pairs of .*DataProvider"):
+        IndicatorCache(cache_conf, strategy)
+
+
+def test_indicator_cache_no_source(mocker, cache_conf) -> None:
+    strategy = StrategyResolver.load_strategy(cache_conf)
+    mocker.patch('freqtrade.optimize.indicator_cache.inspect.getsource', side_effect=OSError)
+    # Source added by the strategy resolver
+    IndicatorCache(cache_conf, strategy)
+
+    strategy.__source__ = ''
+    with pytest.raises(OperationalException, match=r"Can't read the source of .*"):
+        IndicatorCache(cache_conf, strategy)
+
+
+def test_indicator_cache_evict_clear(cache_conf, testdatadir) -> None:
+    strategy = StrategyResolver.load_strategy(cache_conf)
+    cache = IndicatorCache(cache_conf, strategy)
+    cache_dir = IndicatorCache.get_cache_dir(cache_conf)
+    pairs = ['UNITTEST/BTC', 'ETH/BTC', 'LTC/BTC']
+    data = {pair: load_pair_history(pair, '5m', testdatadir) for pair in pairs}
+    for pair in pairs:
+        cache.store(pair, data[pair], data[pair])
+
+    entries = IndicatorCache.get_entries(cache_dir)
+    assert len(entries) == 3
+    assert {entry['pair'] for entry in entries} == set(pairs)
+    assert {entry['strategy'] for entry in entries} == {'HyperoptableStrategy'}
+
+    # Keep all entries while the cache is small enough
+    cache.evict()
+    assert len(IndicatorCache.get_entries(cache_dir)) == 3
+
+    # Mark first pair as used - the least recently used entry is removed
+    for entry in entries:
+        os.utime(entry['file'], (0, 1000 + pairs.index(entry['pair'])))
+    cache.get('UNITTEST/BTC', data['UNITTEST/BTC'])
+    cache._max_size = sum(entry['size'] for entry in entries) - 1
+    cache.evict()
+    assert {entry['pair'] for entry in IndicatorCache.get_entries(cache_dir)} == {
+        'UNITTEST/BTC', 'LTC/BTC'}
+
+    assert IndicatorCache.clear(cache_dir) == 2
+    assert IndicatorCache.get_entries(cache_dir) == []
@@ -141,3 +141,43 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_backtest_index():
+    PairLocks.timeframe = '5m'
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    # Many (mostly expired) locks, not created in order of their end time
+    for i in range(100):
+        PairLocks.lock_pair('XRP/USDT', start + timedelta(minutes=10 * i + 10), now=start)
+    lock_long = PairLocks.lock_pair('ETH/USDT', start + timedelta(hours=2), now=start)
+    lock_short = PairLocks.lock_pair('ETH/USDT', start + timedelta(minutes=30), now=start)
+    lock_global = PairLocks.lock_pair('*', start + timedelta(minutes=20), 'global', now=start)
+
+    now = start + timedelta(minutes=100)
+    assert PairLocks.is_pair_locked('XRP/USDT', now)
+    assert len(PairLocks.get_pair_locks('XRP/USDT', now)) == 91
+    assert PairLocks.get_pair_locks('ETH/USDT', now) == [lock_long]
+    assert not PairLocks.is_global_lock(now)
+    assert not PairLocks.is_pair_locked('LTC/USDT', now)
+
+    # Locks are returned in order of creation
+    now = start + timedelta(minutes=15)
+    assert PairLocks.get_pair_locks('ETH/USDT', now) == [lock_long, lock_short]
+    assert PairLocks.get_pair_locks(None, now)[-3:] == [lock_long, lock_short, lock_global]
+    assert PairLocks.is_pair_locked('LTC/USDT', now)
+
+    PairLocks.unlock_pair('ETH/USDT', now)
+    assert PairLocks.get_pair_locks('ETH/USDT', now) == []
+    assert PairLocks.is_pair_locked('ETH/USDT', now)
+    PairLocks.unlock_reason('global', now)
+    assert not PairLocks.is_pair_locked('ETH/USDT', now)
+
+    # All locks are kept for results
+    assert len(PairLocks.get_all_locks()) == 103
+
+    PairLocks.reset_locks()
+    assert not PairLocks.is_pair_locked('XRP/USDT', now)
+    PairLocks.use_db = True
@@ -1,12 +1,16 @@
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
+import pandas as pd
 import pytest
 
 from freqtrade import constants
+from freqtrade.data.btanalysis import calculate_max_drawdown
 from freqtrade.enums import SellType
-from freqtrade.persistence import PairLocks, Trade
+from freqtrade.persistence import LocalTrade, PairLocks, Trade
 from freqtrade.plugins.protectionmanager import ProtectionManager
+from freqtrade.plugins.protections import IProtection
+from freqtrade.plugins.protections.trade_window import TradeWindow
 from tests.conftest import get_patched_freqtradebot, log_has_re
 
 
@@ -409,3 +413,115 @@ def test_protection_manager_desc(mocker, default_conf, protectionconf,
 
     short_desc = str(freqtrade.protections.short_desc())
     assert short_desc == desc_expected
+
+
+def test_trade_window():
+    start = datetime(2021, 5, 1, tzinfo=timezone.utc)
+    window = TradeWindow(timedelta(minutes=60))
+    assert len(window) == 0
+    assert window.drawdown == 0.0
+
+    window.add(start, 0.02)
+    window.add(start + timedelta(minutes=10), -0.03)
+    window.add(start + timedelta(minutes=20), -0.01)
+    window.add(start + timedelta(minutes=30), 0.05)
+    assert len(window) == 4
+    assert window.last_close_date == start + timedelta(minutes=30)
+    assert IProtection.calculate_lock_end(window, 15) == start + timedelta(minutes=45)
+    assert pytest.approx(window.profit) == 0.03
+    assert pytest.approx(window.drawdown) == 0.04
+
+    # Trades closed before the lookback period expire
+    window.expire(start + timedelta(minutes=70))
+    assert len(window) == 2
+    assert pytest.approx(window.profit) == 0.04
+    assert window.drawdown == 0.0
+
+    # Out of order, naive dates (from the database)
+    window.add(datetime(2021, 5, 1, 0, 25), -0.02)
+    assert len(window) == 3
+    assert pytest.approx(window.drawdown) == 0.02
+    assert window.last_close_date == start + timedelta(minutes=30)
+
+    window.expire(start + timedelta(minutes=120))
+    assert len(window) == 0
+    assert window.profit == 0.0
+    assert window.drawdown == 0.0
+
+
+def test_trade_window_drawdown():
+    start = datetime(2021, 5, 1, tzinfo=timezone.utc)
+    random.seed(42)
+    trades = pd.DataFrame({
+        'close_date': [start + timedelta(minutes=5 * idx) for idx in range(300)],
+        'profit_ratio': [random.uniform(-0.05, 0.05) for _ in range(300)],
+    })
+    window = TradeWindow(timedelta(minutes=100))
+    for idx, trade in trades.iterrows():
+        window.add(trade['close_date'], trade['profit_ratio'])
+        window.expire(trade['close_date'])
+        in_window = trades.iloc[max(0, idx - 19):idx + 1]
+        try:
+            drawdown = calculate_max_drawdown(in_window)[0]
+        except ValueError:
+            drawdown = 0.0
+        assert len(window) == len(in_window)
+        assert pytest.approx(window.drawdown) == drawdown
+        assert pytest.approx(window.profit) == in_window['profit_ratio'].sum()
+
+
+def test_protections_backtesting(default_conf):
+    default_conf['protections'] = [
+        {"method": "StoplossGuard", "lookback_period": 60, "stop_duration": 30,
+         "trade_limit": 2, "only_per_pair": True},
+        {"method": "LowProfitPairs", "lookback_period": 60, "stop_duration": 20,
+         "trade_limit": 3},
+        {"method": "MaxDrawdown", "lookback_period": 120, "stop_duration": 10,
+         "trade_limit": 2, "max_allowed_drawdown": 0.05},
+        {"method": "CooldownPeriod", "stop_duration": 5},
+    ]
+    # Trades are not queried, but fed by trade_closed()
+    Trade.use_db = False
+    try:
+        protections = ProtectionManager(default_conf, default_conf['protections'])
+        stoploss_guard, low_profit, max_drawdown, cooldown = protections._protection_handlers
+        start = datetime(2021, 5, 1, tzinfo=timezone.utc)
+
+        def close_trade(pair, minutes, profit, sell_reason=SellType.STOP_LOSS):
+            protections.trade_closed(LocalTrade(
+                pair=pair, is_open=False, close_profit=profit, sell_reason=sell_reason.value,
+                close_date=start + timedelta(minutes=minutes)))
+
+        def minutes(minutes):
+            return start + timedelta(minutes=minutes)
+
+        close_trade('XRP/BTC', 0, -0.02)
+        assert cooldown.stop_per_pair('XRP/BTC', minutes(2)) == (
+            True, minutes(5), 'Cooldown period for 5 minutes.')
+        close_trade('ETH/BTC', 10, 0.01, SellType.ROI)
+        assert cooldown.stop_per_pair('XRP/BTC', minutes(14)) == (False, None, None)
+        assert cooldown.stop_per_pair('ETH/BTC', minutes(14)) == (
+            True, minutes(15), 'Cooldown period for 5 minutes.')
+
+        close_trade('XRP/BTC', 20, -0.03)
+        assert stoploss_guard.stop_per_pair('XRP/BTC', minutes(30)) == (
+            True, minutes(50), '2 stoplosses in 60 min, locking for 30 min.')
+        assert stoploss_guard.stop_per_pair('ETH/BTC', minutes(30)) == (False, None, None)
+        # -2%, +1%, -3%
+        assert max_drawdown.global_stop(minutes(30)) == (False, None, None)
+
+        close_trade('XRP/BTC', 40, -0.03, SellType.ROI)
+        lock, until, reason = max_drawdown.global_stop(minutes(45))
+        assert lock
+        assert until == minutes(50)
+        assert pytest.approx(float(reason.split(' ')[0])) == 0.06
+        assert low_profit.stop_per_pair('XRP/BTC', minutes(55))[:2] == (True, minutes(60))
+
+        # First trade of XRP/BTC expired
+        assert low_profit.stop_per_pair('XRP/BTC', minutes(65)) == (False, None, None)
+        assert stoploss_guard.stop_per_pair('XRP/BTC', minutes(65)) == (False, None, None)
+        # Only the global window is maintained by MaxDrawdown
+        assert list(max_drawdown._trade_windows) == [None]
+        assert set(low_profit._trade_windows) == {'XRP/BTC', 'ETH/BTC'}
+    finally:
+        Trade.use_db = True
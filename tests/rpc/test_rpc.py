@@ -277,6 +277,44 @@ def test_rpc_daily_profit(default_conf, update, ticker, fee,
         rpc._rpc_daily_profit(0, stake_currency, fiat_display_currency)
 
 
+def test_rpc_timeunit_profit_cache(default_conf, fee, markets, mocker) -> None:
+    mocker.patch('freqtrade.rpc.telegram.Telegram', MagicMock())
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        markets=PropertyMock(return_value=markets)
+    )
+    del default_conf['fiat_display_currency']
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf)
+    create_mock_trades(fee)
+    stake_currency = default_conf['stake_currency']
+    rpc = RPC(freqtradebot)
+    daily_mock = mocker.spy(Trade, 'get_daily_profit')
+
+    days = rpc._rpc_daily_profit(7, stake_currency, '')
+    assert daily_mock.call_count == 1
+    # Results are cached until a trade closes
+    assert rpc._rpc_daily_profit(7, stake_currency, '') == days
+    assert daily_mock.call_count == 1
+    # Different timescale
+    weeks = rpc._rpc_weekly_profit(2, stake_currency, '')
+    assert daily_mock.call_count == 2
+    assert weeks['data'][0]['trade_count'] + weeks['data'][1]['trade_count'] >= (
+        days['data'][0]['trade_count'])
+
+    trade = Trade.get_trades([Trade.is_open.is_(True)]).first()
+    trade.close_date = datetime.utcnow()
+    trade.close(trade.open_rate)
+    Trade.commit()
+    days_new = rpc._rpc_daily_profit(7, stake_currency, '')
+    assert daily_mock.call_count == 3
+    assert days_new['data'][0]['trade_count'] == days['data'][0]['trade_count'] + 1
+
+    months = rpc._rpc_monthly_profit(1, stake_currency, '')
+    assert len(months['data']) == 1
+    assert months['data'][0]['date'] == datetime.utcnow().strftime('%Y-%m')
+    assert months['data'][0]['trade_count'] >= days_new['data'][0]['trade_count']
+
+
 def test_rpc_trade_history(mocker, default_conf, markets, fee):
     mocker.patch('freqtrade.rpc.telegram.Telegram', MagicMock())
     mocker.patch.multiple(
@@ -1246,8 +1284,17 @@ def test_rpc_edge_enabled(mocker, edge_conf) -> None:
     rpc = RPC(freqtradebot)
     ret = rpc._rpc_edge()
 
-    assert len(ret) == 1
-    assert ret[0]['Pair'] == 'E/F'
-    assert ret[0]['Winrate'] == 0.66
-    assert ret[0]['Expectancy'] == 1.71
-    assert ret[0]['Stoploss'] == -0.02
+    assert len(ret['pairs']) == 1
+    assert ret['pairs'][0]['Pair'] == 'E/F'
+    assert ret['pairs'][0]['Winrate'] == 0.66
+    assert ret['pairs'][0]['Expectancy'] == 1.71
+    assert ret['pairs'][0]['Stoploss'] == -0.02
+    assert ret['last_calculated'] is None
+    assert ret['snapshot_age'] is None
+
+    freqtradebot.edge._last_updated = int(datetime.now(timezone.utc).timestamp()) - 60
+    freqtradebot.edge._last_calculation_duration = 12.3456
+    ret = rpc._rpc_edge()
+    assert 60 <= ret['snapshot_age'] <= 62
+    assert ret['calculation_duration'] == 12.346
+    assert ret['calculating'] is False
@@ -1148,6 +1148,86 @@ def test_api_pair_candles(botclient, ohlcv_history):
              ])
 
 
+def test_api_pair_candles_incremental(botclient, ohlcv_history):
+    ftbot, client = botclient
+    timeframe = '5m'
+    ohlcv_history['sma'] = ohlcv_history['close'].rolling(2).mean()
+    ohlcv_history['rsi'] = 50.0
+    ohlcv_history.loc[2, 'rsi'] = float('inf')
+    ohlcv_history['buy'] = 0
+    ohlcv_history.loc[1, 'buy'] = 1
+    ohlcv_history['sell'] = 0
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history)
+
+    # Column selection - date and signals are always returned, unknown columns are ignored
+    rc = client_get(client, f"{BASE_URI}/pair_candles?pair=XRP%2FBTC&timeframe={timeframe}"
+                    "&limit=100&columns=sma&columns=nonexisting")
+    assert_response(rc)
+    assert rc.json()['columns'] == ['date', 'sma', 'buy', 'sell', '__date_ts']
+    assert rc.json()['length'] == len(ohlcv_history)
+    assert rc.json()['buy_signals'] == 1
+
+    # Incremental fetch - only candles after since_ms
+    rc = client_get(client, f"{BASE_URI}/pair_candles?pair=XRP%2FBTC&timeframe={timeframe}"
+                    "&limit=100&since_ms=1511686500000")
+    assert_response(rc)
+    assert rc.json()['length'] == 1
+    assert rc.json()['data_start_ts'] == 1511686800000
+    assert rc.json()['buy_signals'] == 0
+
+    rc = client_get(client, f"{BASE_URI}/pair_candles?pair=XRP%2FBTC&timeframe={timeframe}"
+                    "&limit=100&since_ms=1511686800000")
+    assert_response(rc)
+    assert rc.json()['length'] == 0
+    assert rc.json()['data'] == []
+
+    rc = client_get(client, f"{BASE_URI}/pair_candles?pair=XRP%2FBTC&timeframe={timeframe}"
+                    "&limit=100&format=csv")
+    assert_response(rc, 422)
+
+
+def test_api_pair_candles_arrow(botclient, ohlcv_history):
+    pa = pytest.importorskip('pyarrow')
+    ftbot, client = botclient
+    timeframe = '5m'
+    ohlcv_history['sma'] = ohlcv_history['close'].rolling(2).mean()
+    ohlcv_history['rsi'] = 50.0
+    ohlcv_history.loc[2, 'rsi'] = float('inf')
+    ohlcv_history['buy'] = 0
+    ohlcv_history.loc[1, 'buy'] = 1
+    ohlcv_history['sell'] = 0
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history)
+
+    rc = client_get(client, f"{BASE_URI}/pair_candles?pair=XRP%2FBTC&timeframe={timeframe}"
+                    "&limit=3&columns=close&columns=sma&columns=rsi&format=arrow")
+    assert rc.status_code == 200
+    assert rc.headers['content-type'] == 'application/vnd.apache.arrow.stream'
+    table = pa.ipc.open_stream(rc.content).read_all()
+    details = json.loads(table.schema.metadata[b'freqtrade'])
+    assert details['pair'] == 'XRP/BTC'
+    assert details['strategy'] == 'StrategyTestV2'
+    assert details['length'] == 3
+    assert details['buy_signals'] == 1
+    assert details['data_start_ts'] == 1511686200000
+    assert details['data_stop_ts'] == 1511686800000
+    assert details['columns'] == table.column_names == [
+        'date', 'close', 'sma', 'rsi', 'buy', 'sell', '__date_ts', '_buy_signal_close',
+        '_sell_signal_close']
+    df = table.to_pandas()
+    # NaN and inf are preserved
+    assert isnan(df['sma'].iloc[0])
+    assert df['rsi'].iloc[2] == float('inf')
+    assert df['__date_ts'].tolist() == [1511686200000, 1511686500000, 1511686800000]
+    assert df['_buy_signal_close'].iloc[1] == 8.893e-05
+
+    rc = client_get(client, f"{BASE_URI}/pair_candles?pair=XRP%2FBTC&timeframe={timeframe}"
+                    "&limit=3&since_ms=1511686800000&format=arrow")
+    assert rc.status_code == 200
+    table = pa.ipc.open_stream(rc.content).read_all()
+    assert table.num_rows == 0
+    assert json.loads(table.schema.metadata[b'freqtrade'])['data_stop_ts'] == 0
+
+
 def test_api_pair_history(botclient, ohlcv_history):
     ftbot, client = botclient
     timeframe = '5m'
@@ -1192,6 +1272,16 @@ def test_api_pair_history(botclient, ohlcv_history):
     assert rc.json()['data_stop'] == '2018-01-12 00:00:00+00:00'
     assert rc.json()['data_stop_ts'] == 1515715200000
 
+    # Incremental, selected columns
+    rc = client_get(client,
+                    f"{BASE_URI}/pair_history?pair=UNITTEST%2FBTC&timeframe={timeframe}"
+                    "&timerange=20180111-20180112&strategy=StrategyTestV2"
+                    "&since_ms=1515714900000&columns=rsi")
+    assert_response(rc, 200)
+    assert rc.json()['length'] == 1
+    assert rc.json()['data_start_ts'] == 1515715200000
+    assert rc.json()['columns'] == ['date', 'rsi', 'buy', 'sell', '__date_ts']
+
     # No data found
     rc = client_get(client,
                     f"{BASE_URI}/pair_history?pair=UNITTEST%2FBTC&timeframe={timeframe}"
@@ -1291,6 +1381,48 @@ def test_sysinfo(botclient):
     assert 'ram_pct' in result
 
 
+def test_api_loop_timings(botclient):
+    ftbot, client = botclient
+    ftbot.loop_timings.add('analyze', 0.5)
+    ftbot.loop_timings.add('analyze', 1.5)
+    ftbot.strategy.analyze_timings.add('ETH/BTC', 0.25)
+
+    rc = client_get(client, f"{BASE_URI}/loop_timings")
+    assert_response(rc)
+    assert rc.json() == {
+        'throttle_secs': 5,
+        'window': 100,
+        'stages': {
+            'analyze': {'count': 2, 'sum': 2.0, 'last': 1.5, 'p50': 0.5, 'p95': 1.5, 'max': 1.5},
+        },
+        'pairs': {
+            'ETH/BTC': {'count': 1, 'sum': 0.25, 'last': 0.25, 'p50': 0.25, 'p95': 0.25,
+                        'max': 0.25},
+        },
+    }
+
+
+def test_api_metrics(botclient):
+    ftbot, client = botclient
+    rc = client_get(client, f"{BASE_URI}/metrics")
+    assert_response(rc, 404)
+    assert rc.json()['detail'] == 'Metrics endpoint is not enabled.'
+
+    ftbot.config['api_server']['enable_metrics'] = True
+    ftbot.loop_timings.add('analyze', 0.5)
+    ftbot.strategy.analyze_timings.add('ETH/BTC', 0.25)
+    rc = client_get(client, f"{BASE_URI}/metrics")
+    assert rc.status_code == 200
+    assert rc.headers['content-type'].startswith('text/plain; version=0.0.4')
+    lines = rc.text.splitlines()
+    assert 'freqtrade_loop_throttle_seconds 5' in lines
+    assert '# TYPE freqtrade_loop_stage_seconds summary' in lines
+    assert 'freqtrade_loop_stage_seconds{stage="analyze",quantile="0.95"} 0.5' in lines
+    assert 'freqtrade_loop_stage_seconds_count{stage="analyze"} 1' in lines
+    assert 'freqtrade_analyze_pair_seconds{pair="ETH/BTC",quantile="1"} 0.25' in lines
+    assert 'freqtrade_analyze_pair_seconds_sum{pair="ETH/BTC"} 0.25' in lines
+
+
 def test_api_backtesting(botclient, mocker, fee, caplog):
     ftbot, client = botclient
     mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
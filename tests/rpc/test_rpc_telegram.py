@@ -1486,6 +1486,7 @@ def test_edge_enabled(edge_conf, update, mocker) -> None:
     assert msg_mock.call_count == 1
     assert '<b>Edge only validated following pairs:</b>\n<pre>' in msg_mock.call_args_list[0][0][0]
     assert 'Pair      Winrate    Expectancy    Stoploss' in msg_mock.call_args_list[0][0][0]
+    assert 'Not calculated yet.' in msg_mock.call_args_list[0][0][0]
 
     msg_mock.reset_mock()
 
@@ -1496,6 +1497,12 @@ def test_edge_enabled(edge_conf, update, mocker) -> None:
     assert '<b>Edge only validated following pairs:</b>' in msg_mock.call_args_list[0][0][0]
     assert 'Winrate' not in msg_mock.call_args_list[0][0][0]
 
+    msg_mock.reset_mock()
+    telegram._rpc._freqtrade.edge._last_updated = arrow.utcnow().int_timestamp - 7200
+    telegram._rpc._freqtrade.edge._last_calculation_duration = 12.34
+    telegram._edge(update=update, context=MagicMock())
+    assert 'Calculated 2 hours ago in 12.3s.' in msg_mock.call_args_list[0][0][0]
+
 
 def test_telegram_trades(mocker, update, default_conf, fee):
 
@@ -2,16 +2,18 @@
 import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import arrow
 import pytest
-from pandas import DataFrame
+from joblib import Parallel
+from pandas import DataFrame, concat
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
-from freqtrade.data.history import load_data
-from freqtrade.enums import SellType
+from freqtrade.data.history import load_data, load_pair_history
+from freqtrade.enums import RunMode, SellType
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.optimize.space import SKDecimal
 from freqtrade.persistence import PairLocks, Trade
@@ -278,6 +280,50 @@ def test_advise_all_indicators_copy(mocker, default_conf, testdatadir) -> None:
     assert aimock.call_args_list[0][0][0] is not data
 
 
+def test_advise_all_indicators_parallel(mocker, default_conf, testdatadir, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    default_conf.update({'strategy': 'StrategyTestV2', 'runmode': RunMode.BACKTEST})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    data = load_data(testdatadir, '5m', ['ETH/BTC', 'LTC/BTC', 'XLM/BTC'])
+    expected = strategy.advise_all_indicators(data)
+    assert log_has_re(r"Populated indicators for 3 pairs in .*s \(slowest: .*XLM/BTC .*\)\.",
+                      caplog)
+    assert log_has_re(r"Populated indicators for LTC/BTC in .*s\.", caplog)
+
+    # Run jobs in this process
+    parallel_mock = mocker.patch('joblib.Parallel', side_effect=lambda n_jobs: Parallel(n_jobs=1))
+    strategy.config['indicator_jobs'] = 2
+    processed = strategy.advise_all_indicators(data)
+    assert parallel_mock.call_args_list == [call(n_jobs=2)]
+    assert log_has('Calculating indicators for 3 pairs using 1 parallel jobs.', caplog)
+    assert list(processed) == list(expected)
+    for pair in expected:
+        assert_frame_equal(processed[pair], expected[pair])
+
+    # Trading modes always use a single process
+    parallel_mock.reset_mock()
+    strategy.config['runmode'] = RunMode.DRY_RUN
+    processed = strategy.advise_all_indicators(data)
+    assert parallel_mock.call_count == 0
+    assert len(processed) == 3
+
+
+def test_advise_all_indicators_worker_processes(default_conf, testdatadir) -> None:
+    default_conf.update({'strategy': 'StrategyTestV2', 'runmode': RunMode.BACKTEST,
+                         'datadir': testdatadir})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    # Strategy and dataprovider are sent to the worker processes - as in backtesting
+    strategy.dp = DataProvider(default_conf, None)
+    data = load_data(testdatadir, '5m', ['ETH/BTC', 'LTC/BTC'])
+    expected = strategy.advise_all_indicators(data)
+
+    strategy.config['indicator_jobs'] = 2
+    processed = strategy.advise_all_indicators(data)
+    assert list(processed) == list(expected)
+    for pair in expected:
+        assert_frame_equal(processed[pair], expected[pair])
+
+
 def test_min_roi_reached(default_conf, fee) -> None:
 
     # Use list to confirm sequence does not matter
@@ -574,6 +620,117 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has('Skipping TA Analysis for already analyzed candle', caplog)
 
 
+class IncrementalStrategy(StrategyTestV2):
+    incremental_indicators = True
+
+    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe['sma'] = dataframe['close'].rolling(3).mean()
+        dataframe['rising'] = dataframe['close'] > dataframe['close'].shift(1)
+        return dataframe
+
+    def populate_indicators_incremental(self, dataframe: DataFrame, new_candles: int,
+                                        metadata: dict) -> DataFrame:
+        if new_candles:
+            new_rows = dataframe.index[-new_candles:]
+            sma = dataframe['close'].iloc[-new_candles - 2:].rolling(3).mean()
+            dataframe.loc[new_rows, 'sma'] = sma.iloc[-new_candles:].values
+            close = dataframe['close'].iloc[-new_candles - 1:]
+            dataframe.loc[new_rows, 'rising'] = (close > close.shift(1)).iloc[1:].values
+        return dataframe
+
+    def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[(dataframe['close'] > dataframe['sma']) & dataframe['rising'], 'buy'] = 1
+        return dataframe
+
+    def populate_sell_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[(dataframe['close'] < dataframe['sma']) & ~dataframe['rising'], 'sell'] = 1
+        return dataframe
+
+
+def test__analyze_ticker_internal_incremental(mocker, testdatadir, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    data = load_pair_history('UNITTEST/BTC', '5m', testdatadir).iloc[:300]
+    strategy = IncrementalStrategy({})
+    strategy.dp = DataProvider({}, None, None)
+    full_mock = mocker.spy(strategy, 'populate_indicators')
+    incremental_mock = mocker.spy(strategy, 'populate_indicators_incremental')
+
+    # Nothing analyzed yet
+    strategy._analyze_ticker_internal(data.iloc[:-2].copy(), {'pair': 'ETH/BTC'})
+    assert full_mock.call_count == 1
+    assert incremental_mock.call_count == 0
+
+    # 2 new candles - the oldest candle is no longer part of the data
+    history = data.iloc[1:].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(history.copy(), {'pair': 'ETH/BTC'})
+    assert full_mock.call_count == 1
+    assert incremental_mock.call_count == 1
+    assert incremental_mock.call_args[0][1] == 2
+    assert log_has("Populating indicators for 2 new candles of ETH/BTC.", caplog)
+    expected = strategy.analyze_ticker(history.copy(), {'pair': 'ETH/BTC'})
+    # The full calculation lacks the startup period of the first candles
+    assert_frame_equal(ret.iloc[2:], expected.iloc[2:])
+    assert ret['rising'].dtype == bool
+    assert ret['buy'].sum() > 0
+    assert ret['sell'].sum() > 0
+
+    # Already analyzed candles changed - full recalculation
+    full_mock.reset_mock()
+    history = data.iloc[2:].reset_index(drop=True)
+    history.loc[10, 'close'] += 1
+    strategy._analyze_ticker_internal(history.copy(), {'pair': 'ETH/BTC'})
+    assert full_mock.call_count == 1
+    assert incremental_mock.call_count == 1
+
+
+def test__analyze_ticker_internal_incremental_verify(mocker, testdatadir, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    data = load_pair_history('UNITTEST/BTC', '5m', testdatadir).iloc[:300]
+    strategy = IncrementalStrategy({})
+    strategy.dp = DataProvider({}, None, None)
+    strategy.incremental_indicators_verify = True
+
+    strategy._analyze_ticker_internal(data.iloc[:-1].copy(), {'pair': 'ETH/BTC'})
+    strategy._analyze_ticker_internal(data.copy(), {'pair': 'ETH/BTC'})
+    assert log_has("Incremental indicators of ETH/BTC verified.", caplog)
+
+    # Broken incremental calculation
+    def populate_incremental(dataframe, new_candles, metadata):
+        dataframe.loc[dataframe.index[-new_candles:], 'sma'] = 0
+        return dataframe
+
+    mocker.patch.object(strategy, 'populate_indicators_incremental',
+                        side_effect=populate_incremental)
+    new_candle = data.iloc[-1:].assign(date=data['date'].iloc[-1] + timedelta(minutes=5))
+    history = concat([data.iloc[1:], new_candle], ignore_index=True)
+    ret = strategy._analyze_ticker_internal(history.copy(), {'pair': 'ETH/BTC'})
+    assert log_has("Incremental indicators of ETH/BTC differ from populate_indicators() "
+                   "for the last 1 candles: sma.", caplog)
+    # Results of the full calculation are used
+    assert ret['sma'].iloc[-1] == pytest.approx(history['close'].iloc[-3:].mean())
+
+    # Changed dtype - e.g. a boolean indicator populated with floats
+    def populate_incremental_float(dataframe, new_candles, metadata):
+        dataframe = IncrementalStrategy.populate_indicators_incremental(
+            strategy, dataframe, new_candles, metadata)
+        dataframe['rising'] = dataframe['rising'].astype(float)
+        return dataframe
+
+    mocker.patch.object(strategy, 'populate_indicators_incremental',
+                        side_effect=populate_incremental_float)
+    new_candle = new_candle.assign(date=new_candle['date'] + timedelta(minutes=5))
+    history = concat([history.iloc[1:], new_candle], ignore_index=True)
+    strategy._analyze_ticker_internal(history.copy(), {'pair': 'ETH/BTC'})
+    assert log_has("Incremental indicators of ETH/BTC differ from populate_indicators() "
+                   "for the last 1 candles: rising (dtype float64, expected bool).", caplog)
+
+
+def test_strategy_incremental_indicators_validation(default_conf, mocker) -> None:
+    default_conf.update({'strategy': 'StrategyTestV2', 'incremental_indicators': True})
+    with pytest.raises(ImportError, match=r".*requires populate_indicators_incremental\(\).*"):
+        StrategyResolver.load_strategy(default_conf)
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     default_conf.update({'strategy': 'StrategyTestV2'})
@@ -546,6 +546,28 @@ def test_process_trade_creation(default_conf_usdt, ticker_usdt, limit_buy_order_
         'Buy signal found: about create a new trade for ETH/USDT with stake_amount: 60.0 ...',
         caplog
     )
+    assert set(freqtrade.loop_timings.summary()) == {
+        'reload_markets', 'refresh_whitelist', 'refresh_candles', 'analyze',
+        'check_handle_timedout', 'exit_positions', 'enter_positions', 'commit'}
+    assert set(freqtrade.strategy.analyze_timings.summary()) == set(
+        freqtrade.active_pair_whitelist)
+
+
+def test_process_housekeeping(default_conf_usdt, mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    mocks = {name: mocker.patch.object(freqtrade, name) for name in (
+        'check_handle_timedout', 'exit_positions', 'enter_positions')}
+    refresh_mock = mocker.patch.object(freqtrade.dataprovider, 'refresh')
+    analyze_mock = mocker.patch.object(freqtrade.strategy, 'analyze')
+
+    freqtrade.process_housekeeping()
+    assert mocks['check_handle_timedout'].call_count == 1
+    assert mocks['exit_positions'].call_count == 1
+    assert mocks['enter_positions'].call_count == 0
+    assert refresh_mock.call_count == 0
+    assert analyze_mock.call_count == 0
 
 
 def test_process_exchange_failures(default_conf_usdt, ticker_usdt, mocker) -> None:
@@ -1623,6 +1645,36 @@ def test_exit_positions_exception(mocker, default_conf_usdt, limit_buy_order_usd
     assert log_has('Unable to sell trade ETH/USDT: ', caplog)
 
 
+def test_exit_positions_prefetched_rates(mocker, default_conf_usdt) -> None:
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    rates = {'ETH/USDT': 2.0, 'XRP/USDT': 3.0}
+    handled = {}
+
+    def handle_trade(trade):
+        handled[trade.pair] = freqtrade.exchange.get_rate(trade.pair, refresh=True, side='sell')
+        return False
+
+    mocker.patch('freqtrade.freqtradebot.FreqtradeBot.handle_trade', side_effect=handle_trade)
+    prefetch_mock = mocker.patch('freqtrade.exchange.Exchange._prefetch_rate_data',
+                                 return_value={pair: {'bid': rate, 'ask': rate, 'last': rate}
+                                               for pair, rate in rates.items()})
+    fetch_ticker_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_ticker')
+    trades = []
+    for pair, open_order_id in [('ETH/USDT', None), ('XRP/USDT', None), ('NEO/USDT', '123')]:
+        trade = MagicMock()
+        trade.pair = pair
+        trade.open_order_id = open_order_id
+        trade.is_open = True
+        trades.append(trade)
+
+    assert freqtrade.exit_positions(trades) == 0
+    assert handled == rates
+    # Rates of all trades without open order are fetched in one go
+    assert prefetch_mock.call_count == 1
+    assert prefetch_mock.call_args[0] == (['ETH/USDT', 'XRP/USDT'], 'sell', True)
+    assert fetch_ticker_mock.call_count == 0
+
+
 def test_update_trade_state(mocker, default_conf_usdt, limit_buy_order_usdt, caplog) -> None:
     freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
 
@@ -2068,6 +2120,54 @@ def test_check_handle_timedout_buy(default_conf_usdt, ticker_usdt, limit_buy_ord
     assert freqtrade.strategy.check_buy_timeout.call_count == 0
 
 
+def test_check_handle_timedout_fetch_concurrent(default_conf_usdt, ticker_usdt,
+                                                limit_buy_order_old, open_trade, fee,
+                                                mocker, caplog) -> None:
+    patch_RPCManager(mocker)
+    limit_buy_cancel = deepcopy(limit_buy_order_old)
+    limit_buy_cancel['status'] = 'canceled'
+    cancel_order_mock = MagicMock(return_value=limit_buy_cancel)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        fetch_ticker=ticker_usdt,
+        cancel_order_with_result=cancel_order_mock,
+        get_fee=fee
+    )
+    freqtrade = FreqtradeBot(default_conf_usdt)
+
+    trades = [open_trade]
+    for pair, order_id in (('LTC/BTC', 'replaced'), ('XRP/BTC', 'failing')):
+        trades.append(Trade(pair=pair, open_rate=open_trade.open_rate, exchange='binance',
+                            open_order_id=order_id, amount=open_trade.amount, fee_open=0.0,
+                            fee_close=0.0, stake_amount=1, open_date=open_trade.open_date,
+                            is_open=True))
+    for trade in trades:
+        Trade.query.session.add(trade)
+
+    def fetch_orders(orders):
+        # Order of the 2nd trade is replaced (e.g. forcesell) while fetching
+        trades[1].open_order_id = 'new_order'
+        return [limit_buy_order_old, deepcopy(limit_buy_order_old),
+                TemporaryError("Could not get order")]
+
+    fetch_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_orders_or_stoploss_orders',
+                              side_effect=fetch_orders)
+    update_mock = mocker.spy(freqtrade, 'update_trade_state')
+
+    freqtrade.check_handle_timedout()
+    assert fetch_mock.call_count == 1
+    assert fetch_mock.call_args[0][0] == [('123456789', 'ETH/BTC', False),
+                                          ('replaced', 'LTC/BTC', False),
+                                          ('failing', 'XRP/BTC', False)]
+    # Only the first trade is updated (and cancelled)
+    assert {c[0][1] for c in update_mock.call_args_list} == {'123456789'}
+    assert cancel_order_mock.call_count == 1
+    assert trades[1].open_order_id == 'new_order'
+    assert log_has_re(r"Cannot query order for Trade\(id=3, pair=XRP/BTC.*TemporaryError.*",
+                      caplog)
+
+
 def test_check_handle_cancelled_buy(default_conf_usdt, ticker_usdt, limit_buy_order_old, open_trade,
                                     fee, mocker, caplog) -> None:
     """ Handle Buy order cancelled on exchange"""
@@ -3924,6 +4024,9 @@ def test_startup_trade_reinit(default_conf_usdt, edge_conf, mocker):
     ftbot = get_patched_freqtradebot(mocker, edge_conf)
     ftbot.startup()
     assert reinit_mock.call_count == 0
+    # Edge recalculates in the background
+    assert ftbot.edge._calculation_thread.is_alive()
+    ftbot.edge.stop_background_calculation()
 
 
 @pytest.mark.usefixtures("init_persistence")
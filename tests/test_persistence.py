@@ -1158,6 +1158,56 @@ def test_get_trades_proxy(fee, use_db):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_closed_index(fee):
+    LocalTrade.reset_trades()
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+    def closed_trade(pair, minutes):
+        trade = LocalTrade(pair=pair, stake_amount=0.001, amount=1, open_rate=1,
+                           fee_open=fee.return_value, fee_close=fee.return_value,
+                           exchange='binance', open_date=start, is_open=True)
+        LocalTrade.add_bt_trade(trade)
+        trade.close_date = start + timedelta(minutes=minutes)
+        trade.close(1.1, show_msg=False)
+        LocalTrade.close_bt_trade(trade)
+        return trade
+
+    # Closed in order, except for the last trade
+    trades = [closed_trade('ETH/BTC' if i % 2 else 'XRP/BTC', i * 5) for i in range(1, 9)]
+    trade_early = closed_trade('ETH/BTC', 1)
+    # Trade without close date
+    trade_nodate = LocalTrade(pair='ETH/BTC', stake_amount=0.001, amount=1, open_rate=1,
+                              exchange='binance', open_date=start, is_open=False)
+    LocalTrade.add_bt_trade(trade_nodate)
+    open_trade = LocalTrade(pair='ETH/BTC', stake_amount=0.001, amount=1, open_rate=1,
+                            exchange='binance', open_date=start, is_open=True)
+    LocalTrade.add_bt_trade(open_trade)
+
+    assert len(LocalTrade.get_trades_proxy(is_open=False)) == 10
+    assert LocalTrade.get_trades_proxy(is_open=True) == [open_trade]
+    assert len(LocalTrade.get_trades_proxy()) == 11
+
+    res = LocalTrade.get_trades_proxy(is_open=False, close_date=start + timedelta(minutes=20))
+    assert res == trades[4:]
+    res = LocalTrade.get_trades_proxy(pair='ETH/BTC', is_open=False,
+                                      close_date=start + timedelta(minutes=20))
+    assert res == [trades[4], trades[6]]
+    res = LocalTrade.get_trades_proxy(pair='ETH/BTC', is_open=False, close_date=start)
+    assert res == [trade_early] + trades[0::2]
+    res = LocalTrade.get_trades_proxy(pair='ETH/BTC', is_open=False)
+    assert res == [trade_nodate, trade_early] + trades[0::2]
+    assert LocalTrade.get_trades_proxy(pair='LTC/BTC', is_open=False) == []
+    assert LocalTrade.get_trades_proxy(
+        is_open=False, close_date=start + timedelta(minutes=40)) == []
+
+    # Results must not be linked to the index
+    res.clear()
+    assert len(LocalTrade.get_trades_proxy(pair='ETH/BTC', is_open=False)) == 6
+
+    LocalTrade.reset_trades()
+    assert LocalTrade.get_trades_proxy(is_open=False, close_date=start) == []
+
+
 def test_get_trades_backtest():
     Trade.use_db = False
     with pytest.raises(NotImplementedError, match=r"`Trade.get_trades\(\)` not .*"):
@@ -1190,6 +1240,93 @@ def test_get_best_pair(fee):
     assert res[1] == 0.01
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_get_daily_profit(fee):
+    today = datetime.utcnow().date()
+    assert Trade.get_daily_profit(today - timedelta(days=7)) == {}
+
+    create_mock_trades(fee)
+    closed_trades = Trade.get_trades([Trade.is_open.is_(False)]).all()
+    res = Trade.get_daily_profit(today - timedelta(days=7))
+    assert sum(count for _, count in res.values()) == len(closed_trades)
+    for day, (profit, count) in res.items():
+        day_trades = [t for t in closed_trades if t.close_date.date() == day]
+        assert count == len(day_trades)
+        assert isclose(profit, sum(t.close_profit_abs for t in day_trades))
+
+    assert Trade.get_daily_profit(today + timedelta(days=1)) == {}
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_closed_trades_stats(fee):
+    res = Trade.get_closed_trades_stats(datetime.fromtimestamp(0))
+    assert res['trade_count'] == 0
+    assert res['profit_sum_abs'] == 0.0
+    assert res['first_trade'] is None
+
+    create_mock_trades(fee)
+    closed_trades = Trade.get_trades([Trade.is_open.is_(False)]).order_by(Trade.id).all()
+    res = Trade.get_closed_trades_stats(datetime.fromtimestamp(0))
+    assert res['trade_count'] == len(closed_trades) == 2
+    assert res['profit_count'] == 2
+    assert isclose(res['profit_sum_abs'], sum(t.close_profit_abs for t in closed_trades))
+    assert isclose(res['calc_profit_sum'], sum(t.calc_profit() for t in closed_trades),
+                   abs_tol=1e-8)
+    assert isclose(res['profit_sum'], sum(t.close_profit for t in closed_trades))
+    assert res['winning_trades'] == 2
+    assert res['losing_trades'] == 0
+    assert isclose(res['duration_sum'], sum((t.close_date - t.open_date).total_seconds()
+                                            for t in closed_trades))
+    assert res['first_trade'] == (closed_trades[0].id, closed_trades[0].open_date)
+    assert res['latest_trade'] == (closed_trades[-1].id, closed_trades[-1].open_date)
+
+    res = Trade.get_closed_trades_stats(datetime.utcnow())
+    assert res['trade_count'] == 0
+    assert res['latest_trade'] is None
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_closed_trades_stats_rounding(fee):
+    # calc_profit() rounds each trade to 8 decimals - the database sums unrounded profits.
+    # The accepted difference is half a unit of the 8th decimal per trade.
+    close_date = datetime.now(tz=timezone.utc)
+    for i in range(100):
+        Trade.query.session.add(Trade(
+            pair='ETH/BTC', stake_amount=0.001, amount=1 / 3 + i, open_rate=0.0123456789,
+            close_rate=0.0123456789 * (1 + i / 1000), fee_open=fee.return_value,
+            fee_close=fee.return_value, exchange='binance', is_open=False,
+            open_date=close_date - timedelta(hours=1), close_date=close_date,
+            close_profit=0.01, close_profit_abs=0.0001,
+        ))
+    Trade.commit()
+    closed_trades = Trade.get_trades([Trade.is_open.is_(False)]).all()
+    res = Trade.get_closed_trades_stats(datetime.fromtimestamp(0))
+    assert res['profit_count'] == len(closed_trades) == 100
+    assert abs(res['calc_profit_sum'] - sum(t.calc_profit() for t in closed_trades)) <= 100 * 5e-9
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_closed_trades_version(fee):
+    version = Trade.closed_trades_version
+    create_mock_trades(fee)
+    assert Trade.closed_trades_version > version
+
+    # Updates to open trades don't invalidate
+    version = Trade.closed_trades_version
+    trade = Trade.get_trades([Trade.is_open.is_(True)]).first()
+    trade.adjust_min_max_rates(trade.open_rate * 2, trade.open_rate)
+    Trade.commit()
+    assert Trade.closed_trades_version == version
+
+    trade.close(trade.open_rate * 2)
+    Trade.commit()
+    assert Trade.closed_trades_version > version
+
+    version = Trade.closed_trades_version
+    trade.delete()
+    assert Trade.closed_trades_version > version
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_get_exit_order_count(fee):
 
@@ -1328,6 +1465,9 @@ def test_Trade_object_idem():
         'get_sell_reason_performance',
         'get_buy_tag_performance',
         'get_mix_tag_performance',
+        'get_daily_profit',
+        'get_closed_trades_stats',
+        'closed_trades_version',
 
     )
 
@@ -1340,6 +1480,7 @@ def test_Trade_object_idem():
     # Fails if only a column is added without corresponding parent field
     for item in localtrade:
         if (not item.startswith('__')
-                and item not in ('trades', 'trades_open', 'total_profit')
+                and item not in ('trades', 'trades_open', 'trades_closed_index', 'total_profit',
+                                 'total_open_stake')
                 and type(getattr(LocalTrade, item)) not in (property, FunctionType)):
             assert item in trade
@@ -0,0 +1,45 @@
+import pytest
+
+from freqtrade.timings import Timings
+
+
+def test_timings_summary() -> None:
+    timings = Timings(window=10)
+    assert timings.summary() == {}
+
+    for duration in range(1, 21):
+        timings.add('analyze', duration)
+    timings.add('commit', 0.5)
+
+    summary = timings.summary()
+    assert summary['analyze'] == {
+        'count': 20, 'sum': 210, 'last': 20, 'p50': 15, 'p95': 20, 'max': 20,
+    }
+    assert summary['commit'] == {
+        'count': 1, 'sum': 0.5, 'last': 0.5, 'p50': 0.5, 'p95': 0.5, 'max': 0.5,
+    }
+
+
+def test_timings_measure(mocker) -> None:
+    mocker.patch('freqtrade.timings.time.perf_counter', side_effect=[1.0, 1.5, 2.0, 4.0])
+    timings = Timings()
+    with timings.measure('analyze'):
+        pass
+    # Failing stages are measured as well
+    with pytest.raises(ValueError):
+        with timings.measure('analyze'):
+            raise ValueError()
+
+    summary = timings.summary()['analyze']
+    assert summary['count'] == 2
+    assert summary['sum'] == 2.5
+    assert summary['last'] == 2.0
+    assert summary['max'] == 2.0
+
+
+def test_timings_retain() -> None:
+    timings = Timings()
+    for pair in ('ETH/BTC', 'LTC/BTC', 'XRP/BTC'):
+        timings.add(pair, 0.1)
+    timings.retain(['ETH/BTC', 'XRP/BTC', 'NEO/BTC'])
+    assert list(timings.summary()) == ['ETH/BTC', 'XRP/BTC']
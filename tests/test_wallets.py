@@ -1,12 +1,15 @@
 # pragma pylint: disable=missing-docstring
 from copy import deepcopy
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
 from freqtrade.exceptions import DependencyException
-from tests.conftest import get_patched_freqtradebot, patch_wallet
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.wallets import Wallets
+from tests.conftest import get_patched_exchange, get_patched_freqtradebot, patch_wallet
 
 
 def test_sync_wallet_at_boot(mocker, default_conf):
@@ -225,3 +228,58 @@ def test_get_starting_balance(mocker, default_conf, available_capital, closed_pr
     freqtrade = get_patched_freqtradebot(mocker, default_conf)
 
     assert freqtrade.wallets.get_starting_balance() == expected
+
+
+def test_backtest_wallet_ledger(mocker, default_conf, fee) -> None:
+    default_conf['dry_run_wallet'] = 1
+    exchange = get_patched_exchange(mocker, default_conf)
+    Trade.use_db = False
+    LocalTrade.reset_trades()
+    wallets = Wallets(default_conf, exchange, log=False)
+    assert wallets.get_free('BTC') == 1
+    assert wallets.check_backtest_ledger()
+
+    trades = [LocalTrade(
+        pair=pair,
+        stake_amount=0.1,
+        amount=round(0.1 / rate, 8),
+        open_rate=rate,
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        is_open=True,
+        open_date=datetime(2021, 1, 1, tzinfo=timezone.utc),
+        exchange='binance',
+    ) for pair, rate in [('ETH/BTC', 0.05), ('LTC/BTC', 0.004), ('XRP/BTC', 0.00002)]]
+    for trade in trades:
+        LocalTrade.add_bt_trade(trade)
+
+    wallets.update()
+    assert LocalTrade.total_open_stake == pytest.approx(0.3)
+    assert wallets.get_free('BTC') == pytest.approx(0.7)
+    # Balances of trade currencies are only calculated when required
+    assert 'ETH' not in wallets._wallets
+    assert wallets.get_free('ETH') == 2
+    assert wallets.get_total('LTC') == 25
+    assert wallets.check_backtest_ledger()
+
+    trades[0].close(0.055, show_msg=False)
+    LocalTrade.close_bt_trade(trades[0])
+    wallets.update()
+    assert LocalTrade.total_open_stake == pytest.approx(0.2)
+    assert wallets.get_free('BTC') == pytest.approx(0.8 + trades[0].close_profit_abs)
+    assert 'ETH' not in wallets.get_all_balances()
+    assert wallets.check_backtest_ledger()
+
+    for trade in trades[1:]:
+        trade.close(trade.open_rate, show_msg=False)
+        LocalTrade.close_bt_trade(trade)
+    assert LocalTrade.total_open_stake == 0
+    wallets.update()
+    assert wallets.get_all_balances().keys() == {'BTC'}
+    assert wallets.check_backtest_ledger()
+
+    # Ledger out of sync
+    LocalTrade.total_open_stake += 0.1
+    assert not wallets.check_backtest_ledger()
+    LocalTrade.reset_trades()
+    Trade.use_db = True
@@ -1,9 +1,13 @@
 import logging
 import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, PropertyMock
 
+import time_machine
+
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import State
+from freqtrade.exceptions import TemporaryError
 from freqtrade.worker import Worker
 from tests.conftest import get_patched_worker, log_has, log_has_re
 
@@ -47,6 +51,20 @@ def test_worker_stopped(mocker, default_conf, caplog) -> None:
     assert mock_throttle.call_count == 1
 
 
+def test_process_running_timings(mocker, default_conf) -> None:
+    worker = get_patched_worker(mocker, default_conf)
+    mocker.patch.object(worker.freqtrade, 'process')
+    mocker.patch('freqtrade.worker.time.sleep')
+
+    worker._process_running()
+    assert worker.freqtrade.loop_timings.summary()['process']['count'] == 1
+
+    # Failing iterations are measured as well
+    worker.freqtrade.process.side_effect = TemporaryError("Something went wrong")
+    worker._process_running()
+    assert worker.freqtrade.loop_timings.summary()['process']['count'] == 2
+
+
 def test_throttle(mocker, default_conf, caplog) -> None:
     def throttled_func():
         return 42
@@ -66,6 +84,120 @@ def test_throttle(mocker, default_conf, caplog) -> None:
     assert result == 42
 
 
+def test_throttle_candle_sync(mocker, default_conf) -> None:
+    def throttled_func():
+        return 42
+
+    sleep_mock = mocker.patch('freqtrade.worker.time.sleep')
+    worker = get_patched_worker(mocker, default_conf)
+
+    with time_machine.travel("2022-01-01 10:04:58 +00:00", tick=False) as t:
+        assert worker._throttle(throttled_func, throttle_secs=10, timeframe='5m',
+                                timeframe_offset=1) == 42
+        # Wake up 1s after the next candle started
+        assert sleep_mock.call_args[0][0] == 3
+
+        # Next candle not yet due
+        t.move_to("2022-01-01 10:05:00.5 +00:00")
+        worker._throttle(throttled_func, throttle_secs=10, timeframe='5m', timeframe_offset=1)
+        assert sleep_mock.call_args[0][0] == 0.5
+
+        t.move_to("2022-01-01 10:05:01 +00:00")
+        worker._throttle(throttled_func, throttle_secs=10, timeframe='5m', timeframe_offset=1)
+        assert sleep_mock.call_args[0][0] == 10
+
+        # Without timeframe, throttle_secs is used
+        t.move_to("2022-01-01 10:09:58 +00:00")
+        worker._throttle(throttled_func, throttle_secs=10)
+        assert sleep_mock.call_args[0][0] == 10
+
+
+def test_process_running_candle_sync(mocker, default_conf) -> None:
+    default_conf['internals'] = {'candle_sync': True, 'candle_sync_offset_secs': 2}
+    worker = get_patched_worker(mocker, default_conf)
+
+    def process():
+        # Data of the candle which closed last
+        last_closed = worker._current_candle() - timedelta(minutes=5)
+        for pair in worker.freqtrade.active_pair_whitelist:
+            worker.freqtrade.strategy._last_candle_seen_per_pair[pair] = last_closed
+
+    process_mock = mocker.patch.object(worker.freqtrade, 'process', side_effect=process)
+    housekeeping_mock = mocker.patch.object(worker.freqtrade, 'process_housekeeping')
+    mocker.patch('freqtrade.worker.time.sleep')
+
+    with time_machine.travel("2022-01-01 10:04:30 +00:00", tick=False) as t:
+        # First iteration is always a full one
+        worker._process_running()
+        assert process_mock.call_count == 1
+        worker._process_running()
+        assert process_mock.call_count == 1
+        assert housekeeping_mock.call_count == 1
+
+        # Offset not yet passed
+        t.move_to("2022-01-01 10:05:01 +00:00")
+        worker._process_running()
+        assert process_mock.call_count == 1
+        assert housekeeping_mock.call_count == 2
+
+        # Failing iterations are repeated
+        t.move_to("2022-01-01 10:05:02 +00:00")
+        process_mock.side_effect = TemporaryError("Something went wrong")
+        worker._process_running()
+        assert process_mock.call_count == 2
+        process_mock.side_effect = process
+        worker._process_running()
+        assert process_mock.call_count == 3
+        worker._process_running()
+        assert process_mock.call_count == 3
+        assert housekeeping_mock.call_count == 3
+
+    timings = worker.freqtrade.loop_timings.summary()
+    assert timings['process']['count'] == 3
+    assert timings['housekeeping']['count'] == 3
+
+
+def test_process_running_candle_sync_late_candle(mocker, default_conf, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    default_conf['internals'] = {'candle_sync': True, 'candle_sync_offset_secs': 1}
+    worker = get_patched_worker(mocker, default_conf)
+    strategy = worker.freqtrade.strategy
+    process_mock = mocker.patch.object(worker.freqtrade, 'process')
+    housekeeping_mock = mocker.patch.object(worker.freqtrade, 'process_housekeeping')
+    mocker.patch('freqtrade.worker.time.sleep')
+    pairs = worker.freqtrade.active_pair_whitelist
+    assert len(pairs) > 1
+    # All pairs analyzed up to the 10:00 candle
+    for pair in pairs:
+        strategy._last_candle_seen_per_pair[pair] = datetime(2022, 1, 1, 10, 0,
+                                                             tzinfo=timezone.utc)
+
+    with time_machine.travel("2022-01-01 10:10:01 +00:00", tick=False) as t:
+        # The exchange didn't publish the 10:05 candle yet
+        worker._process_running()
+        assert process_mock.call_count == 1
+        assert log_has_re(r"Candle 2022-01-01 10:05:00\+00:00 of .* not analyzed yet.*", caplog)
+
+        # Candle published for some pairs only - full iterations are repeated
+        t.move_to("2022-01-01 10:10:06 +00:00")
+        strategy._last_candle_seen_per_pair[pairs[0]] = datetime(2022, 1, 1, 10, 5,
+                                                                 tzinfo=timezone.utc)
+        worker._process_running()
+        assert process_mock.call_count == 2
+        assert housekeeping_mock.call_count == 0
+
+        for pair in pairs:
+            strategy._last_candle_seen_per_pair[pair] = datetime(2022, 1, 1, 10, 5,
+                                                                 tzinfo=timezone.utc)
+        t.move_to("2022-01-01 10:10:11 +00:00")
+        worker._process_running()
+        assert process_mock.call_count == 3
+        # Candle processed - housekeeping until the next candle
+        worker._process_running()
+        assert process_mock.call_count == 3
+        assert housekeeping_mock.call_count == 1
+
+
 def test_throttle_with_assets(mocker, default_conf) -> None:
     def throttled_func(nb_assets=-1):
         return nb_assets
@@ -78,6 +210,10 @@ def test_throttle_with_assets(mocker, default_conf) -> None:
     result = worker._throttle(throttled_func, throttle_secs=0.1)
     assert result == -1
 
+    # Positional arguments are passed on to the throttled function
+    result = worker._throttle(throttled_func, 0.1, 42)
+    assert result == 42
+
 
 def test_worker_heartbeat_running(default_conf, mocker, caplog):
     message = r"Bot heartbeat\. PID=.*state='RUNNING'"
@@ -123,3 +259,31 @@ def test_worker_heartbeat_stopped(default_conf, mocker, caplog):
     worker._heartbeat_msg -= 70
     worker._worker(old_state=State.STOPPED)
     assert log_has_re(message, caplog)
+
+
+def test_process_running_candle_sync_retries(mocker, default_conf, caplog) -> None:
+    default_conf['internals'] = {'candle_sync': True, 'candle_sync_offset_secs': 1,
+                                 'candle_sync_retries': 2}
+    worker = get_patched_worker(mocker, default_conf)
+    process_mock = mocker.patch.object(worker.freqtrade, 'process')
+    housekeeping_mock = mocker.patch.object(worker.freqtrade, 'process_housekeeping')
+    mocker.patch('freqtrade.worker.time.sleep')
+    # The closed candle never arrives (e.g. halted market)
+    for pair in worker.freqtrade.active_pair_whitelist:
+        worker.freqtrade.strategy._last_candle_seen_per_pair[pair] = datetime(
+            2022, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+    with time_machine.travel("2022-01-01 10:10:01 +00:00", tick=False) as t:
+        for _ in range(3):
+            worker._process_running()
+        assert process_mock.call_count == 3
+        assert log_has("Closed candle still missing for some pairs after 2 retries, "
+                       "continuing with the next candle.", caplog)
+        worker._process_running()
+        assert process_mock.call_count == 3
+        assert housekeeping_mock.call_count == 1
+
+        # Next candle starts with a full iteration again
+        t.move_to("2022-01-01 10:15:01 +00:00")
+        worker._process_running()
+        assert process_mock.call_count == 4